@@ -0,0 +1,60 @@
+"""create wallet ledger tables
+
+Revision ID: 0b6e4d93a7c1
+Revises: f58c2ad41b07
+Create Date: 2026-10-17 16:40:52.118930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b6e4d93a7c1'
+down_revision: Union[str, Sequence[str], None] = 'f58c2ad41b07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('wallet_ledger_entries',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('amount', sa.Numeric(precision=18, scale=2), nullable=False),
+    sa.Column('transaction_id', sa.UUID(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_wallet_ledger_entries'))
+    )
+    op.create_index('ix_wallet_ledger_entries_user_id_id', 'wallet_ledger_entries', ['user_id', 'id'], unique=False)
+    op.create_table('wallet_balance_snapshots',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('balance', sa.Numeric(precision=18, scale=2), nullable=False),
+    sa.Column('last_entry_id', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('user_id', name=op.f('pk_wallet_balance_snapshots'))
+    )
+
+    # Opening snapshot: the ledger starts from the current column balances
+    op.execute(
+        "INSERT INTO wallet_balance_snapshots (user_id, balance, last_entry_id) "
+        "SELECT user_id, balance, 0 FROM wallets"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Fold the ledger back into the column before dropping it
+    op.execute(
+        "UPDATE wallets w SET balance = COALESCE(s.balance, 0) + COALESCE(("
+        "SELECT SUM(e.amount) FROM wallet_ledger_entries e "
+        "WHERE e.user_id = w.user_id AND e.id > COALESCE(s.last_entry_id, 0)"
+        "), 0) "
+        "FROM wallets w2 LEFT JOIN wallet_balance_snapshots s "
+        "ON s.user_id = w2.user_id WHERE w2.id = w.id"
+    )
+    op.drop_table('wallet_balance_snapshots')
+    op.drop_index('ix_wallet_ledger_entries_user_id_id', table_name='wallet_ledger_entries')
+    op.drop_table('wallet_ledger_entries')
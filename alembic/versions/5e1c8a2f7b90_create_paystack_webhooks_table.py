@@ -0,0 +1,38 @@
+"""create paystack_webhooks table
+
+Revision ID: 5e1c8a2f7b90
+Revises: 0b6e4d93a7c1
+Create Date: 2026-10-17 22:31:07.240518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e1c8a2f7b90'
+down_revision: Union[str, Sequence[str], None] = '0b6e4d93a7c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('paystack_webhooks',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('body', sa.LargeBinary(), nullable=False),
+    sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('available_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_paystack_webhooks'))
+    )
+    op.create_index('ix_paystack_webhooks_available_at', 'paystack_webhooks', ['available_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_paystack_webhooks_available_at', table_name='paystack_webhooks')
+    op.drop_table('paystack_webhooks')
@@ -0,0 +1,95 @@
+"""add transaction query indexes
+
+Revision ID: d7a3f19c5e44
+Revises: c41e8b7a9d02
+Create Date: 2026-10-17 10:48:05.913274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a3f19c5e44'
+down_revision: Union[str, Sequence[str], None] = 'c41e8b7a9d02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps writes flowing while the indexes build, but it cannot
+    # run inside the migration transaction
+    with op.get_context().autocommit_block():
+        # Settlement worker: status = 'scheduled' AND delayed_settlement_until <= now
+        op.create_index(
+            'ix_transactions_scheduled_settlement',
+            'transactions',
+            ['delayed_settlement_until'],
+            unique=False,
+            postgresql_where=sa.text("settlement_status = 'scheduled'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # User history: user_id = ? ORDER BY occurred_on DESC
+        op.create_index(
+            'ix_transactions_user_id_occurred_on',
+            'transactions',
+            ['user_id', sa.text('occurred_on DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Ticket history filtered by event / occurrence stored in metadata
+        op.create_index(
+            'ix_transactions_metadata_event',
+            'transactions',
+            [
+                'user_id',
+                sa.text("((metadata -> 'event') ->> 'id')"),
+                sa.text("((metadata -> 'event') ->> 'occurrence')"),
+            ],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Child lookups and the self-referencing foreign key check
+        op.create_index(
+            op.f('ix_transactions_parent_id'),
+            'transactions',
+            ['parent_id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f('ix_transactions_parent_id'),
+            table_name='transactions',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_transactions_metadata_event',
+            table_name='transactions',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_transactions_user_id_occurred_on',
+            table_name='transactions',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_transactions_scheduled_settlement',
+            table_name='transactions',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
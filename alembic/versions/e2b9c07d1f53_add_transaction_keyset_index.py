@@ -0,0 +1,43 @@
+"""add transaction keyset index
+
+Revision ID: e2b9c07d1f53
+Revises: d7a3f19c5e44
+Create Date: 2026-10-17 14:21:37.604418
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b9c07d1f53'
+down_revision: Union[str, Sequence[str], None] = 'd7a3f19c5e44'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        # Admin listing: ORDER BY occurred_on DESC, id DESC with a keyset cursor
+        op.create_index(
+            'ix_transactions_occurred_on_id',
+            'transactions',
+            [sa.text('occurred_on DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_transactions_occurred_on_id',
+            table_name='transactions',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,66 @@
+"""add wallet constraints
+
+Revision ID: f58c2ad41b07
+Revises: e2b9c07d1f53
+Create Date: 2026-10-17 15:02:11.387502
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f58c2ad41b07'
+down_revision: Union[str, Sequence[str], None] = 'e2b9c07d1f53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # One wallet per user: lets credits upsert with ON CONFLICT (user_id).
+    # Fails if duplicate wallets already exist; merge those first.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_wallets_user_id',
+            'wallets',
+            ['user_id'],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+    op.create_check_constraint(
+        op.f('ck_wallets_balance_non_negative'),
+        'wallets',
+        'balance >= 0',
+    )
+    op.create_check_constraint(
+        op.f('ck_wallets_pending_balance_non_negative'),
+        'wallets',
+        'pending_balance >= 0',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(
+        op.f('ck_wallets_pending_balance_non_negative'),
+        'wallets',
+        type_='check',
+    )
+    op.drop_constraint(
+        op.f('ck_wallets_balance_non_negative'),
+        'wallets',
+        type_='check',
+    )
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'uq_wallets_user_id',
+            table_name='wallets',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -1,7 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import Optional, TypeVar, Generic, List
 from datetime import datetime
-from app.shared.enums import SortOrder
+from app.shared.enums import SortOrder, CountMode
 
 
 T = TypeVar("T")
@@ -66,3 +66,48 @@ class PaginatedReqDto(BaseModel):
     @property
     def limit(self) -> int:
         return self.page_size
+
+
+class CursorPaginatedResponseDto(BaseModel, Generic[T]):
+    items: List[T] = Field(..., description="List of items for the current page")
+    page_size: int = Field(..., description="Number of items per page")
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor of the next page, null on the last page",
+    )
+    total: Optional[int] = Field(
+        default=None,
+        description="Total number of items, exact or estimated as requested",
+    )
+
+    @classmethod
+    def create(
+        cls,
+        items: List[T],
+        page_size: int,
+        next_cursor: Optional[str] = None,
+        total: Optional[int] = None,
+    ) -> "CursorPaginatedResponseDto[T]":
+        return cls(
+            items=items,
+            page_size=page_size,
+            next_cursor=next_cursor,
+            total=total,
+        )
+
+
+class CursorPaginatedReqDto(BaseModel):
+    cursor: Optional[str] = Field(
+        default=None,
+        description="next_cursor of the previous page, omitted for the first page",
+    )
+    page_size: int = Field(
+        default=20,
+        ge=1,
+        le=100,
+        description="Number of items per page",
+    )
+    count: CountMode = Field(
+        default=CountMode.none,
+        description="Whether to return an exact or estimated total, or none",
+    )
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from uuid import UUID
 from decimal import Decimal
 
@@ -33,3 +33,28 @@ class ChargeDto(BaseModel):
 class GetChargeResDto(BaseModel):
     charges: list[ChargeDto]
     signature: str
+
+
+class TicketChargeItemDto(BaseModel):
+    ticket_type_id: UUID
+    quantity: int
+    pay_more_amount: Decimal | None = None
+    extras: list[ExtraOrderIntent] | None = None
+
+
+class GetBulkChargeReqDto(BaseModel):
+    event_id: str
+    occurrence_id: str
+    items: list[TicketChargeItemDto] = Field(min_length=1, max_length=50)
+
+
+class PublicGetBulkChargeReqDto(GetBulkChargeReqDto):
+    user_id: UUID
+
+
+class TicketChargeQuoteDto(GetChargeResDto):
+    ticket_type_id: UUID
+
+
+class GetBulkChargeResDto(BaseModel):
+    quotes: list[TicketChargeQuoteDto]
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, EmailStr
 from decimal import Decimal
+from typing import Literal
 
 from .charge_request import GetChargeResDto
 
@@ -100,3 +101,8 @@ class VerifyTicketPurchaseResDto(BaseModel):
 
 class VerifyTicketPurchaseGateResDto(VerifyTicketPurchaseResDto):
     qr: str
+
+
+class PaymentStatusResDto(BaseModel):
+    reference: str
+    status: Literal["pending", "paid", "settled"]
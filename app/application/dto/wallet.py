@@ -10,7 +10,12 @@ from app.domain.entities.value_objects import (
     TransactionSettlementStatus,
     BankDetails,
 )
-from .base import PaginatedReqDto, PaginatedResponseDto
+from .base import (
+    PaginatedReqDto,
+    PaginatedResponseDto,
+    CursorPaginatedReqDto,
+    CursorPaginatedResponseDto,
+)
 
 
 class UpdateTransactionPinRequestDto(BaseModel):
@@ -51,6 +56,34 @@ class ListUserTransactionResponseDto(PaginatedResponseDto[TransactionDto]):
     pass
 
 
+class ListTransactionCursorReqDto(CursorPaginatedReqDto):
+    filter: Optional[TransactionFilter] = None
+
+
+class ListUserTransactionCursorReqDto(ListTransactionCursorReqDto):
+    user_id: UUID
+    ticket_ids: list[UUID]
+    event: UUID | None
+    occurrence: UUID | None
+
+
+class ListUserTransactionCursorResponseDto(
+    CursorPaginatedResponseDto[TransactionDto]
+):
+    pass
+
+
+class LedgerEntryDto(BaseModel):
+    id: int
+    amount: Decimal
+    date: datetime
+    transaction_id: Optional[UUID]
+
+
+class WalletStatementResponseDto(CursorPaginatedResponseDto[LedgerEntryDto]):
+    pass
+
+
 class SaveBankReqDto(PersonalAccountWithSignature):
     pin: str
 
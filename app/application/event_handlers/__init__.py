@@ -1,3 +1,4 @@
 from .transaction_event_handler import TransactionEventHandler
+from .payment_status_event_handler import PaymentStatusEventHandler
 
-__all__ = ["TransactionEventHandler"]
+__all__ = ["TransactionEventHandler", "PaymentStatusEventHandler"]
@@ -13,7 +13,11 @@ from app.infrastructure.ports import GrpcTicketService, GrpcUserService
 from app.domain.ports import IEventBus, IPaymentAdapter, ICacheService
 from app.infrastructure.ports.kafka_event_bus import kafka_event_bus
 from app.infrastructure.ports.paystack_adapter import get_PaystackAdapter
-from app.infrastructure.cache import get_RedisCacheService
+from app.infrastructure.cache import (
+    get_RedisCacheService,
+    get_PaymentStatusNotifier,
+    PaymentStatusNotifier,
+)
 
 
 async def get_db() -> AsyncIterator[AsyncSession]:
@@ -29,6 +33,10 @@ def get_ICacheService() -> ICacheService:
     return get_RedisCacheService()
 
 
+def get_payment_status_notifier() -> PaymentStatusNotifier:
+    return get_PaymentStatusNotifier()
+
+
 def get_txn_repo(
     session: AsyncSession,
 ) -> ITransactionRepository:
@@ -0,0 +1,23 @@
+from typing import cast
+
+from app.domain.events import PurchaseSettledEvent
+from app.domain.events.base import DomainEvent
+
+from .base import IEventHandler
+from .di import get_payment_status_notifier
+
+
+class PaymentStatusEventHandler(IEventHandler):
+    """Tells buyers waiting on a reference that their purchase has settled"""
+
+    events = [
+        PurchaseSettledEvent,
+    ]
+
+    async def handle(self, event: DomainEvent):
+        settled = cast(PurchaseSettledEvent, event)
+
+        await get_payment_status_notifier().publish(
+            settled.payload.reference,
+            "settled",
+        )
@@ -4,7 +4,7 @@ from typing import cast
 from decimal import Decimal
 from datetime import datetime, timezone
 
-from app.config import settings
+from app.config import settings, kafka_config
 from app.domain.repositories import ITransactionRepository, IWalletRepository
 from app.domain.ports import ITicketService, IUserService, IEventBus
 from app.domain.entities import Transaction
@@ -21,6 +21,7 @@ from app.domain.events.base import DomainEvent
 from app.shared.errors import AppError
 
 from .base import IEventHandler
+from .wallet_credit_aggregator import WalletCreditAggregator
 from .di import (
     get_ticket_service,
     session_context,
@@ -35,6 +36,9 @@ logger = logging.getLogger(__name__)
 
 REFERRAL_PERCENTAGE = Decimal("12")
 
+# Settlement transactions that only credit the recipient's wallet
+CREDIT_TRANSACTION_TYPES = ("sale", "commission", "fee")
+
 
 class TransactionEventHandler(IEventHandler):
     events = [
@@ -43,6 +47,19 @@ class TransactionEventHandler(IEventHandler):
         CompleteFundingEvent,
     ]
 
+    def __init__(self) -> None:
+        # Batching only pays off when the consumer runs handlers concurrently;
+        # a serial consumer would just wait out every window
+        self._credit_aggregator = (
+            WalletCreditAggregator(
+                window_ms=settings.credit_aggregation_window_ms,
+                batch_size=settings.credit_aggregation_batch_size,
+            )
+            if settings.credit_aggregation_enabled
+            and kafka_config.consumer_mode == "partitioned"
+            else None
+        )
+
     async def handle(self, event: DomainEvent):
         if isinstance(event, TransactionCreatedEvent):
             await self._process_transaction_created(event)
@@ -140,8 +157,7 @@ class TransactionEventHandler(IEventHandler):
             await txn_repo.save(txn)
             await session.commit()
 
-            for t_ev in txn.events:
-                await event_bus.publish(t_ev)
+            await event_bus.publish_many(txn.events)
 
     async def _process_transaction_created(self, event: TransactionCreatedEvent):
         logger.debug(f"Processing transaction created AGG ID: {event.aggregate_id}")
@@ -151,6 +167,19 @@ class TransactionEventHandler(IEventHandler):
         event_bus = get_event_bus()
         payload = cast(TransactionCreatedPayload, event.payload)
 
+        if (
+            self._credit_aggregator is not None
+            and payload.transaction_type in CREDIT_TRANSACTION_TYPES
+        ):
+            try:
+                await self._credit_aggregator.credit(UUID(payload.reference))
+                return
+            except Exception as e:
+                # Isolate whatever broke the batch: settle this one on its own
+                logger.warning(
+                    f"Batched credit failed for {payload.reference}, retrying alone: {e}"
+                )
+
         async with session_context() as session:
             txn_repo = get_txn_repo(session)
             wallet_repo = get_wallet_repo(session)
@@ -193,11 +222,7 @@ class TransactionEventHandler(IEventHandler):
                     )
                 else:
                     raise AppError(f"{txn} not implemented", 500)
-            elif (
-                txn.transaction_type == "sale"
-                or txn.transaction_type == "commission"
-                or txn.transaction_type == "fee"
-            ):
+            elif txn.transaction_type in CREDIT_TRANSACTION_TYPES:
                 await self._fund_account_from_txn(
                     txn=txn,
                     txn_repo=txn_repo,
@@ -251,8 +276,7 @@ class TransactionEventHandler(IEventHandler):
             txn.metadata["mode"] = "manual"
             txn.metadata["dest"] = wallet.bank_details.build_dest()
             await txn_repo.save(txn)
-            for ev in NotifyEvent.manual_withdrawal_initiated(txn):
-                await event_bus.publish(ev)
+            await event_bus.publish_many(NotifyEvent.manual_withdrawal_initiated(txn))
 
             logger.debug(f"Transaction: {txn.reference}: Alerted User & Admin")
             return
@@ -303,18 +327,18 @@ class TransactionEventHandler(IEventHandler):
 
         logger.debug(f"Transaction: {txn.reference}: Fund wallet")
 
-        wallet = await wallet_repo.get_by_user_or_create(
-            txn.user_id,
-            lock_for_update=True,
-        )
-
-        if txn.transaction_type == "wallet_funding":
-            wallet.confirm_can_deposit(txn.amount, settings.max_attendee_wallet_balance)
-
         txn.complete_settlement()
-        wallet.deposit(txn.amount)
-        await wallet_repo.save(wallet)
         await txn_repo.save(txn)
+        await wallet_repo.credit(
+            txn.user_id,
+            txn.amount,
+            max_balance=(
+                settings.max_attendee_wallet_balance
+                if txn.transaction_type == "wallet_funding"
+                else None
+            ),
+            transaction_id=txn.id,
+        )
 
         ev = WalletFundedEvent.create(txn)
         await event_bus.publish(ev)
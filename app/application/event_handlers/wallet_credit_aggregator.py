@@ -0,0 +1,114 @@
+import asyncio
+import logging
+from uuid import UUID
+from typing import Optional
+
+from app.domain.entities import LedgerEntry
+from app.domain.events import WalletFundedEvent
+from .di import session_context, get_event_bus, get_txn_repo, get_wallet_repo
+
+logger = logging.getLogger(__name__)
+
+
+class WalletCreditAggregator:
+    """
+    Write-combines wallet credits from settlement transactions.
+
+    Callers submit a transaction reference and wait. References gathered over
+    a short window (or until the batch is full) are settled together: every
+    still-pending transaction is completed and its ledger entry is appended
+    in one multi-row insert. Hot wallets such as the system wallet take one
+    round trip per batch instead of one per sale.
+
+    Each transaction row is still completed individually, and transactions
+    that are no longer pending are skipped, so redelivered events never
+    credit twice.
+    """
+
+    def __init__(self, window_ms: int = 20, batch_size: int = 200) -> None:
+        self._window = window_ms / 1000
+        self._batch_size = batch_size
+        self._pending: dict[UUID, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: set[asyncio.Task] = set()
+
+    async def credit(self, reference: UUID) -> None:
+        """Settle the transaction with its batch; raises if the batch failed"""
+        loop = asyncio.get_running_loop()
+
+        future = self._pending.get(reference)
+        if future is None:
+            future = loop.create_future()
+            self._pending[reference] = future
+
+        if len(self._pending) >= self._batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush)
+
+        await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        # Submissions from here on start the next batch
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._settle_batch(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _settle_batch(self, batch: dict[UUID, asyncio.Future]) -> None:
+        try:
+            await self._settle(list(batch))
+        except Exception as e:
+            logger.exception(f"Failed to settle a batch of {len(batch)} credit(s)")
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for future in batch.values():
+                if not future.done():
+                    future.set_result(None)
+
+    async def _settle(self, references: list[UUID]) -> None:
+        event_bus = get_event_bus()
+
+        async with session_context() as session:
+            txn_repo = get_txn_repo(session)
+            wallet_repo = get_wallet_repo(session)
+
+            txns = await txn_repo.lock_pending_by_references(references)
+
+            logger.debug(f"Settling {len(txns)} of {len(references)} credit(s)")
+
+            if not txns:
+                return
+
+            credits: list[LedgerEntry] = []
+            events = []
+
+            for txn in txns:
+                txn.complete_settlement()
+                credits.append(
+                    LedgerEntry(
+                        user_id=txn.user_id,
+                        amount=txn.amount,
+                        transaction_id=txn.id,
+                    )
+                )
+
+                events.append(WalletFundedEvent.create(txn))
+                events.extend(txn.events)
+
+            await wallet_repo.credit_many(credits)
+            await txn_repo.update_settlement_status_many(
+                [txn.id for txn in txns],
+                "completed",
+            )
+
+            await event_bus.publish_many(events)
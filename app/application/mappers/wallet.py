@@ -1,6 +1,6 @@
-from app.domain.entities import Transaction, Wallet
+from app.domain.entities import Transaction, Wallet, LedgerEntry
 
-from ..dto.wallet import TransactionDto, BalanceDto
+from ..dto.wallet import TransactionDto, BalanceDto, LedgerEntryDto
 
 
 def transaction_to_dto(txn: Transaction) -> TransactionDto:
@@ -23,3 +23,12 @@ def wallet_to_dto(w: Wallet) -> BalanceDto:
         has_pin=w.has_pin,
         pending=w.pending_balance,
     )
+
+
+def ledger_entry_to_dto(e: LedgerEntry) -> LedgerEntryDto:
+    return LedgerEntryDto(
+        id=e.id,
+        amount=e.amount,
+        date=e.created_at,
+        transaction_id=e.transaction_id,
+    )
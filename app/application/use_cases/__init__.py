@@ -3,6 +3,7 @@ from .create_checkout import CreateCheckoutUseCase
 from .verify_transaction import VerifyTicketPurchaseTransactionUseCase
 from .list_transactions import ListTransactionUseCase
 from .get_balance import GetBalanceUseCase
+from .get_wallet_statement import GetWalletStatementUseCase
 from .set_transaction_pin import SetTransactionPinUseCase
 from .resolve_personal_account import ResolvePersonalAccountUseCase
 from .list_banks import ListBanksUseCase
@@ -19,6 +20,7 @@ __all__ = [
     "VerifyTicketPurchaseTransactionUseCase",
     "ListTransactionUseCase",
     "GetBalanceUseCase",
+    "GetWalletStatementUseCase",
     "SetTransactionPinUseCase",
     "ResolvePersonalAccountUseCase",
     "ListBanksUseCase",
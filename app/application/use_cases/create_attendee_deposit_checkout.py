@@ -95,7 +95,7 @@ class CreateAttendeeDepositCheckoutUseCase:
             user_id=user_id,
         )
 
-        await self._txn_repo.save(txn)
+        await self._txn_repo.insert_many([txn])
 
         link = await self._payment_adapter.create_checkout_link(
             amount=amount + Decimal(calculated_charge),
@@ -105,7 +105,6 @@ class CreateAttendeeDepositCheckoutUseCase:
             metadata=metadata.model_dump(),
         )
 
-        for e in txn.events:
-            await self._event_bus.publish(e)
+        await self._event_bus.publish_many(txn.events)
 
         return link
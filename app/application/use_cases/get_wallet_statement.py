@@ -0,0 +1,52 @@
+from uuid import UUID
+from typing import Optional
+
+from app.domain.repositories import IWalletRepository
+from app.application.dto.wallet import LedgerEntryDto
+from app.application.dto.base import CursorPaginatedResponseDto
+from app.application.mappers.wallet import ledger_entry_to_dto
+from app.shared.errors import AppError, ErrorCodes
+
+
+class GetWalletStatementUseCase:
+    """Lists a wallet's ledger entries, newest first"""
+
+    def __init__(
+        self,
+        wallet_repo: IWalletRepository,
+    ) -> None:
+        self._wallet_repo = wallet_repo
+
+    async def execute(
+        self,
+        user_id: UUID,
+        page_size: int,
+        cursor: Optional[str] = None,
+    ) -> CursorPaginatedResponseDto[LedgerEntryDto]:
+        entries = await self._wallet_repo.list_ledger_entries(
+            user_id,
+            limit=page_size + 1,
+            before_id=self._decode_cursor(cursor) if cursor else None,
+        )
+
+        next_cursor = None
+        if len(entries) > page_size:
+            entries = entries[:page_size]
+            next_cursor = str(entries[-1].id)
+
+        return CursorPaginatedResponseDto[LedgerEntryDto].create(
+            items=[ledger_entry_to_dto(e) for e in entries],
+            page_size=page_size,
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> int:
+        try:
+            return int(cursor)
+        except ValueError:
+            raise AppError(
+                "Invalid pagination cursor",
+                400,
+                error_code=ErrorCodes.DATA_VALIDATION_ERROR,
+            )
@@ -1,11 +1,33 @@
+from typing import Optional
+
+from app.domain.dto import TransactionCursor
+from app.domain.entities import Transaction
 from app.domain.repositories import ITransactionRepository
 from app.application.dto.wallet import (
     ListUserTransactionRequestDto,
     ListTransactionRequestDto,
+    ListUserTransactionCursorReqDto,
+    ListTransactionCursorReqDto,
     TransactionDto,
 )
-from app.application.dto.base import PaginatedResponseDto
+from app.application.dto.transaction import TransactionListDto
+from app.application.dto.base import PaginatedResponseDto, CursorPaginatedResponseDto
 from app.application.mappers.wallet import transaction_to_dto
+from app.shared.enums import CountMode
+
+
+def _split_page(
+    entities: list[Transaction],
+    page_size: int,
+) -> tuple[list[Transaction], Optional[str]]:
+    """Trim the look-ahead row and derive the next cursor from the last item"""
+    if len(entities) <= page_size:
+        return entities, None
+
+    page = entities[:page_size]
+    last = page[-1]
+
+    return page, TransactionCursor(occurred_on=last.occurred_on, id=last.id).encode()
 
 
 class ListTransactionUseCase:
@@ -19,6 +41,32 @@ class ListTransactionUseCase:
             filter=req.filter,
         )
 
+    async def execute_after(
+        self,
+        req: ListTransactionCursorReqDto,
+    ) -> CursorPaginatedResponseDto[TransactionListDto]:
+        """Keyset variant of execute: page N costs the same as page 1"""
+        entities = await self._txn_repo.query_after(
+            limit=req.page_size + 1,
+            filter=req.filter,
+            after=TransactionCursor.decode(req.cursor) if req.cursor else None,
+        )
+        page, next_cursor = _split_page(entities, req.page_size)
+
+        total = None
+        if req.count != CountMode.none:
+            total = await self._txn_repo.count(
+                filter=req.filter,
+                estimate=req.count == CountMode.estimate,
+            )
+
+        return CursorPaginatedResponseDto[TransactionListDto].create(
+            items=[TransactionListDto.from_domain(e) for e in page],
+            page_size=req.page_size,
+            next_cursor=next_cursor,
+            total=total,
+        )
+
     async def by_user(
         self,
         req: ListUserTransactionRequestDto,
@@ -38,3 +86,35 @@ class ListTransactionUseCase:
             page_size=req.page_size,
             total=total,
         )
+
+    async def by_user_after(
+        self,
+        req: ListUserTransactionCursorReqDto,
+    ) -> CursorPaginatedResponseDto[TransactionDto]:
+        """Keyset variant of by_user: page N costs the same as page 1"""
+        entities = await self._txn_repo.query_by_user_after(
+            limit=req.page_size + 1,
+            user_id=req.user_id,
+            ticket_ids=req.ticket_ids,
+            occurrence=req.occurrence,
+            event=req.event,
+            after=TransactionCursor.decode(req.cursor) if req.cursor else None,
+        )
+        page, next_cursor = _split_page(entities, req.page_size)
+
+        total = None
+        if req.count != CountMode.none:
+            total = await self._txn_repo.count_by_user(
+                user_id=req.user_id,
+                ticket_ids=req.ticket_ids,
+                occurrence=req.occurrence,
+                event=req.event,
+                estimate=req.count == CountMode.estimate,
+            )
+
+        return CursorPaginatedResponseDto[TransactionDto].create(
+            items=[transaction_to_dto(e) for e in page],
+            page_size=req.page_size,
+            next_cursor=next_cursor,
+            total=total,
+        )
@@ -2,7 +2,8 @@ import logging
 from typing import Any
 from datetime import datetime, timezone
 
-from app.domain.entities import Transaction
+from app.config import settings
+from app.domain.entities import Transaction, LedgerEntry
 from app.domain.repositories import ITransactionRepository, IWalletRepository
 from app.domain.ports import IEventBus
 from app.domain.events import WalletFundedEvent
@@ -23,12 +24,22 @@ class ProcessDueSettlementsUseCase:
         self.wallet_repo = wallet_repo
         self.event_bus = event_bus
 
-    async def execute(self, session: Any | None = None):
+    async def execute(self, session: Any | None = None) -> int:
+        """
+        Settle due scheduled transactions.
+
+        Returns:
+            Number of transactions processed
+        """
         if session is not None:
             self.txn_repo.set_session(session)
             self.wallet_repo.set_session(session)
 
         now = datetime.now(timezone.utc)
+
+        if settings.settlement_bulk_mode:
+            return await self._settle_batch(now)
+
         due_transactions = await self.txn_repo.find_due_scheduled(now)
 
         logger.debug(f"Found {len(due_transactions)} due transaction(s)")
@@ -41,6 +52,50 @@ class ProcessDueSettlementsUseCase:
                 self.event_bus,
             )
 
+        return len(due_transactions)
+
+    async def _settle_batch(self, now: datetime) -> int:
+        """
+        Claim a batch of due transactions (skipping rows other workers hold),
+        append one ledger entry per transaction in a single insert and complete
+        the batch with a single status update.
+        """
+        due_transactions = await self.txn_repo.claim_due_scheduled(
+            now,
+            settings.settlement_batch_size,
+        )
+
+        logger.debug(f"Claimed {len(due_transactions)} due transaction(s)")
+
+        if not due_transactions:
+            return 0
+
+        credits: list[LedgerEntry] = []
+        events = []
+
+        for txn in due_transactions:
+            txn.complete_settlement()
+            credits.append(
+                LedgerEntry(
+                    user_id=txn.user_id,
+                    amount=txn.amount,
+                    transaction_id=txn.id,
+                )
+            )
+
+            events.append(WalletFundedEvent.create(txn))
+            events.extend(txn.events)
+
+        await self.wallet_repo.credit_many(credits)
+        await self.txn_repo.update_settlement_status_many(
+            [txn.id for txn in due_transactions],
+            "completed",
+        )
+
+        await self.event_bus.publish_many(events)
+
+        return len(due_transactions)
+
     async def _fund_account_from_txn(
         self,
         txn: "Transaction",
@@ -62,17 +117,9 @@ class ProcessDueSettlementsUseCase:
 
         logger.debug(f"Transaction: {txn.reference}: Fund wallet")
 
-        wallet = await wallet_repo.get_by_user_or_create(
-            txn.user_id,
-            lock_for_update=True,
-        )
         txn.complete_settlement()
-        wallet.deposit(txn.amount)
-        await wallet_repo.save(wallet)
         await txn_repo.save(txn)
+        await wallet_repo.credit(txn.user_id, txn.amount, transaction_id=txn.id)
 
         ev = WalletFundedEvent.create(txn)
-        await event_bus.publish(ev)
-
-        for txn_ev in txn.events:
-            await event_bus.publish(txn_ev)
+        await event_bus.publish_many([ev, *txn.events])
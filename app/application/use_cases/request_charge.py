@@ -6,10 +6,12 @@ from typing import Optional
 from app.config import settings
 from app.domain.repositories import IChargeSettingRepository
 from app.domain.ports import ITicketService, IEventService
+from app.domain.dto.event import ExtraPriceKey
 from app.domain.services import ChargeCalculationService
 from app.shared.errors import AppError, ErrorCodes
 from app.utils.signing import sign_payload
 from app.application.dto.extra import ExtraOrderIntent
+from app.application.dto.charge_request import TicketChargeItemDto
 
 
 class RequestChargeUseCase:
@@ -53,137 +55,188 @@ class RequestChargeUseCase:
         Calculate charges for ticket purchase including extras.
         Returns separate charge groups for tickets and extras.
         """
+        item = TicketChargeItemDto(
+            ticket_type_id=UUID(ticket_type_id),
+            quantity=quantity,
+            pay_more_amount=pay_more_amount,
+            extras=extras,
+        )
 
-        ticket_base_price = await self._ticket_service.get_ticket_price(ticket_type_id)
+        [(charges_response, signature)] = await self.ticket_charges(
+            user_id=user_id,
+            occurrence_id=occurrence_id,
+            event_id=event_id,
+            items=[item],
+        )
 
-        if pay_more_amount and pay_more_amount < ticket_base_price:
-            raise AppError(
-                message=f"Minimum amount is {ticket_base_price}", status_code=400
-            )
+        return charges_response, signature
+
+    async def ticket_charges(
+        self,
+        user_id: str,
+        occurrence_id: str,
+        event_id: str,
+        items: list[TicketChargeItemDto],
+    ) -> list[tuple[list[dict], str]]:
+        """
+        Calculate charges for several ticket types in one pass.
+        Prices, charge versions and extras are resolved once for the whole batch,
+        and each item gets its own signed quote.
+        """
+        ticket_prices = await self._ticket_service.get_ticket_prices(
+            [str(item.ticket_type_id) for item in items]
+        )
 
-        if pay_more_amount:
-            ticket_base_price = pay_more_amount
+        ticket_base_prices: list[Decimal] = []
 
-        ticket_subtotal = ticket_base_price * Decimal(quantity)
+        for item in items:
+            ticket_base_price = ticket_prices[str(item.ticket_type_id)]
+
+            if item.pay_more_amount and item.pay_more_amount < ticket_base_price:
+                raise AppError(
+                    message=f"Minimum amount is {ticket_base_price}", status_code=400
+                )
+
+            if item.pay_more_amount:
+                ticket_base_price = item.pay_more_amount
+
+            ticket_base_prices.append(ticket_base_price)
 
         # Get charge setting for ticket purchases
         charge = await self._charge_repo.get_by_type("ticket_purchase_ng")
 
-        # Calculate ticket charge
-        ticket_charge_data = await self._charge_calc_service.get_charge_breakdown(
+        # Calculate ticket charges
+        ticket_charges_data = await self._charge_calc_service.get_charge_breakdowns(
             charge_setting_id=charge.charge_setting_id,
-            base_amount=ticket_base_price,
-            quantity=quantity,
+            amounts=[
+                (ticket_base_price, item.quantity)
+                for ticket_base_price, item in zip(ticket_base_prices, items)
+            ],
         )
 
-        if not ticket_charge_data:
+        if not ticket_charges_data:
             raise AppError(
                 "Failed to generate ticket charge data.",
                 500,
                 error_code=ErrorCodes.COULD_NOT_GENERATE_CHARGE,
             )
 
-        charges_response = []
-
-        # Add ticket charge group
-        charges_response.append(
-            {
-                "base_amount": str(ticket_subtotal),
-                "charge_setting_id": ticket_charge_data["charge_setting_id"],
-                "version_id": ticket_charge_data["version_id"],
-                "version_number": ticket_charge_data["version_number"],
-                "calculated_charge": ticket_charge_data["calculated_charge"],
-                "quantity": quantity,
-                "user": user_id,
-                "ticket_type": ticket_type_id,
-                "event_id": event_id,
-                "occurrence_id": occurrence_id,
-                "pay_more_amount": (str(pay_more_amount) if pay_more_amount else None),
-                "charge_group": "tickets",
-            }
-        )
+        extras_charges_data = await self._extras_charges(items)
 
-        if extras and len(extras) > 0:
-            # Get charge setting for extra purchases
-            extra_charge_setting = await self._charge_repo.get_by_type(
-                "extra_purchase_ng"
-            )
+        quotes: list[tuple[list[dict], str]] = []
 
-            # Calculate extras subtotal with version tracking
-            extras_subtotal = Decimal(0)
-            extra_details = []
-            extra_price_mapping: dict[tuple[UUID, int], tuple[Decimal, str]] = {}
-
-            for e in extras:
-                # Get price from cache or fetch from service
-                price_key = (e.extra_id, e.extra_version)
-
-                if price_key not in extra_price_mapping:
-                    extra = await self._event_service.get_active_extra_for_ticket(
-                        extra_id=e.extra_id,
-                        extra_version=e.extra_version,
-                        ticket_type_id=UUID(ticket_type_id),
-                    )
-                    if not extra:
-                        raise AppError("Extra not found", 404)
-
-                    extra_price_mapping[(e.extra_id, e.extra_version)] = (
-                        extra.price,
-                        extra.name,
-                    )
-
-                extra_price, extra_name = extra_price_mapping[price_key]
-                extras_subtotal += extra_price * Decimal(e.quantity)
+        for item, ticket_base_price, ticket_charge_data, extras_charge_data in zip(
+            items, ticket_base_prices, ticket_charges_data, extras_charges_data
+        ):
+            ticket_subtotal = ticket_base_price * Decimal(item.quantity)
 
-                # Store details for payload
-                extra_details.append(
-                    {
-                        "extra_id": str(e.extra_id),
-                        "version": e.extra_version,
-                        "quantity": e.quantity,
-                        "price": str(extra_price),
-                        "recipient_id": str(e.recipient_id) if e.recipient_id else None,
-                        "name": extra_name,  # Include name for frontend display
-                    }
-                )
-
-                # Calculate extras charge
-            extras_charge_data = await self._charge_calc_service.get_charge_breakdown(
-                charge_setting_id=extra_charge_setting.charge_setting_id,
-                base_amount=extras_subtotal,
-                quantity=1,
-            )
-
-            if not extras_charge_data:
-                raise AppError(
-                    "Failed to generate extras charge data.",
-                    500,
-                    error_code=ErrorCodes.COULD_NOT_GENERATE_CHARGE,
-                )
+            charges_response = []
 
+            # Add ticket charge group
             charges_response.append(
                 {
-                    "base_amount": extras_charge_data["base_amount"],
-                    "charge_setting_id": extras_charge_data["charge_setting_id"],
-                    "version_id": extras_charge_data["version_id"],
-                    "version_number": extras_charge_data["version_number"],
-                    "calculated_charge": extras_charge_data["calculated_charge"],
+                    "base_amount": str(ticket_subtotal),
+                    "charge_setting_id": ticket_charge_data["charge_setting_id"],
+                    "version_id": ticket_charge_data["version_id"],
+                    "version_number": ticket_charge_data["version_number"],
+                    "calculated_charge": ticket_charge_data["calculated_charge"],
+                    "quantity": item.quantity,
                     "user": user_id,
+                    "ticket_type": str(item.ticket_type_id),
                     "event_id": event_id,
                     "occurrence_id": occurrence_id,
-                    "pay_more_amount": None,
-                    "charge_group": "extras",
+                    "pay_more_amount": (
+                        str(item.pay_more_amount) if item.pay_more_amount else None
+                    ),
+                    "charge_group": "tickets",
                 }
             )
 
-        signature = sign_payload(
-            charges_response,
-            settings.charge_req_key,
+            if extras_charge_data:
+                charges_response.append(
+                    {
+                        "base_amount": extras_charge_data["base_amount"],
+                        "charge_setting_id": extras_charge_data["charge_setting_id"],
+                        "version_id": extras_charge_data["version_id"],
+                        "version_number": extras_charge_data["version_number"],
+                        "calculated_charge": extras_charge_data["calculated_charge"],
+                        "user": user_id,
+                        "event_id": event_id,
+                        "occurrence_id": occurrence_id,
+                        "pay_more_amount": None,
+                        "charge_group": "extras",
+                    }
+                )
+
+            signature = sign_payload(
+                charges_response,
+                settings.charge_req_key,
+            )
+
+            print(f"Sign charge: {json.dumps(charges_response)}")
+
+            quotes.append((charges_response, signature))
+
+        return quotes
+
+    async def _extras_charges(
+        self,
+        items: list[TicketChargeItemDto],
+    ) -> list[Optional[dict]]:
+        """Extras charge breakdown per item, None for items without extras"""
+        if not any(item.extras for item in items):
+            return [None] * len(items)
+
+        # Resolve every distinct extra in the batch in one lookup
+        price_keys = list(
+            dict.fromkeys(
+                ExtraPriceKey(e.extra_id, e.extra_version, item.ticket_type_id)
+                for item in items
+                for e in item.extras or []
+            )
         )
 
-        print(f"Sign charge: {json.dumps(charges_response)}")
+        extra_price_mapping = await self._event_service.get_extra_prices(price_keys)
 
-        return charges_response, signature
+        if any(price_key not in extra_price_mapping for price_key in price_keys):
+            raise AppError("Extra not found", 404)
+
+        # Calculate extras subtotal per item
+        extras_subtotals: list[Decimal] = []
+
+        for item in items:
+            if not item.extras:
+                continue
+
+            extras_subtotal = Decimal(0)
+
+            for e in item.extras:
+                extra_price = extra_price_mapping[
+                    ExtraPriceKey(e.extra_id, e.extra_version, item.ticket_type_id)
+                ]
+                extras_subtotal += extra_price * Decimal(e.quantity)
+
+            extras_subtotals.append(extras_subtotal)
+
+        # Get charge setting for extra purchases
+        extra_charge_setting = await self._charge_repo.get_by_type("extra_purchase_ng")
+
+        # Calculate extras charge
+        extras_charges_data = await self._charge_calc_service.get_charge_breakdowns(
+            charge_setting_id=extra_charge_setting.charge_setting_id,
+            amounts=[(extras_subtotal, 1) for extras_subtotal in extras_subtotals],
+        )
+
+        if not extras_charges_data:
+            raise AppError(
+                "Failed to generate extras charge data.",
+                500,
+                error_code=ErrorCodes.COULD_NOT_GENERATE_CHARGE,
+            )
+
+        remaining = iter(extras_charges_data)
+
+        return [next(remaining) if item.extras else None for item in items]
 
     async def instant_withdrawal_charge(
         self,
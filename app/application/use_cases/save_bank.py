@@ -4,12 +4,18 @@ from app.utils.signing import sign_payload
 from app.config import settings
 from app.shared.errors import AppError
 from app.domain.repositories import IWalletRepository
+from app.domain.ports import IPinHasher
 from app.application.dto.wallet import SaveBankReqDto
 
 
 class SaveBankUseCase:
-    def __init__(self, wallet_repo: IWalletRepository) -> None:
+    def __init__(
+        self,
+        wallet_repo: IWalletRepository,
+        pin_hasher: IPinHasher,
+    ) -> None:
         self.wallet_repo = wallet_repo
+        self.pin_hasher = pin_hasher
 
     async def execute(self, req: SaveBankReqDto, user: UUID):
         req_dict = req.model_dump()
@@ -27,7 +33,7 @@ class SaveBankUseCase:
         if not wallet.has_pin:
             raise AppError("Please setup your transaction pin before proceeding", 400)
 
-        if not wallet.verify_pin(pin):
+        if not await wallet.verify_pin(pin, self.pin_hasher):
             raise AppError("Invalid pin", 400)
 
         wallet.set_bank_details(
@@ -1,14 +1,17 @@
 from uuid import UUID
 from typing import Optional
 from app.domain.repositories import IWalletRepository
+from app.domain.ports import IPinHasher
 
 
 class SetTransactionPinUseCase:
     def __init__(
         self,
         wallet_repo: IWalletRepository,
+        pin_hasher: IPinHasher,
     ) -> None:
         self._wallet_repo = wallet_repo
+        self._pin_hasher = pin_hasher
 
     async def execute(
         self,
@@ -19,9 +22,13 @@ class SetTransactionPinUseCase:
         wallet = await self._wallet_repo.get_by_user_or_create(user_id)
 
         if old_pin:
-            wallet.change_pin(new_pin=pin, old_pin=old_pin)
+            await wallet.change_pin(
+                new_pin=pin,
+                old_pin=old_pin,
+                hasher=self._pin_hasher,
+            )
         else:
-            wallet.set_pin(pin)
+            await wallet.set_pin(pin, self._pin_hasher)
 
         await self._wallet_repo.save(wallet)
 
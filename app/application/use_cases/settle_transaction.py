@@ -241,17 +241,15 @@ class SettleTicketPurchaseUseCase:
         else:
             txn.complete_settlement()
 
-        # Persist the updated transaction
+        # Persist the updated transaction and its settlement children
         await self._txn_repo.save(txn)
-        for s_txn in settlement_transactions:
-            await self._txn_repo.save(s_txn)
-
-        for ev in txn.events:
-            await self._event_bus.publish(ev)
+        await self._txn_repo.insert_many(settlement_transactions)
 
+        events = txn.events
         for s_txn in settlement_transactions:
-            for s_ev in s_txn.events:
-                await self._event_bus.publish(s_ev)
+            events.extend(s_txn.events)
+
+        await self._event_bus.publish_many(events)
 
         print(
             f"Transaction {txn.reference} processed successfully. "
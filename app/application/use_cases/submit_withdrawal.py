@@ -40,10 +40,7 @@ class SubmitWithdrawalUseCase:
         ) and settings.disable_withdrawal_charges == 0:
             raise AppError("Invalid request", 400)
 
-        wallet = await self._wallet_repo.get_by_user_or_create(
-            UUID(user_id),
-            lock_for_update=True,
-        )
+        wallet = await self._wallet_repo.get_by_user_or_create(UUID(user_id))
 
         if not wallet.has_withdrawable_amount(
             Decimal(amount) + Decimal(calculated_charge or "0")
@@ -111,10 +108,12 @@ class SubmitWithdrawalUseCase:
             user_id=UUID(user_id),
         )
 
-        wallet.withdraw(Decimal(amount) + Decimal(calculated_charge or "0"))
-
-        await self._txn_repo.save(txn)
-        await self._wallet_repo.save(wallet)
+        await self._txn_repo.insert_many([txn])
+        # Re-checks the balance atomically: the read above took no lock
+        await self._wallet_repo.debit(
+            UUID(user_id),
+            Decimal(amount) + Decimal(calculated_charge or "0"),
+            transaction_id=txn.id,
+        )
 
-        for e in txn.events:
-            await self._event_bus.publish(e)
+        await self._event_bus.publish_many(txn.events)
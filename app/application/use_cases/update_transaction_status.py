@@ -25,10 +25,6 @@ class UpdateTransactionStatusUseCase:
 
     async def execute(self, req: UpdateTransactionStatusReqDto):
         txn = await self._txn_repo.get_by_id(req.id, lock_for_update=True)
-        wallet = await self._wallet_repo.get_by_user_or_create(
-            txn.user_id,
-            lock_for_update=True,
-        )
 
         if (
             req.status == "failed"
@@ -46,14 +42,16 @@ class UpdateTransactionStatusUseCase:
 
             refundable_amount = txn.mark_as_failed(req.reason)
 
-            if refundable_amount:
-                wallet.deposit(refundable_amount)
-
             await self._txn_repo.save(txn)
-            await self._wallet_repo.save(wallet)
 
-            for ev in txn.events:
-                await self._event_bus.publish(ev)
+            if refundable_amount:
+                await self._wallet_repo.credit(
+                    txn.user_id,
+                    refundable_amount,
+                    transaction_id=txn.id,
+                )
+
+            await self._event_bus.publish_many(txn.events)
 
             return True
         elif (
@@ -78,16 +76,15 @@ class UpdateTransactionStatusUseCase:
             system_user_id = await self._user_service.get_system_user_id()
             fee_transaction = txn.create_fee_transaction(UUID(system_user_id))
             if fee_transaction:
-                await self._txn_repo.save(fee_transaction)
+                await self._txn_repo.insert_many([fee_transaction])
 
             await self._txn_repo.save(txn)
 
-            for t_ev in txn.events:
-                await self._event_bus.publish(t_ev)
-
+            events = txn.events
             if fee_transaction:
-                for f_ev in fee_transaction.events:
-                    await self._event_bus.publish(f_ev)
+                events.extend(fee_transaction.events)
+
+            await self._event_bus.publish_many(events)
 
             return True
 
@@ -3,6 +3,7 @@ from decimal import Decimal
 from uuid import UUID
 
 from app.domain.ports import IPaymentAdapter, IEventBus, ITicketService
+from app.domain.dto import ExternalTransaction
 from app.domain.repositories import ITransactionRepository
 from app.domain.entities import Transaction
 from app.application.dto.checkout import CheckoutMetaData
@@ -33,7 +34,15 @@ class VerifyTicketPurchaseTransactionUseCase:
         reference: str,
         user_id: UUID | None = None,
         validate_only: bool = False,
+        metadata: CheckoutMetaData | None = None,
+        ext_transaction: ExternalTransaction | None = None,
     ) -> tuple[Decimal, CheckoutMetaData | None]:
+        """
+        ext_transaction and metadata may be passed when the caller already
+        holds an authenticated copy of this payment, such as a signed
+        webhook, so the provider is not asked again. The charge signature in
+        the metadata is checked either way.
+        """
         # Check if transaction reference has already been recorded
         existing_txn = await self._txn_repo.get_by_reference_or_none(UUID(reference))
 
@@ -44,13 +53,17 @@ class VerifyTicketPurchaseTransactionUseCase:
             )
             return existing_txn.amount, None
 
-        ext_transaction = await self._payment_adapter.get_valid_transaction(reference)
+        if ext_transaction is None:
+            ext_transaction = await self._payment_adapter.get_valid_transaction(
+                reference
+            )
 
-        if not ext_transaction.metadata:
-            logger.debug("Metadata not found")
-            raise AppError("Malformed transaction. Please contact support", 500)
+        if metadata is None:
+            if not ext_transaction.metadata:
+                logger.debug("Metadata not found")
+                raise AppError("Malformed transaction. Please contact support", 500)
 
-        metadata = CheckoutMetaData.model_validate(ext_transaction.metadata)
+            metadata = CheckoutMetaData.model_validate(ext_transaction.metadata)
 
         ticket_charge_payload = metadata.ticket_charge.model_dump()
         if "sponsored" in ticket_charge_payload:
@@ -135,11 +148,10 @@ class VerifyTicketPurchaseTransactionUseCase:
             },
         )
 
-        await self._txn_repo.save(txn)
+        await self._txn_repo.insert_many([txn])
 
         if not metadata.is_gate_purchase:
-            for e in txn.events:
-                await self._event_bus.publish(e)
+            await self._event_bus.publish_many(txn.events)
 
         return ext_transaction.amount, metadata
 
@@ -6,6 +6,11 @@ from .sqlalchemy import db_config
 from .grpc import grpc_config
 from .paystack import paystack_config
 from .redis import redis_config
+from .http_client import (
+    HttpClientSettings,
+    paystack_http_config,
+    event_svc_http_config,
+)
 
 __all__ = [
     "logging_config",
@@ -16,4 +21,7 @@ __all__ = [
     "grpc_config",
     "paystack_config",
     "redis_config",
+    "HttpClientSettings",
+    "paystack_http_config",
+    "event_svc_http_config",
 ]
@@ -23,6 +23,75 @@ class GenericSettings(BaseSettings):
 
     disable_withdrawal_charges: int = 0
 
+    charge_cache_ttl_seconds: int = 300
+
+    outbox_relay_batch_size: int = 500
+
+    outbox_relay_poll_interval_ms: int = 200
+
+    settlement_bulk_mode: bool = True
+
+    settlement_batch_size: int = 1000
+
+    settlement_reconcile_interval_seconds: int = 300
+
+    settlement_schedule_seed_limit: int = 10000
+
+    credit_aggregation_enabled: bool = True
+
+    credit_aggregation_window_ms: int = 20
+
+    credit_aggregation_batch_size: int = 200
+
+    wallet_snapshot_interval_seconds: int = 60
+
+    wallet_snapshot_min_entries: int = 100
+
+    wallet_snapshot_batch_size: int = 500
+
+    pin_hash_rounds: int = 12
+
+    pin_hash_max_workers: int = 2
+
+    verified_payment_cache_ttl_seconds: int = 86400
+
+    verified_payment_lock_ttl_seconds: int = 10
+
+    payment_status_ttl_seconds: int = 86400
+
+    payment_status_max_connections: int = 500
+
+    payment_status_max_wait_seconds: int = 30
+
+    payment_status_stream_seconds: int = 300
+
+    payment_status_heartbeat_seconds: int = 15
+
+    paystack_webhook_async: bool = False
+
+    paystack_webhook_batch_size: int = 50
+
+    paystack_webhook_concurrency: int = 8
+
+    paystack_webhook_poll_interval_ms: int = 200
+
+    paystack_webhook_lease_seconds: int = 60
+
+    paystack_webhook_max_attempts: int = 10
+
+    paystack_webhook_dedupe_ttl_seconds: int = 86400
+
+    paystack_webhook_inflight_ttl_seconds: int = 60
+
+    paystack_webhook_trust_charge_data: bool = True
+
+    extra_price_cache_ttl_seconds: int = 300
+
+    # Extras looked up at once when the event service has no bulk lookup
+    event_svc_extras_concurrency: int = 8
+
+    event_svc_bulk_extras: bool = False
+
     debug: bool = False
 
     @field_validator("debug", mode="before")
@@ -0,0 +1,71 @@
+from typing import Optional
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class HttpClientSettings(BaseSettings):
+    """Connection pool, timeouts and retry policy of an outbound HTTP client"""
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        extra="ignore",
+    )
+
+    max_connections: int = 100
+
+    max_keepalive_connections: int = 20
+
+    keepalive_expiry_seconds: float = 30.0
+
+    http2: bool = False
+
+    connect_timeout_seconds: float = 3.0
+
+    read_timeout_seconds: float = 15.0
+
+    write_timeout_seconds: float = 10.0
+
+    pool_timeout_seconds: float = 2.0
+
+    # Attempts per idempotent call, the first one included
+    retry_max_attempts: int = 3
+
+    retry_base_delay_ms: float = 100.0
+
+    retry_max_delay_ms: float = 2000.0
+
+    # Retries and hedges allowed per call made, once the reserve is spent
+    retry_budget_ratio: float = 0.1
+
+    retry_budget_min_tokens: float = 10.0
+
+    # Send a second copy of a hedged read still unanswered after this long;
+    # unset turns hedging off
+    hedge_delay_ms: Optional[float] = None
+
+
+class PaystackHttpSettings(HttpClientSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="PAYSTACK_HTTP_",
+        env_file=".env",
+        extra="ignore",
+    )
+
+    # Checkout links and payment verification sit on the buyer's path
+    checkout_read_timeout_seconds: float = 10.0
+
+    # Transfers and recipients are slower on Paystack's side
+    transfer_read_timeout_seconds: float = 30.0
+
+
+class EventServiceHttpSettings(HttpClientSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="EVENT_SVC_HTTP_",
+        env_file=".env",
+        extra="ignore",
+    )
+
+    read_timeout_seconds: float = 5.0
+
+
+paystack_http_config = PaystackHttpSettings()
+event_svc_http_config = EventServiceHttpSettings()
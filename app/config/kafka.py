@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -13,6 +13,11 @@ class KafkaSettings(BaseSettings):
     group_id: str
     auto_offset_reset: Literal["earliest"] = "earliest"
     enable_auto_commit: bool = False
+    consumer_mode: Literal["serial", "partitioned"] = "partitioned"
+    max_in_flight_per_partition: int = 16
+    linger_ms: int = 5
+    max_batch_size: int = 16384
+    compression_type: Optional[Literal["gzip", "snappy", "lz4", "zstd"]] = None
 
 
 kafka_config = KafkaSettings()  # type: ignore
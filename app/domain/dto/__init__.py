@@ -4,7 +4,7 @@ from .wallet import (
     BankItem,
     PersonalAccountWithSignature,
 )
-from .transaction import TransactionFilter
+from .transaction import TransactionFilter, TransactionCursor
 
 __all__ = [
     "ExternalTransaction",
@@ -12,4 +12,5 @@ __all__ = [
     "BankItem",
     "PersonalAccountWithSignature",
     "TransactionFilter",
+    "TransactionCursor",
 ]
@@ -1,6 +1,7 @@
 from pydantic import BaseModel
 from uuid import UUID
 from decimal import Decimal
+from typing import NamedTuple
 
 
 class ExtraDto(BaseModel):
@@ -11,6 +12,14 @@ class ExtraDto(BaseModel):
     quantity_available: int
 
 
+class ExtraPriceKey(NamedTuple):
+    """An extra's price is fixed for a given version and ticket type"""
+
+    extra_id: UUID
+    extra_version: int
+    ticket_type_id: UUID
+
+
 class EventOccurrence(BaseModel):
     id: str
     occurrence: str
@@ -1,8 +1,37 @@
+import base64
+from datetime import datetime
+from uuid import UUID
 from pydantic import BaseModel
 from typing import Optional
+
+from app.shared.errors import AppError, ErrorCodes
 from ..entities.value_objects import TransactionSettlementStatus, TransactionType
 
 
 class TransactionFilter(BaseModel):
     status: Optional[TransactionSettlementStatus] = None
     type: Optional[TransactionType] = None
+
+
+class TransactionCursor(BaseModel):
+    """Keyset position in a listing ordered by (occurred_on, id) descending"""
+
+    occurred_on: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        raw = f"{self.occurred_on.isoformat()}|{self.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "TransactionCursor":
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+            occurred_on, id = raw.split("|")
+            return cls(occurred_on=datetime.fromisoformat(occurred_on), id=UUID(id))
+        except ValueError:
+            raise AppError(
+                "Invalid pagination cursor",
+                400,
+                error_code=ErrorCodes.DATA_VALIDATION_ERROR,
+            )
@@ -3,7 +3,7 @@ from .charge_setting_version import ChargeSettingVersion, PriceRangeTier
 from .transaction import (
     Transaction,
 )
-from .wallet import Wallet
+from .wallet import Wallet, LedgerEntry
 
 __all__ = [
     "ChargeSetting",
@@ -11,4 +11,5 @@ __all__ = [
     "PriceRangeTier",
     "Transaction",
     "Wallet",
+    "LedgerEntry",
 ]
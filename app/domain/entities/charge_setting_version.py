@@ -5,6 +5,7 @@ from pydantic import (
     model_validator,
     field_serializer,
 )
+from bisect import bisect_left, bisect_right
 from enum import Enum
 from typing import Optional
 from datetime import datetime, timezone
@@ -16,6 +17,37 @@ from app.shared.errors import AppError
 # === Value Objects ===
 
 
+def _apply_tier_charge(
+    base_amount: Decimal,
+    percentage_rate: Decimal,
+    additional_charge: Optional[Decimal],
+    min_charge: Optional[Decimal],
+    max_charge: Optional[Decimal],
+) -> Decimal:
+    """Apply a tier's rate, flat charge and caps to a base amount"""
+    # Calculate percentage-based charge
+    charge = (
+        (base_amount * percentage_rate / 100).quantize(
+            Decimal("0.01"), rounding=ROUND_HALF_UP
+        )
+        if percentage_rate > 0
+        else Decimal("0.00")
+    )
+
+    if additional_charge:
+        charge += additional_charge
+
+    # Apply minimum cap if specified
+    if min_charge is not None and charge < min_charge:
+        charge = min_charge
+
+    # Apply maximum cap if specified
+    if max_charge is not None and charge > max_charge:
+        charge = max_charge
+
+    return charge
+
+
 class PriceRangeTier(BaseModel):
     """
     Value object representing a single pricing tier with a price range
@@ -114,27 +146,109 @@ class PriceRangeTier(BaseModel):
         Returns:
             The calculated charge amount after applying percentage and caps
         """
-        # Calculate percentage-based charge
-        charge = (
-            (base_amount * self.percentage_rate / 100).quantize(
-                Decimal("0.01"), rounding=ROUND_HALF_UP
-            )
-            if self.percentage_rate > 0
-            else Decimal("0.00")
+        return _apply_tier_charge(
+            base_amount,
+            self.percentage_rate,
+            self.additional_charge,
+            self.min_charge,
+            self.max_charge,
+        )
+
+
+class _TierRule:
+    """Plain snapshot of a tier's bounds and rates, detached from Pydantic"""
+
+    __slots__ = (
+        "tier",
+        "min_price",
+        "max_price",
+        "percentage_rate",
+        "additional_charge",
+        "min_charge",
+        "max_charge",
+    )
+
+    def __init__(self, tier: PriceRangeTier) -> None:
+        self.tier = tier
+        self.min_price = tier.min_price
+        self.max_price = tier.max_price
+        self.percentage_rate = tier.percentage_rate
+        self.additional_charge = tier.additional_charge
+        self.min_charge = tier.min_charge
+        self.max_charge = tier.max_charge
+
+    def charge(self, base_amount: Decimal) -> Decimal:
+        return _apply_tier_charge(
+            base_amount,
+            self.percentage_rate,
+            self.additional_charge,
+            self.min_charge,
+            self.max_charge,
         )
 
-        if self.additional_charge:
-            charge += self.additional_charge
 
-        # Apply minimum cap if specified
-        if self.min_charge is not None and charge < self.min_charge:
-            charge = self.min_charge
+class CompiledTierTable:
+    """
+    Immutable lookup table compiled from a version's (sorted) tiers.
 
-        # Apply maximum cap if specified
-        if self.max_charge is not None and charge > self.max_charge:
-            charge = self.max_charge
+    Non-overlapping tiers are resolved by bisecting their lower bounds.
+    Overlapping tiers are resolved through an interval index: every distinct
+    tier boundary splits the price axis into point and open segments, and the
+    applicable tiers for each segment are computed once at compile time.
+    """
 
-        return charge
+    __slots__ = ("_allow_overlap", "_rules", "_bounds", "_points", "_segments")
+
+    def __init__(self, tiers: list[PriceRangeTier], allow_overlap: bool) -> None:
+        self._allow_overlap = allow_overlap
+        self._rules = tuple(_TierRule(t) for t in tiers)
+        self._bounds = tuple(r.min_price for r in self._rules)
+        self._points: tuple[Decimal, ...] = ()
+        self._segments: tuple[tuple[_TierRule, ...], ...] = ()
+
+        if allow_overlap:
+            self._compile_interval_index(tiers)
+
+    def _compile_interval_index(self, tiers: list[PriceRangeTier]) -> None:
+        points = sorted(
+            {t.min_price for t in tiers}
+            | {t.max_price for t in tiers if t.max_price is not None}
+        )
+
+        def matching(amount: Decimal) -> tuple[_TierRule, ...]:
+            return tuple(r for r in self._rules if r.tier.applies_to(amount))
+
+        # Segment layout: gap_0, point_0, gap_1, point_1, ..., point_n-1, gap_n
+        # where gap_i is the open interval (points[i-1], points[i])
+        segments: list[tuple[_TierRule, ...]] = [()]
+        for i, point in enumerate(points):
+            segments.append(matching(point))
+            if i + 1 < len(points):
+                segments.append(matching((point + points[i + 1]) / 2))
+            else:
+                segments.append(matching(point + 1))
+
+        self._points = tuple(points)
+        self._segments = tuple(segments)
+
+    def lookup(self, amount: Decimal) -> tuple[_TierRule, ...]:
+        """Return the rules applicable to an amount, ordered by min_price"""
+        if not self._allow_overlap:
+            idx = bisect_right(self._bounds, amount) - 1
+            if idx < 0:
+                return ()
+
+            rule = self._rules[idx]
+            if rule.max_price is not None and amount > rule.max_price:
+                return ()
+
+            return (rule,)
+
+        idx = bisect_left(self._points, amount)
+        if idx < len(self._points) and self._points[idx] == amount:
+            return self._segments[2 * idx + 1]
+
+        return self._segments[2 * idx]
 
 
 class TierOverlapStrategy(str, Enum):
@@ -185,6 +299,15 @@ class ChargeSettingVersion(BaseModel):
     )
     charge_setting_id: UUID
 
+    _tier_table: Optional[CompiledTierTable] = None
+
+    @property
+    def tier_table(self) -> CompiledTierTable:
+        """Lookup table for this version's tiers, compiled on first use"""
+        if self._tier_table is None:
+            self._tier_table = CompiledTierTable(self.tiers, self.allow_overlap)
+        return self._tier_table
+
     @model_validator(mode="after")
     def validate_tiers(self):
         """Validate tiers based on overlap setting"""
@@ -269,19 +392,13 @@ class ChargeSettingVersion(BaseModel):
         if self.allow_overlap:
             raise AppError("Charge can have more than one tiers that match", 500)
 
-        for tier in self.tiers:
-            if tier.applies_to(base_amount):
-                return tier
+        rules = self.tier_table.lookup(base_amount)
 
-        return None
+        return rules[0].tier if rules else None
 
     def find_applicable_tiers(self, base_amount: Decimal) -> list[PriceRangeTier]:
         """Find all tiers that apply to a given amount"""
-        applicable = []
-        for tier in self.tiers:
-            if tier.applies_to(base_amount):
-                applicable.append(tier)
-        return applicable
+        return [r.tier for r in self.tier_table.lookup(base_amount)]
 
     def calculate_charge(
         self, base_amount: Decimal
@@ -302,52 +419,54 @@ class ChargeSettingVersion(BaseModel):
         if base_amount < 0:
             raise ValueError("base_amount must be non-negative")
 
-        applicable_tiers = self.find_applicable_tiers(base_amount)
+        applicable_rules = self.tier_table.lookup(base_amount)
 
-        if not applicable_tiers:
+        if not applicable_rules:
             raise ValueError(f"No tier found for amount: {base_amount}")
 
-        if len(applicable_tiers) == 1 or not self.allow_overlap:
+        applicable_tiers = [r.tier for r in applicable_rules]
+
+        if len(applicable_rules) == 1 or not self.allow_overlap:
             # Single tier case (or overlaps not allowed)
-            return applicable_tiers[0].calculate_charge(base_amount), applicable_tiers
+            return applicable_rules[0].charge(base_amount), applicable_tiers
 
         # Multiple tiers case with overlaps allowed
-        return (
-            self._calculate_overlapping_charge(applicable_tiers, base_amount),
-            applicable_tiers,
-        )
+        charge = self._calculate_overlapping_charge(applicable_rules, base_amount)
+
+        if self.overlap_strategy == TierOverlapStrategy.LAST:
+            # Report the tier that was used first
+            applicable_tiers.sort(key=lambda t: t.min_price, reverse=True)
+
+        return charge, applicable_tiers
 
     def _calculate_overlapping_charge(
-        self, applicable_tiers: list[PriceRangeTier], base_amount: Decimal
+        self, applicable_rules: tuple[_TierRule, ...], base_amount: Decimal
     ) -> Decimal:
         """Calculate charge when multiple tiers apply"""
 
         if self.overlap_strategy == TierOverlapStrategy.SUM:
             # Sum charges from all applicable tiers
             total = Decimal("0.00")
-            for tier in applicable_tiers:
-                total += tier.calculate_charge(base_amount)
+            for rule in applicable_rules:
+                total += rule.charge(base_amount)
             return total
 
         elif self.overlap_strategy == TierOverlapStrategy.HIGHEST:
             # Take the highest charge
-            charges = [t.calculate_charge(base_amount) for t in applicable_tiers]
-            return max(charges)
+            return max(r.charge(base_amount) for r in applicable_rules)
 
         elif self.overlap_strategy == TierOverlapStrategy.LOWEST:
             # Take the lowest charge
-            charges = [t.calculate_charge(base_amount) for t in applicable_tiers]
-            return min(charges)
+            return min(r.charge(base_amount) for r in applicable_rules)
 
         elif self.overlap_strategy == TierOverlapStrategy.FIRST:
-            # Take the first applicable tier (based on min_price)
-            applicable_tiers.sort(key=lambda t: t.min_price)
-            return applicable_tiers[0].calculate_charge(base_amount)
+            # Take the first applicable tier (rules are ordered by min_price)
+            return applicable_rules[0].charge(base_amount)
 
         elif self.overlap_strategy == TierOverlapStrategy.LAST:
             # Take the last applicable tier (highest min_price)
-            applicable_tiers.sort(key=lambda t: t.min_price, reverse=True)
-            return applicable_tiers[0].calculate_charge(base_amount)
+            rule = max(applicable_rules, key=lambda r: r.min_price)
+            return rule.charge(base_amount)
 
         else:
             raise ValueError(f"Unknown overlap strategy: {self.overlap_strategy}")
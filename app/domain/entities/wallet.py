@@ -4,11 +4,11 @@ from uuid import UUID, uuid4
 from typing import Optional
 from datetime import datetime, timezone
 from app.shared.errors import AppError, ErrorCodes
-import bcrypt  # type: ignore
 
 from app.config import settings
 from app.utils.money_utils import format_currency
 from .value_objects import BankDetails
+from ..ports.pin_hasher import IPinHasher
 
 
 class Wallet(BaseModel):
@@ -20,8 +20,9 @@ class Wallet(BaseModel):
     pin_updated_at: Optional[datetime] = None
     bank_details: Optional[BankDetails] = None
 
+    # No validate_assignment: every mutator below checks its own invariants,
+    # so balance changes do not re-validate the whole model
     model_config = {
-        "validate_assignment": True,
         "arbitrary_types_allowed": True,
         "json_encoders": {
             Decimal: lambda v: format(v, "f"),
@@ -90,35 +91,31 @@ class Wallet(BaseModel):
         self.pending_balance -= amount
         self.balance += amount
 
-    def set_pin(self, pin: str):
+    async def set_pin(self, pin: str, hasher: IPinHasher):
         """Hash and store transaction PIN."""
 
         if len(pin) != 4:
             raise ValueError("PIN must be 4 digits long")
 
-        # Hash the PIN
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(pin.encode("utf-8"), salt)
-
-        self.txn_pin = hashed.decode("utf-8")
+        self.txn_pin = await hasher.hash(pin)
         self.pin_updated_at = datetime.now(timezone.utc)
 
-    def verify_pin(self, pin: str) -> bool:
+    async def verify_pin(self, pin: str, hasher: IPinHasher) -> bool:
         """Check if the provided PIN matches the stored hash."""
         if not self.txn_pin:
             return False
 
-        return bcrypt.checkpw(pin.encode("utf-8"), self.txn_pin.encode("utf-8"))
+        return await hasher.verify(pin, self.txn_pin)
 
-    def change_pin(self, old_pin: str, new_pin: str):
-        if not self.verify_pin(old_pin):
+    async def change_pin(self, old_pin: str, new_pin: str, hasher: IPinHasher):
+        if not await self.verify_pin(old_pin, hasher):
             raise AppError(
                 "Incorrect transaction pin",
                 400,
                 error_code=ErrorCodes.INVALID_TXN_PIN,
             )
 
-        self.set_pin(new_pin)
+        await self.set_pin(new_pin, hasher)
 
     def confirm_can_deposit(
         self,
@@ -143,3 +140,16 @@ class Wallet(BaseModel):
                 ),
                 422,
             )
+
+
+class LedgerEntry(BaseModel):
+    """
+    One signed movement of a wallet's available balance. Entries are only
+    ever appended; the balance is a snapshot plus the entries after it.
+    """
+
+    user_id: UUID
+    amount: Decimal
+    transaction_id: Optional[UUID] = None
+    id: Optional[int] = None
+    created_at: Optional[datetime] = None
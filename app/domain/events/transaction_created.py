@@ -2,7 +2,7 @@ from pydantic import BaseModel
 from uuid import UUID
 from decimal import Decimal
 from datetime import datetime
-from typing import ClassVar, TYPE_CHECKING
+from typing import ClassVar, Optional, TYPE_CHECKING
 
 from .base import DomainEvent
 from .registry import EventRegistry
@@ -20,6 +20,8 @@ class TransactionCreatedPayload(BaseModel):
     resource_id: UUID
     transaction_type: str
     occurred_on: datetime
+    settlement_status: Optional[str] = None
+    delayed_settlement_until: Optional[datetime] = None
 
     model_config = {"frozen": True}
 
@@ -42,6 +44,8 @@ class TransactionCreatedEvent(DomainEvent[TransactionCreatedPayload]):
                 transaction_type=txn.transaction_type,
                 user_id=txn.user_id,
                 reference=str(txn.reference),
+                settlement_status=txn.settlement_status,
+                delayed_settlement_until=txn.delayed_settlement_until,
             ),
         )
 
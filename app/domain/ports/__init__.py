@@ -4,6 +4,7 @@ from .event_bus import IEventBus
 from .user_service import IUserService
 from .event_svc import IEventService
 from .cache import ICacheService
+from .pin_hasher import IPinHasher
 
 __all__ = [
     "ITicketService",
@@ -12,4 +13,5 @@ __all__ = [
     "IUserService",
     "IEventService",
     "ICacheService",
+    "IPinHasher",
 ]
@@ -1,5 +1,5 @@
 from typing import Protocol
-from typing import Type, Callable
+from typing import Type, Callable, Sequence
 from app.domain.events.base import DomainEvent
 
 
@@ -7,3 +7,5 @@ class IEventBus(Protocol):
     async def subscribe(self, event_type: Type[DomainEvent], handler: Callable): ...
 
     async def publish(self, event: DomainEvent): ...
+
+    async def publish_many(self, events: Sequence[DomainEvent]): ...
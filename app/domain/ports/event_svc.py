@@ -1,7 +1,8 @@
 from typing import Protocol
 from uuid import UUID
+from decimal import Decimal
 
-from app.domain.dto.event import ExtraDto
+from app.domain.dto.event import ExtraDto, ExtraPriceKey
 
 
 class IEventService(Protocol):
@@ -11,3 +12,10 @@ class IEventService(Protocol):
         extra_version: int,
         ticket_type_id: UUID,
     ) -> ExtraDto | None: ...
+
+    async def get_extra_prices(
+        self,
+        keys: list[ExtraPriceKey],
+    ) -> dict[ExtraPriceKey, Decimal]:
+        """Prices of the active extras among keys; inactive ones are left out"""
+        ...
@@ -0,0 +1,16 @@
+from typing import Protocol
+from abc import abstractmethod
+
+
+class IPinHasher(Protocol):
+    """Hashes and checks transaction PINs without blocking the event loop."""
+
+    @abstractmethod
+    async def hash(self, pin: str) -> str:
+        """Return a salted hash of the PIN."""
+        ...
+
+    @abstractmethod
+    async def verify(self, pin: str, hashed: str) -> bool:
+        """Check the PIN against a hash produced by hash()."""
+        ...
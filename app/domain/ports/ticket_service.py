@@ -8,6 +8,12 @@ class ITicketService(Protocol):
     @abstractmethod
     async def get_ticket_price(self, ticket_type_id: str) -> Decimal: ...
 
+    @abstractmethod
+    async def get_ticket_prices(
+        self,
+        ticket_type_ids: list[str],
+    ) -> dict[str, Decimal]: ...
+
     @abstractmethod
     async def create_gate_ticket(
         self,
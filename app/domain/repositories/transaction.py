@@ -4,7 +4,7 @@ from abc import abstractmethod
 from datetime import datetime
 
 from ..entities import Transaction
-from ..dto import TransactionFilter
+from ..dto import TransactionFilter, TransactionCursor
 
 
 class ITransactionRepository(Protocol):
@@ -14,9 +14,49 @@ class ITransactionRepository(Protocol):
     @abstractmethod
     async def save(self, txn: "Transaction") -> None: ...
 
+    @abstractmethod
+    async def insert_many(self, txns: list["Transaction"]) -> None:
+        """Insert new transactions in one statement"""
+        ...
+
     @abstractmethod
     async def find_due_scheduled(self, date: datetime) -> list["Transaction"]: ...
 
+    @abstractmethod
+    async def claim_due_scheduled(
+        self,
+        date: datetime,
+        limit: int,
+    ) -> list["Transaction"]:
+        """
+        Lock up to `limit` due scheduled transactions, skipping rows already
+        claimed by another worker.
+        """
+        ...
+
+    @abstractmethod
+    async def lock_pending_by_references(
+        self,
+        references: list[UUID],
+    ) -> list["Transaction"]:
+        """
+        Lock the transactions with these references that are still pending,
+        in a stable order. Already settled ones are left out.
+        """
+        ...
+
+    @abstractmethod
+    async def find_scheduled_settlement_times(self, limit: int) -> list[datetime]:
+        """Earliest delayed_settlement_until values of scheduled transactions"""
+        ...
+
+    @abstractmethod
+    async def update_settlement_status_many(
+        self,
+        ids: list[UUID],
+        status: str,
+    ) -> None: ...
+
     @abstractmethod
     async def get_by_reference_or_none(
         self,
@@ -49,3 +89,46 @@ class ITransactionRepository(Protocol):
         limit: int,
         filter: TransactionFilter | None = None,
     ) -> tuple[List[Transaction], int]: ...
+
+    @abstractmethod
+    async def query_by_user_after(
+        self,
+        limit: int,
+        user_id: UUID,
+        ticket_ids: list[UUID],
+        event: UUID | None,
+        occurrence: UUID | None,
+        after: TransactionCursor | None = None,
+    ) -> List[Transaction]:
+        """
+        Keyset page ordered by (occurred_on, id) descending, starting right
+        after `after` (or at the newest transaction when it is None)
+        """
+        ...
+
+    @abstractmethod
+    async def count_by_user(
+        self,
+        user_id: UUID,
+        ticket_ids: list[UUID],
+        event: UUID | None,
+        occurrence: UUID | None,
+        estimate: bool = False,
+    ) -> int:
+        """Matching rows; `estimate` returns the planner's row estimate instead"""
+        ...
+
+    @abstractmethod
+    async def query_after(
+        self,
+        limit: int,
+        filter: TransactionFilter | None = None,
+        after: TransactionCursor | None = None,
+    ) -> List[Transaction]: ...
+
+    @abstractmethod
+    async def count(
+        self,
+        filter: TransactionFilter | None = None,
+        estimate: bool = False,
+    ) -> int: ...
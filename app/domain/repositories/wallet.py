@@ -1,8 +1,9 @@
-from typing import Protocol
+from typing import Protocol, Optional
 from abc import abstractmethod
+from decimal import Decimal
 from uuid import UUID
 
-from ..entities import Wallet
+from ..entities import Wallet, LedgerEntry
 
 
 class IWalletRepository(Protocol):
@@ -19,3 +20,59 @@ class IWalletRepository(Protocol):
         u: UUID,
         lock_for_update: bool = False,
     ) -> Wallet: ...
+
+    @abstractmethod
+    async def credit(
+        self,
+        u: UUID,
+        amount: Decimal,
+        max_balance: Optional[Decimal] = None,
+        transaction_id: Optional[UUID] = None,
+    ) -> None:
+        """
+        Append a credit to the user's ledger, creating the wallet if needed.
+        Raises AppError when max_balance would be exceeded.
+        """
+        ...
+
+    @abstractmethod
+    async def debit(
+        self,
+        u: UUID,
+        amount: Decimal,
+        transaction_id: Optional[UUID] = None,
+    ) -> None:
+        """
+        Append a debit to the user's ledger.
+        Raises AppError when the available balance is insufficient.
+        """
+        ...
+
+    @abstractmethod
+    async def credit_many(self, entries: list[LedgerEntry]) -> None:
+        """Append credit entries for many users at once, creating missing wallets"""
+        ...
+
+    @abstractmethod
+    async def list_ledger_entries(
+        self,
+        u: UUID,
+        limit: int,
+        before_id: Optional[int] = None,
+    ) -> list[LedgerEntry]:
+        """Newest first, starting below before_id when given"""
+        ...
+
+    @abstractmethod
+    async def find_wallets_to_snapshot(
+        self,
+        min_entries: int,
+        limit: int,
+    ) -> list[UUID]:
+        """Users with at least min_entries ledger entries since their snapshot"""
+        ...
+
+    @abstractmethod
+    async def snapshot_balance(self, u: UUID) -> None:
+        """Fold the user's entries since the last snapshot into a new snapshot"""
+        ...
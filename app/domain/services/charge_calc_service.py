@@ -3,6 +3,7 @@ from uuid import UUID
 from decimal import Decimal
 from datetime import datetime
 
+from app.domain.entities import ChargeSettingVersion
 from app.domain.repositories import (
     IChargeSettingVersionRepository,
     IChargeSettingRepository,
@@ -36,15 +37,54 @@ class ChargeCalculationService:
         Returns:
             Dictionary with tier info and calculated charge
         """
-        # Get appropriate version
-        if at_time:
-            version = await self.version_repo.get_version_at(charge_setting_id, at_time)
-        else:
-            version = await self.version_repo.get_current_version(charge_setting_id)
+        version = await self._get_version(charge_setting_id, at_time)
 
         if version is None:
             return None
 
+        return self._build_breakdown(version, charge_setting_id, base_amount, quantity)
+
+    async def get_charge_breakdowns(
+        self,
+        charge_setting_id: UUID,
+        amounts: list[tuple[Decimal, int]],
+        at_time: Optional[datetime] = None,
+    ) -> Optional[list[dict]]:
+        """
+        Get breakdowns for several (base_amount, quantity) pairs against the
+        same charge setting, resolving the version only once.
+
+        Returns:
+            One breakdown per pair, in order
+        """
+        version = await self._get_version(charge_setting_id, at_time)
+
+        if version is None:
+            return None
+
+        return [
+            self._build_breakdown(version, charge_setting_id, base_amount, quantity)
+            for base_amount, quantity in amounts
+        ]
+
+    async def _get_version(
+        self,
+        charge_setting_id: UUID,
+        at_time: Optional[datetime] = None,
+    ) -> Optional[ChargeSettingVersion]:
+        # Get appropriate version
+        if at_time:
+            return await self.version_repo.get_version_at(charge_setting_id, at_time)
+
+        return await self.version_repo.get_current_version(charge_setting_id)
+
+    def _build_breakdown(
+        self,
+        version: ChargeSettingVersion,
+        charge_setting_id: UUID,
+        base_amount: Decimal,
+        quantity: int,
+    ) -> dict:
         if not version.allow_overlap:
             charge, tiers = version.calculate_charge(base_amount)
             total_charge = charge * quantity
@@ -1,3 +1,25 @@
 from .redis_cache import RedisCacheService, get_RedisCacheService
+from .charge_setting_cache import (
+    ChargeSettingCache,
+    CachedChargeSettingRepository,
+    CachedChargeSettingVersionRepository,
+    get_ChargeSettingCache,
+)
+from .payment_cache import CachedPaymentAdapter
+from .payment_status import PaymentStatusNotifier, get_PaymentStatusNotifier
+from .webhook_filter import WebhookIdempotencyFilter
+from .extra_price_cache import CachedEventService
 
-__all__ = ["RedisCacheService", "get_RedisCacheService"]
+__all__ = [
+    "RedisCacheService",
+    "get_RedisCacheService",
+    "ChargeSettingCache",
+    "CachedChargeSettingRepository",
+    "CachedChargeSettingVersionRepository",
+    "get_ChargeSettingCache",
+    "CachedPaymentAdapter",
+    "PaymentStatusNotifier",
+    "get_PaymentStatusNotifier",
+    "WebhookIdempotencyFilter",
+    "CachedEventService",
+]
@@ -0,0 +1,301 @@
+import asyncio
+import logging
+import time
+from uuid import UUID
+from typing import Optional
+from datetime import datetime, timezone
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.domain.entities import ChargeSetting, ChargeSettingVersion, PriceRangeTier
+from app.domain.repositories import (
+    IChargeSettingRepository,
+    IChargeSettingVersionRepository,
+)
+from .redis_cache import RedisCacheService, get_RedisCacheService
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "charge-settings:invalidate"
+INVALIDATE_ALL = "*"
+
+
+class ChargeSettingCache:
+    """
+    Process-local cache of charge settings (by charge_type) and their current
+    versions (by charge_setting_id).
+
+    Entries expire after a TTL, and a cached version is never served past its
+    own effective_until. Writers publish invalidations over Redis pub/sub so
+    every worker drops its copy once a new version is committed.
+
+    Cached entities are shared between requests and must be treated as read-only.
+    """
+
+    def __init__(self, redis: RedisCacheService, ttl: int = 300) -> None:
+        self._redis = redis
+        self._ttl = ttl
+        self._settings: dict[str, tuple[ChargeSetting, float]] = {}
+        self._versions: dict[UUID, tuple[ChargeSettingVersion, float]] = {}
+        # Bumped on every invalidation so in-flight loads don't store stale rows
+        self._generation = 0
+        self._listener: Optional[asyncio.Task] = None
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    # -------------------------
+    # Lookups
+    # -------------------------
+    def get_setting(self, charge_type: str) -> Optional[ChargeSetting]:
+        entry = self._settings.get(charge_type)
+        if entry is None:
+            return None
+
+        setting, expires_at = entry
+        if time.monotonic() >= expires_at:
+            self._settings.pop(charge_type, None)
+            return None
+
+        return setting
+
+    def put_setting(self, setting: ChargeSetting, generation: int) -> None:
+        if generation != self._generation:
+            return
+
+        self._settings[setting.charge_type] = (
+            setting,
+            time.monotonic() + self._ttl,
+        )
+
+    def get_version(self, charge_setting_id: UUID) -> Optional[ChargeSettingVersion]:
+        entry = self._versions.get(charge_setting_id)
+        if entry is None:
+            return None
+
+        version, expires_at = entry
+        if time.monotonic() >= expires_at or not version.is_active():
+            self._versions.pop(charge_setting_id, None)
+            return None
+
+        return version
+
+    def put_version(self, version: ChargeSettingVersion, generation: int) -> None:
+        if generation != self._generation:
+            return
+
+        ttl = float(self._ttl)
+        if version.effective_until is not None:
+            remaining = (
+                version.effective_until - datetime.now(timezone.utc)
+            ).total_seconds()
+            ttl = min(ttl, remaining)
+
+        if ttl <= 0:
+            return
+
+        self._versions[version.charge_setting_id] = (
+            version,
+            time.monotonic() + ttl,
+        )
+
+    # -------------------------
+    # Invalidation
+    # -------------------------
+    def evict(self, charge_setting_id: Optional[UUID] = None) -> None:
+        """Drop cached entries for one charge setting, or everything"""
+        self._generation += 1
+
+        if charge_setting_id is None:
+            self._settings.clear()
+            self._versions.clear()
+            return
+
+        self._versions.pop(charge_setting_id, None)
+        for charge_type, (setting, _) in list(self._settings.items()):
+            if setting.charge_setting_id == charge_setting_id:
+                self._settings.pop(charge_type, None)
+
+    async def invalidate(self, charge_setting_id: Optional[UUID] = None) -> None:
+        """Evict locally and tell every other worker to do the same"""
+        self.evict(charge_setting_id)
+        message = str(charge_setting_id) if charge_setting_id else INVALIDATE_ALL
+        try:
+            await self._redis.publish(INVALIDATION_CHANNEL, message)
+        except Exception:
+            logger.exception("Failed to publish charge setting invalidation")
+
+    def _handle_message(self, message: str) -> None:
+        if message == INVALIDATE_ALL:
+            self.evict()
+            return
+
+        try:
+            self.evict(UUID(message))
+        except ValueError:
+            logger.warning(f"Ignoring malformed charge invalidation: {message}")
+            self.evict()
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async for message in self._redis.subscribe(INVALIDATION_CHANNEL):
+                    self._handle_message(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Charge invalidation listener failed, retrying")
+                # Anything may have changed while we were disconnected
+                self.evict()
+                await asyncio.sleep(1)
+
+    def start(self) -> None:
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is None:
+            return
+
+        self._listener.cancel()
+        try:
+            await self._listener
+        except asyncio.CancelledError:
+            pass
+        self._listener = None
+
+
+class CachedChargeSettingRepository(IChargeSettingRepository):
+    """Read-through cache in front of a charge setting repository"""
+
+    def __init__(
+        self,
+        inner: IChargeSettingRepository,
+        cache: ChargeSettingCache,
+    ) -> None:
+        self._inner = inner
+        self._cache = cache
+
+    async def get_by_id(self, charge_setting_id: UUID) -> ChargeSetting:
+        return await self._inner.get_by_id(charge_setting_id)
+
+    async def get_by_type(self, charge_type: str) -> ChargeSetting:
+        cached = self._cache.get_setting(charge_type)
+        if cached is not None:
+            return cached
+
+        generation = self._cache.generation
+        setting = await self._inner.get_by_type(charge_type)
+        self._cache.put_setting(setting, generation)
+
+        return setting
+
+    def save(self, charge_setting: ChargeSetting) -> None:
+        self._inner.save(charge_setting)
+
+    async def list_all(self, active_only: bool = True) -> list[ChargeSetting]:
+        return await self._inner.list_all(active_only)
+
+    async def delete_all(self) -> None:
+        await self._inner.delete_all()
+
+
+class CachedChargeSettingVersionRepository(IChargeSettingVersionRepository):
+    """
+    Read-through cache for current versions.
+    add_version publishes an invalidation once the surrounding session commits.
+    """
+
+    def __init__(
+        self,
+        inner: IChargeSettingVersionRepository,
+        cache: ChargeSettingCache,
+        session: AsyncSession,
+    ) -> None:
+        self._inner = inner
+        self._cache = cache
+        self._session = session
+
+    async def get_by_id(self, version_id: UUID) -> ChargeSettingVersion:
+        return await self._inner.get_by_id(version_id)
+
+    async def get_current_version(
+        self, charge_setting_id: UUID
+    ) -> Optional[ChargeSettingVersion]:
+        cached = self._cache.get_version(charge_setting_id)
+        if cached is not None:
+            return cached
+
+        generation = self._cache.generation
+        version = await self._inner.get_current_version(charge_setting_id)
+        if version is not None:
+            self._cache.put_version(version, generation)
+
+        return version
+
+    async def get_version_at(
+        self, charge_setting_id: UUID, at_time: datetime
+    ) -> Optional[ChargeSettingVersion]:
+        cached = self._cache.get_version(charge_setting_id)
+        if cached is not None and cached.is_active(at_time):
+            return cached
+
+        return await self._inner.get_version_at(charge_setting_id, at_time)
+
+    async def get_version_by_number(
+        self, charge_setting_id: UUID, version_number: int
+    ) -> Optional[ChargeSettingVersion]:
+        return await self._inner.get_version_by_number(
+            charge_setting_id, version_number
+        )
+
+    async def get_version_history(
+        self, charge_setting_id: UUID, limit: Optional[int] = None, offset: int = 0
+    ) -> list[ChargeSettingVersion]:
+        return await self._inner.get_version_history(charge_setting_id, limit, offset)
+
+    async def add_version(
+        self,
+        charge_setting_id: UUID,
+        tiers: list[PriceRangeTier],
+        effective_from: datetime,
+        created_by: str,
+        change_reason: Optional[str] = None,
+    ) -> ChargeSettingVersion:
+        version = await self._inner.add_version(
+            charge_setting_id,
+            tiers,
+            effective_from,
+            created_by,
+            change_reason,
+        )
+
+        def on_commit(_):
+            asyncio.get_running_loop().create_task(
+                self._cache.invalidate(charge_setting_id)
+            )
+
+        event.listen(self._session.sync_session, "after_commit", on_commit, once=True)
+
+        return version
+
+    def save(self, version: ChargeSettingVersion) -> None:
+        self._inner.save(version)
+
+    async def count_versions(self, charge_setting_id: UUID) -> int:
+        return await self._inner.count_versions(charge_setting_id)
+
+
+_cache: ChargeSettingCache | None = None
+
+
+def get_ChargeSettingCache() -> ChargeSettingCache:
+    global _cache
+    if _cache is None:
+        _cache = ChargeSettingCache(
+            get_RedisCacheService(),
+            ttl=settings.charge_cache_ttl_seconds,
+        )
+    return _cache
@@ -0,0 +1,82 @@
+import logging
+from uuid import UUID
+from decimal import Decimal
+
+from app.domain.dto.event import ExtraDto, ExtraPriceKey
+from app.domain.ports import IEventService
+from .redis_cache import RedisCacheService
+
+logger = logging.getLogger(__name__)
+
+
+class CachedEventService(IEventService):
+    """
+    Caches extra prices by (extra_id, extra_version, ticket_type_id).
+
+    A version's price never changes, so prices are kept in Redis, shared by
+    every worker, and a quote only asks the event service for the ones no
+    worker has seen within the TTL. The TTL bounds how long an extra that
+    was switched off can still be quoted. Extras that were not found are
+    never cached, and a Redis failure falls through to the event service.
+    """
+
+    def __init__(
+        self,
+        inner: IEventService,
+        cache: RedisCacheService,
+        ttl: int = 300,
+    ) -> None:
+        self._inner = inner
+        self._cache = cache
+        self._ttl = ttl
+
+    @staticmethod
+    def _key(key: ExtraPriceKey) -> str:
+        return f"extras:price:{key.extra_id}:{key.extra_version}:{key.ticket_type_id}"
+
+    async def _get_cached(
+        self,
+        keys: list[ExtraPriceKey],
+    ) -> dict[ExtraPriceKey, Decimal]:
+        try:
+            raw = await self._cache.get_many_json([self._key(key) for key in keys])
+        except Exception as e:
+            logger.warning(f"Extra price cache read failed: {e}")
+            return {}
+
+        return {key: Decimal(price) for key, price in zip(keys, raw) if price}
+
+    async def _put_cached(self, prices: dict[ExtraPriceKey, Decimal]) -> None:
+        try:
+            await self._cache.set_many_json(
+                {self._key(key): str(price) for key, price in prices.items()},
+                self._ttl,
+            )
+        except Exception as e:
+            logger.warning(f"Extra price cache write failed: {e}")
+
+    async def get_extra_prices(
+        self,
+        keys: list[ExtraPriceKey],
+    ) -> dict[ExtraPriceKey, Decimal]:
+        prices = await self._get_cached(keys)
+
+        missing = [key for key in keys if key not in prices]
+        if missing:
+            fetched = await self._inner.get_extra_prices(missing)
+            await self._put_cached(fetched)
+            prices.update(fetched)
+
+        return prices
+
+    async def get_active_extra_for_ticket(
+        self,
+        extra_id: UUID,
+        extra_version: int,
+        ticket_type_id: UUID,
+    ) -> ExtraDto | None:
+        return await self._inner.get_active_extra_for_ticket(
+            extra_id,
+            extra_version,
+            ticket_type_id,
+        )
@@ -0,0 +1,152 @@
+import time
+import asyncio
+import logging
+from decimal import Decimal
+from typing import Optional
+
+from app.config import settings
+from app.domain.dto import ExternalTransaction, PersonalAccount, BankItem
+from app.domain.ports import IPaymentAdapter
+from .redis_cache import RedisCacheService
+
+logger = logging.getLogger(__name__)
+
+# How often a caller waiting on another worker's verification re-checks Redis
+LOCK_POLL_INTERVAL = 0.05
+
+
+class CachedPaymentAdapter(IPaymentAdapter):
+    """
+    Caches successful payment verifications by reference.
+
+    A verified payment never changes, so it is kept in Redis and polls after
+    the first success are served without calling the provider. Concurrent
+    verifications of one reference are collapsed twice over: callers in this
+    worker share a single in-flight call, and workers take a short Redis lock
+    so only one of them calls the provider while the rest wait for its
+    result. Unsuccessful verifications are never cached, since a pending
+    payment may still succeed.
+    """
+
+    def __init__(self, inner: IPaymentAdapter, cache: RedisCacheService) -> None:
+        self._inner = inner
+        self._cache = cache
+        self._inflight: dict[str, asyncio.Future[ExternalTransaction]] = {}
+
+    @staticmethod
+    def _key(reference: str) -> str:
+        return f"payments:verified:{reference}"
+
+    async def _get_cached(self, reference: str) -> Optional[ExternalTransaction]:
+        try:
+            raw = await self._cache.get_json(self._key(reference))
+        except Exception as e:
+            logger.warning(f"Verified payment cache read failed: {e}")
+            return None
+
+        return ExternalTransaction.model_validate(raw) if raw else None
+
+    async def _put_cached(self, txn: ExternalTransaction) -> None:
+        try:
+            await self._cache.set_json(
+                self._key(str(txn.reference)),
+                txn.model_dump(mode="json"),
+                settings.verified_payment_cache_ttl_seconds,
+            )
+        except Exception as e:
+            logger.warning(f"Verified payment cache write failed: {e}")
+
+    async def _try_lock(self, reference: str) -> Optional[bool]:
+        """True when acquired, False when held elsewhere, None if Redis failed"""
+        try:
+            return await self._cache.acquire_lock(
+                f"payments:verify:{reference}",
+                settings.verified_payment_lock_ttl_seconds,
+            )
+        except Exception as e:
+            logger.warning(f"Verified payment lock failed: {e}")
+            return None
+
+    async def _verify(self, reference: str) -> ExternalTransaction:
+        deadline = time.monotonic() + settings.verified_payment_lock_ttl_seconds
+
+        locked = await self._try_lock(reference)
+        while locked is False:
+            # Another worker is asking the provider: wait for its result
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+
+            cached = await self._get_cached(reference)
+            if cached is not None:
+                return cached
+
+            if time.monotonic() >= deadline:
+                # Its call failed or is stuck: verify here instead
+                break
+
+            locked = await self._try_lock(reference)
+
+        try:
+            cached = await self._get_cached(reference)
+            if cached is not None:
+                return cached
+
+            txn = await self._inner.get_valid_transaction(reference)
+            await self._put_cached(txn)
+
+            return txn
+        finally:
+            if locked:
+                await self._cache.release_lock(f"payments:verify:{reference}")
+
+    async def get_valid_transaction(self, reference: str) -> ExternalTransaction:
+        cached = await self._get_cached(reference)
+        if cached is not None:
+            return cached
+
+        future = self._inflight.get(reference)
+        if future is None:
+            future = asyncio.ensure_future(self._verify(reference))
+            self._inflight[reference] = future
+            future.add_done_callback(lambda _: self._inflight.pop(reference, None))
+
+        # A caller going away must not cancel the call the others wait on
+        return await asyncio.shield(future)
+
+    async def create_checkout_link(
+        self,
+        email: str,
+        amount: Decimal,
+        callback_url: str,
+        reference: str,
+        metadata: Optional[dict] = None,
+    ) -> str:
+        return await self._inner.create_checkout_link(
+            email,
+            amount,
+            callback_url,
+            reference,
+            metadata,
+        )
+
+    async def resolve_personal_bank(self, bank: str, account: str) -> PersonalAccount:
+        return await self._inner.resolve_personal_bank(bank, account)
+
+    async def list_banks(self) -> list[BankItem]:
+        return await self._inner.list_banks()
+
+    async def withdraw(
+        self,
+        amount: Decimal,
+        recipient_id: str,
+        ref: str,
+        reason: str,
+    ):
+        return await self._inner.withdraw(amount, recipient_id, ref, reason)
+
+    async def add_recipient(
+        self,
+        account_number: str,
+        account_name: str,
+        bank_code: str,
+    ) -> str:
+        return await self._inner.add_recipient(account_number, account_name, bank_code)
@@ -0,0 +1,252 @@
+import json
+import time
+import asyncio
+import logging
+from typing import AsyncIterator, Optional
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.shared.errors import AppError
+from app.shared.metrics import gauge_metric, latency_metric
+from .redis_cache import RedisCacheService, get_RedisCacheService
+
+logger = logging.getLogger(__name__)
+
+STATUS_CHANNEL = "payments:status"
+
+# In the order a payment moves through them; a status never goes backwards
+PAYMENT_STATUSES = ("pending", "paid", "settled")
+FINAL_STATUS = "settled"
+
+
+def _rank(status: Optional[str]) -> int:
+    return PAYMENT_STATUSES.index(status) if status in PAYMENT_STATUSES else 0
+
+
+class PaymentStatusNotifier:
+    """
+    Pushes payment status changes to clients waiting on a reference.
+
+    The latest status of a reference is kept in Redis, so a client that
+    connects after the change still sees it, and every change is published
+    over Redis pub/sub. Each worker runs one listener that hands changes to
+    the connections it holds, so a waiting client costs a queue rather than
+    a Redis connection or repeated verify calls.
+
+    Open connections per worker are capped; past the cap clients are told
+    to poll instead.
+    """
+
+    def __init__(
+        self,
+        redis: RedisCacheService,
+        max_connections: int = 500,
+        ttl: int = 86400,
+    ) -> None:
+        self._redis = redis
+        self._max_connections = max_connections
+        self._ttl = ttl
+        self._waiters: dict[str, set[asyncio.Queue[str]]] = {}
+        self._listener: Optional[asyncio.Task] = None
+        self._connections = gauge_metric("payment_status.connections")
+        self._rejected = gauge_metric("payment_status.rejected")
+        self._duration = latency_metric("payment_status.connection_time")
+
+    @staticmethod
+    def _key(reference: str) -> str:
+        return f"payments:status:{reference}"
+
+    # -------------------------
+    # Publishing
+    # -------------------------
+    async def get_status(self, reference: str) -> str:
+        status = await self._redis.get(self._key(reference))
+        return status if status in PAYMENT_STATUSES else "pending"
+
+    async def publish(self, reference: str, status: str) -> None:
+        """Record the status and wake every worker's waiters on the reference"""
+        try:
+            if _rank(status) <= _rank(await self.get_status(reference)):
+                return
+
+            await self._redis.set(self._key(reference), status, self._ttl)
+            await self._redis.publish(
+                STATUS_CHANNEL,
+                json.dumps({"reference": reference, "status": status}),
+            )
+        except Exception:
+            logger.exception(f"Failed to publish payment status for {reference}")
+
+    def publish_on_commit(
+        self,
+        session: AsyncSession,
+        reference: str,
+        status: str,
+    ) -> None:
+        """Publish once the session commits, so woken clients see the rows"""
+
+        def on_commit(_):
+            asyncio.get_running_loop().create_task(self.publish(reference, status))
+
+        event.listen(session.sync_session, "after_commit", on_commit, once=True)
+
+    # -------------------------
+    # Waiting
+    # -------------------------
+    def check_capacity(self) -> None:
+        if self._connections.value >= self._max_connections:
+            self._rejected.inc()
+            raise AppError("Too many clients waiting, poll instead", 503)
+
+    def _register(self, reference: str) -> asyncio.Queue[str]:
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        self._waiters.setdefault(reference, set()).add(queue)
+        self._connections.inc()
+        return queue
+
+    def _unregister(self, reference: str, queue: asyncio.Queue[str]) -> None:
+        self._connections.dec()
+        waiters = self._waiters.get(reference)
+        if waiters is None:
+            return
+
+        waiters.discard(queue)
+        if not waiters:
+            self._waiters.pop(reference, None)
+
+    async def _next(
+        self,
+        reference: str,
+        queue: asyncio.Queue[str],
+        after: Optional[str],
+        timeout: float,
+    ) -> Optional[str]:
+        """The first status past after, or None if none came within timeout"""
+        deadline = time.monotonic() + timeout
+
+        # Registered before reading the store, so no change can slip between
+        status = await self.get_status(reference)
+        while _rank(status) <= _rank(after):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+
+            try:
+                status = await asyncio.wait_for(queue.get(), remaining)
+            except asyncio.TimeoutError:
+                # A change published while the listener was reconnecting
+                # only reached the store
+                status = await self.get_status(reference)
+                if _rank(status) <= _rank(after):
+                    return None
+
+        return status
+
+    async def wait(
+        self,
+        reference: str,
+        after: Optional[str] = None,
+        timeout: float = 25,
+    ) -> str:
+        """Long-poll: return once the status moves past after, or on timeout"""
+        self.check_capacity()
+
+        started = time.monotonic()
+        queue = self._register(reference)
+        try:
+            status = await self._next(reference, queue, after, timeout)
+            return status or await self.get_status(reference)
+        finally:
+            self._unregister(reference, queue)
+            self._duration.observe(time.monotonic() - started)
+
+    async def stream(
+        self,
+        reference: str,
+        duration: float,
+        heartbeat: float,
+    ) -> AsyncIterator[Optional[str]]:
+        """
+        Yield the current status and then each change, until the final status
+        or duration runs out. Yields None every heartbeat so idle connections
+        stay open. Call check_capacity before starting the response.
+        """
+        started = time.monotonic()
+        deadline = started + duration
+        queue = self._register(reference)
+        try:
+            status: Optional[str] = await self.get_status(reference)
+            yield status
+
+            while status != FINAL_STATUS:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+
+                changed = await self._next(
+                    reference,
+                    queue,
+                    status,
+                    min(heartbeat, remaining),
+                )
+                if changed is not None:
+                    status = changed
+                yield changed
+        finally:
+            self._unregister(reference, queue)
+            self._duration.observe(time.monotonic() - started)
+
+    # -------------------------
+    # Listener
+    # -------------------------
+    def _handle_message(self, message: str) -> None:
+        try:
+            change = json.loads(message)
+            reference, status = change["reference"], change["status"]
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Ignoring malformed payment status: {message}")
+            return
+
+        for queue in self._waiters.get(reference, ()):
+            queue.put_nowait(status)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async for message in self._redis.subscribe(STATUS_CHANNEL):
+                    self._handle_message(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Payment status listener failed, retrying")
+                await asyncio.sleep(1)
+
+    def start(self) -> None:
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is None:
+            return
+
+        self._listener.cancel()
+        try:
+            await self._listener
+        except asyncio.CancelledError:
+            pass
+        self._listener = None
+
+
+_notifier: PaymentStatusNotifier | None = None
+
+
+def get_PaymentStatusNotifier() -> PaymentStatusNotifier:
+    global _notifier
+    if _notifier is None:
+        _notifier = PaymentStatusNotifier(
+            get_RedisCacheService(),
+            max_connections=settings.payment_status_max_connections,
+            ttl=settings.payment_status_ttl_seconds,
+        )
+    return _notifier
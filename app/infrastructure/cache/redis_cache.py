@@ -1,6 +1,6 @@
 import json
 import functools
-from typing import Optional, Any, Callable, Awaitable, TypeVar
+from typing import Optional, Any, AsyncIterator, Callable, Awaitable, TypeVar
 from redis.asyncio import Redis
 import inspect
 
@@ -57,6 +57,12 @@ class RedisCacheService(ICacheService):
             value = str(value)
         await self._redis.set(self._k(key), value, ex=ttl)
 
+    async def set_if_absent(self, key: str, value: Any, ttl: int = 60) -> bool:
+        """SET NX: True if the key was written, False if it already existed"""
+        if not isinstance(value, (str, bytes, int)):
+            value = str(value)
+        return await self._redis.set(self._k(key), value, nx=True, ex=ttl) is True
+
     async def delete(self, key: str) -> None:
         await self._redis.delete(self._k(key))
 
@@ -78,6 +84,29 @@ class RedisCacheService(ICacheService):
     async def set_json(self, key: str, value: Any, ttl: int = 60) -> None:
         await self._redis.set(self._k(key), json.dumps(value), ex=ttl)
 
+    async def get_many_json(self, keys: list[str]) -> list[Optional[Any]]:
+        """MGET: one value per key, None where missing or not JSON"""
+        if not keys:
+            return []
+
+        values = []
+        for raw in await self._redis.mget([self._k(key) for key in keys]):
+            try:
+                values.append(json.loads(raw) if raw is not None else None)
+            except Exception:
+                values.append(None)
+        return values
+
+    async def set_many_json(self, items: dict[str, Any], ttl: int = 60) -> None:
+        """Set several keys in one round trip"""
+        if not items:
+            return
+
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(self._k(key), json.dumps(value), ex=ttl)
+            await pipe.execute()
+
     # -------------------------
     # Distributed lock
     # -------------------------
@@ -89,6 +118,25 @@ class RedisCacheService(ICacheService):
     async def release_lock(self, key: str) -> None:
         await self._redis.delete(self._k(f"lock:{key}"))
 
+    # -------------------------
+    # Pub/Sub
+    # -------------------------
+    async def publish(self, channel: str, message: str) -> None:
+        await self._redis.publish(self._k(channel), message)
+
+    async def subscribe(self, channel: str) -> AsyncIterator[str]:
+        """Yield messages published on a namespaced channel until cancelled"""
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self._k(channel))
+        try:
+            async for message in pubsub.listen():
+                data = message.get("data")
+                if isinstance(data, bytes):
+                    data = data.decode()
+                yield data
+        finally:
+            await pubsub.aclose()
+
     # -------------------------
     # Cache decorator
     # -------------------------
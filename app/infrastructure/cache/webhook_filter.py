@@ -0,0 +1,60 @@
+import logging
+
+from .redis_cache import RedisCacheService
+
+logger = logging.getLogger(__name__)
+
+PROCESSING = "processing"
+DONE = "done"
+
+
+class WebhookIdempotencyFilter:
+    """
+    Drops redelivered webhooks before they are parsed or touch the database.
+
+    The first delivery of a key claims it with a short in-flight marker; a
+    duplicate arriving meanwhile or after the work is done finds the key
+    taken, so it costs one Redis round trip. Completing the work keeps the
+    key for the dedupe TTL. Failing releases it so the provider's retry is
+    processed, and a crashed worker's marker expires on its own.
+
+    Redis being unavailable lets every delivery through, as before.
+    """
+
+    def __init__(
+        self,
+        redis: RedisCacheService,
+        ttl: int = 86400,
+        inflight_ttl: int = 60,
+    ) -> None:
+        self._redis = redis
+        self._ttl = ttl
+        self._inflight_ttl = inflight_ttl
+
+    @staticmethod
+    def _key(key: str) -> str:
+        return f"webhooks:seen:{key}"
+
+    async def claim(self, key: str) -> bool:
+        """True if this delivery should be processed"""
+        try:
+            return await self._redis.set_if_absent(
+                self._key(key),
+                PROCESSING,
+                self._inflight_ttl,
+            )
+        except Exception as e:
+            logger.warning(f"Webhook idempotency claim failed: {e}")
+            return True
+
+    async def complete(self, key: str) -> None:
+        try:
+            await self._redis.set(self._key(key), DONE, self._ttl)
+        except Exception as e:
+            logger.warning(f"Webhook idempotency completion failed: {e}")
+
+    async def release(self, key: str) -> None:
+        try:
+            await self._redis.delete(self._key(key))
+        except Exception as e:
+            logger.warning(f"Webhook idempotency release failed: {e}")
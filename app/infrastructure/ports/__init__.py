@@ -3,6 +3,15 @@ from .grpc_user_service import GrpcUserService
 from .paystack_adapter import PaystackAdapter
 from .kafka_event_bus import KafkaEventBus
 from .http_event_service import HttpEventService
+from .outbox_event_bus import OutboxEventBus
+from .bcrypt_pin_hasher import BcryptPinHasher
+from .paystack_webhook import (
+    PaystackWebhookProcessor,
+    verify_paystack_signature,
+    enqueue_paystack_webhook,
+    paystack_webhook_key,
+    decode_paystack_webhook,
+)
 
 __all__ = [
     "GrpcTicketService",
@@ -10,4 +19,11 @@ __all__ = [
     "PaystackAdapter",
     "KafkaEventBus",
     "HttpEventService",
+    "OutboxEventBus",
+    "BcryptPinHasher",
+    "PaystackWebhookProcessor",
+    "verify_paystack_signature",
+    "enqueue_paystack_webhook",
+    "paystack_webhook_key",
+    "decode_paystack_webhook",
 ]
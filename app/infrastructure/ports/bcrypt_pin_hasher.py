@@ -0,0 +1,92 @@
+import time
+import asyncio
+import logging
+import bcrypt  # type: ignore
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from app.config import settings
+from app.domain.ports import IPinHasher
+from app.shared.metrics import latency_metric
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BcryptPinHasher(IPinHasher):
+    """
+    Runs bcrypt on a small dedicated thread pool. bcrypt releases the GIL,
+    so the event loop keeps serving other requests while a PIN is checked.
+
+    The time a PIN operation spends queued for a free thread is recorded as
+    the pin_hasher.queue_wait metric: a growing wait means the pool is too
+    small for the PIN traffic, or the cost factor too high.
+    """
+
+    def __init__(self, rounds: int, max_workers: int) -> None:
+        self._rounds = rounds
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="pin-hasher",
+        )
+        self._queue_wait = latency_metric("pin_hasher.queue_wait")
+        self._run_time = latency_metric("pin_hasher.run_time")
+
+    async def _run(self, fn: Callable[..., T], *args) -> T:
+        submitted = time.perf_counter()
+
+        def task() -> T:
+            started = time.perf_counter()
+            self._queue_wait.observe(started - submitted)
+            try:
+                return fn(*args)
+            finally:
+                self._run_time.observe(time.perf_counter() - started)
+
+        return await asyncio.get_running_loop().run_in_executor(self._executor, task)
+
+    async def hash(self, pin: str) -> str:
+        hashed = await self._run(
+            bcrypt.hashpw,
+            pin.encode("utf-8"),
+            bcrypt.gensalt(rounds=self._rounds),
+        )
+        return hashed.decode("utf-8")
+
+    async def verify(self, pin: str, hashed: str) -> bool:
+        # The cost factor is read from the hash, so PINs hashed before a
+        # change of pin_hash_rounds keep verifying
+        return await self._run(
+            bcrypt.checkpw,
+            pin.encode("utf-8"),
+            hashed.encode("utf-8"),
+        )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_hasher: BcryptPinHasher | None = None
+
+
+def get_BcryptPinHasher() -> BcryptPinHasher:
+    global _hasher
+    if _hasher is None:
+        logger.info(
+            "Initialize PIN hasher (rounds=%s, workers=%s)",
+            settings.pin_hash_rounds,
+            settings.pin_hash_max_workers,
+        )
+        _hasher = BcryptPinHasher(
+            rounds=settings.pin_hash_rounds,
+            max_workers=settings.pin_hash_max_workers,
+        )
+    return _hasher
+
+
+def dispose_BcryptPinHasher() -> None:
+    global _hasher
+    if _hasher is not None:
+        _hasher.shutdown()
+        _hasher = None
@@ -286,6 +286,19 @@ class GrpcTicketService(ITicketService):
             # Catch any other errors
             raise AppError(f"Unexpected error: {str(e)}", 500)
 
+    async def get_ticket_prices(
+        self,
+        ticket_type_ids: list[str],
+    ) -> dict[str, Decimal]:
+        """Fetch prices for several ticket types concurrently, one call per id"""
+        unique_ids = list(dict.fromkeys(ticket_type_ids))
+
+        prices = await asyncio.gather(
+            *(self.get_ticket_price(ticket_type_id) for ticket_type_id in unique_ids)
+        )
+
+        return dict(zip(unique_ids, prices))
+
     async def create_gate_ticket(
         self,
         ticket_type_id: str,
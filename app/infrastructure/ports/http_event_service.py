@@ -1,13 +1,29 @@
+import asyncio
+import logging
 from uuid import UUID
+from decimal import Decimal
 
-from app.domain.dto.event import ExtraDto
+from app.domain.dto.event import ExtraDto, ExtraPriceKey
+from app.shared.errors import InternalAppError
 from app.utils.external_api_client import ExternalAPIClient
 from app.domain.ports import IEventService
 
+logger = logging.getLogger(__name__)
+
+# Answers meaning the event service has no bulk extras endpoint yet
+BULK_UNSUPPORTED_STATUS_CODES = (404, 405, 501)
+
 
 class HttpEventService(IEventService):
-    def __init__(self, client: ExternalAPIClient) -> None:
+    def __init__(
+        self,
+        client: ExternalAPIClient,
+        max_concurrency: int = 8,
+        bulk_lookup: bool = False,
+    ) -> None:
         self.client = client
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._bulk_lookup = bulk_lookup
 
     async def get_active_extra_for_ticket(
         self,
@@ -27,6 +43,7 @@ class HttpEventService(IEventService):
                     "extra_version": extra_version,
                     "ticket_type_id": ticket_type_id,
                 },
+                hedge=True,
             )
 
             if not result:
@@ -36,3 +53,61 @@ class HttpEventService(IEventService):
         except Exception as e:
             print(f"Error: {str(e)}")
             raise
+
+    async def get_extra_prices(
+        self,
+        keys: list[ExtraPriceKey],
+    ) -> dict[ExtraPriceKey, Decimal]:
+        """
+        One bulk call when the event service supports it, otherwise one call
+        per extra with at most max_concurrency in flight across requests.
+        """
+        if not keys:
+            return {}
+
+        if self._bulk_lookup:
+            try:
+                return await self._get_extra_prices_bulk(keys)
+            except InternalAppError as e:
+                if e.status_code not in BULK_UNSUPPORTED_STATUS_CODES:
+                    raise
+
+                logger.warning(
+                    "Event service has no bulk extras lookup (%s), "
+                    "looking extras up one by one",
+                    e.status_code,
+                )
+                self._bulk_lookup = False
+
+        async def lookup(key: ExtraPriceKey) -> ExtraDto | None:
+            async with self._semaphore:
+                return await self.get_active_extra_for_ticket(*key)
+
+        extras = await asyncio.gather(*(lookup(key) for key in keys))
+
+        return {key: extra.price for key, extra in zip(keys, extras) if extra}
+
+    async def _get_extra_prices_bulk(
+        self,
+        keys: list[ExtraPriceKey],
+    ) -> dict[ExtraPriceKey, Decimal]:
+        # A read sent as POST for the body, so safe to retry
+        result = await self.client.post(
+            endpoint="/system/extras/ticket/lookup",
+            data={
+                "extras": [
+                    {
+                        "extra_id": str(key.extra_id),
+                        "extra_version": key.extra_version,
+                        "ticket_type_id": str(key.ticket_type_id),
+                    }
+                    for key in keys
+                ]
+            },
+            idempotent=True,
+        )
+
+        # One entry per requested extra, in order, null when not active
+        extras = [ExtraDto.model_validate(item) if item else None for item in result]
+
+        return {key: extra.price for key, extra in zip(keys, extras) if extra}
@@ -1,9 +1,21 @@
 import asyncio
 import json
-from typing import Type, Callable, Dict, List, Any, cast
+from collections import deque
+from typing import (
+    Type,
+    Callable,
+    Awaitable,
+    Dict,
+    List,
+    Any,
+    Optional,
+    Sequence,
+    cast,
+)
 import logging
 
 from aiokafka import AIOKafkaConsumer, AIOKafkaProducer, ConsumerRecord, TopicPartition  # type: ignore
+from aiokafka.abc import ConsumerRebalanceListener  # type: ignore
 
 from app.domain.events.base import DomainEvent
 from app.domain.events.registry import EventRegistry
@@ -14,6 +26,118 @@ from app.shared.errors import AppError
 logger = logging.getLogger(__name__)
 logging.getLogger("aiokafka").setLevel(logging.CRITICAL)
 
+PARTITION_DRAIN_TIMEOUT_SECONDS = 30
+
+
+class _PartitionWorker:
+    """
+    Processes the messages of a single topic partition.
+
+    Messages that share a key (the event aggregate_id) are handled strictly in
+    offset order, while different keys run concurrently up to max_in_flight.
+    Only the contiguous prefix of finished offsets is ever committed.
+    """
+
+    def __init__(
+        self,
+        tp: TopicPartition,
+        handle: Callable[[ConsumerRecord], Awaitable[None]],
+        commit: Callable[[TopicPartition, int], Awaitable[None]],
+        on_capacity: Callable[[TopicPartition], None],
+        max_in_flight: int,
+    ) -> None:
+        self.tp = tp
+        self._handle = handle
+        self._commit = commit
+        self._on_capacity = on_capacity
+        self._max_in_flight = max_in_flight
+
+        self._pending: deque[int] = deque()
+        self._done: set[int] = set()
+        self._key_tails: Dict[Any, asyncio.Task] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._commit_lock = asyncio.Lock()
+        self._committed: Optional[int] = None
+
+    @property
+    def is_full(self) -> bool:
+        return len(self._pending) >= self._max_in_flight
+
+    def submit(self, message: ConsumerRecord) -> None:
+        self._pending.append(message.offset)
+
+        previous = self._key_tails.get(message.key)
+        task = asyncio.create_task(self._run(message, previous))
+        self._key_tails[message.key] = task
+
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, message: ConsumerRecord, previous: Optional[asyncio.Task]):
+        try:
+            # Preserve per-key ordering
+            if previous is not None:
+                await asyncio.wait([previous])
+
+            try:
+                await self._handle(message)
+            except Exception as e:
+                logger.error(
+                    f"Unhandled error for {message.topic}[{message.partition}] "
+                    f"offset {message.offset}: {e}",
+                    exc_info=True,
+                )
+
+            self._done.add(message.offset)
+            await self._advance()
+        finally:
+            if self._key_tails.get(message.key) is asyncio.current_task():
+                del self._key_tails[message.key]
+
+    async def _advance(self):
+        offset = None
+        while self._pending and self._pending[0] in self._done:
+            offset = self._pending.popleft()
+            self._done.discard(offset)
+
+        if not self.is_full:
+            self._on_capacity(self.tp)
+
+        if offset is None:
+            return
+
+        async with self._commit_lock:
+            # A later completion may already have committed past this offset
+            if self._committed is not None and offset <= self._committed:
+                return
+
+            await self._commit(self.tp, offset + 1)
+            self._committed = offset
+
+    async def drain(self, timeout: float) -> None:
+        """Wait for in-flight messages, cancelling whatever is left after timeout"""
+        if not self._tasks:
+            return
+
+        _, still_running = await asyncio.wait(set(self._tasks), timeout=timeout)
+
+        for task in still_running:
+            task.cancel()
+
+        if still_running:
+            await asyncio.wait(still_running)
+
+
+class _PartitionRebalanceListener(ConsumerRebalanceListener):
+    def __init__(self, bus: "KafkaEventBus") -> None:
+        self._bus = bus
+
+    async def on_partitions_revoked(self, revoked):
+        await self._bus._release_partitions(list(revoked))
+
+    async def on_partitions_assigned(self, assigned):
+        pass
+
 
 class KafkaEventBus(IEventBus):
 
@@ -23,11 +147,24 @@ class KafkaEventBus(IEventBus):
         group_id: str,
         auto_offset_reset: str = "earliest",
         enable_auto_commit: bool = False,
+        consumer_mode: str = "partitioned",
+        max_in_flight_per_partition: int = 16,
+        linger_ms: int = 0,
+        max_batch_size: int = 16384,
+        compression_type: Optional[str] = None,
     ):
         self.bootstrap_servers = bootstrap_servers
         self.group_id = group_id
         self.auto_offset_reset = auto_offset_reset
         self.enable_auto_commit = enable_auto_commit
+        self.consumer_mode = consumer_mode
+        self.max_in_flight_per_partition = max_in_flight_per_partition
+        self.linger_ms = linger_ms
+        self.max_batch_size = max_batch_size
+        self.compression_type = compression_type
+
+        # Per-partition workers used by the partitioned consumer mode
+        self._partition_workers: Dict[TopicPartition, _PartitionWorker] = {}
 
         # Event handlers registry
         self._handlers: Dict[str, List[Callable[[DomainEvent[Any]], None]]] = {}
@@ -45,6 +182,9 @@ class KafkaEventBus(IEventBus):
                     bootstrap_servers=self.bootstrap_servers,
                     value_serializer=lambda v: v.encode("utf-8"),
                     key_serializer=lambda v: v.encode("utf-8") if v else None,
+                    linger_ms=self.linger_ms,
+                    max_batch_size=self.max_batch_size,
+                    compression_type=self.compression_type,
                 )
 
             await self._producer.start()
@@ -123,6 +263,38 @@ class KafkaEventBus(IEventBus):
             logger.error(f"Failed to publish event {event.__class__.__name__}: {e}")
             raise
 
+    async def publish_many(self, events: Sequence[DomainEvent]):
+        """
+        Publish several domain events in one go.
+        All events are queued on the producer before waiting, so they share
+        broker round trips instead of paying one each.
+        """
+        await self.send_many(
+            [(event.event_type, event.aggregate_id, event.to_json()) for event in events]
+        )
+
+    async def send_many(self, records: Sequence[tuple[str, Optional[str], str]]):
+        """Send pre-serialized (topic, key, value) records and wait for delivery"""
+        if not records:
+            return
+
+        if not self._producer:
+            raise RuntimeError("Event bus not connected")
+
+        try:
+            deliveries = [
+                await self._producer.send(topic=topic, value=value, key=key)
+                for topic, key, value in records
+            ]
+
+            await asyncio.gather(*deliveries)
+
+            logger.debug(f"Published {len(records)} events")
+
+        except Exception as e:
+            logger.error(f"Failed to publish {len(records)} events: {e}")
+            raise
+
     async def subscribe(
         self,
         event_type: Type[DomainEvent],
@@ -147,10 +319,19 @@ class KafkaEventBus(IEventBus):
 
         await self._consumer.start()
 
-        self._consumer.subscribe(topics)
+        if self.consumer_mode == "partitioned":
+            self._consumer.subscribe(
+                topics,
+                listener=_PartitionRebalanceListener(self),
+            )
+        else:
+            self._consumer.subscribe(topics)
+
         self._is_running = True
 
-        logger.info(f"Started consuming from topics: {topics}")
+        logger.info(
+            f"Started consuming from topics: {topics} (mode: {self.consumer_mode})"
+        )
 
         async def consume_loop():
             """Background consumer loop"""
@@ -171,8 +352,77 @@ class KafkaEventBus(IEventBus):
                 self._is_running = False
                 logger.info("Consumer stopped")
 
+        async def partitioned_consume_loop():
+            """Background consumer loop dispatching to per-partition workers"""
+            if not self._consumer:
+                raise RuntimeError("Event bus not connected")
+            try:
+                while self._is_running:
+                    batch = await self._consumer.getmany(
+                        timeout_ms=1000,
+                        max_records=self.max_in_flight_per_partition,
+                    )
+
+                    for tp, messages in batch.items():
+                        worker = self._partition_workers.get(tp)
+                        if worker is None:
+                            worker = _PartitionWorker(
+                                tp,
+                                handle=lambda m: self._handle_message(m, commit=False),
+                                commit=self._commit_offset,
+                                on_capacity=self._resume_partition,
+                                max_in_flight=self.max_in_flight_per_partition,
+                            )
+                            self._partition_workers[tp] = worker
+
+                        for message in messages:
+                            worker.submit(message)
+
+                        # Stop fetching this partition until its window frees up
+                        if worker.is_full:
+                            self._consumer.pause(tp)
+            except asyncio.CancelledError:
+                logger.info("Consumer task cancelled")
+            except Exception as e:
+                logger.error(f"Error in consumer loop: {e}", exc_info=True)
+            finally:
+                await self._release_partitions(list(self._partition_workers))
+                if self._consumer:
+                    await self._consumer.stop()
+                self._is_running = False
+                logger.info("Consumer stopped")
+
         # Store the task so we can cancel it later during shutdown
-        self._consume_task = asyncio.create_task(consume_loop())
+        if self.consumer_mode == "partitioned":
+            self._consume_task = asyncio.create_task(partitioned_consume_loop())
+        else:
+            self._consume_task = asyncio.create_task(consume_loop())
+
+    def _resume_partition(self, tp: TopicPartition):
+        if self._consumer is not None and tp in self._consumer.paused():
+            self._consumer.resume(tp)
+
+    async def _release_partitions(self, partitions: List[TopicPartition]):
+        """Finish and commit in-flight work for partitions we are giving up"""
+        workers = [
+            worker
+            for tp in partitions
+            if (worker := self._partition_workers.pop(tp, None)) is not None
+        ]
+
+        await asyncio.gather(
+            *(worker.drain(PARTITION_DRAIN_TIMEOUT_SECONDS) for worker in workers)
+        )
+
+    async def _commit_offset(self, tp: TopicPartition, offset: int):
+        if self._consumer is None:
+            raise RuntimeError("Consumer not initialized")
+
+        try:
+            await self._consumer.commit({tp: offset})
+            logger.debug(f"Committed {tp.topic}[{tp.partition}] up to offset {offset}")
+        except Exception as e:
+            logger.error(f"Failed to commit {tp.topic}[{tp.partition}]: {e}")
 
     async def _commit(self, message: ConsumerRecord):
         if self._consumer is None:
@@ -184,8 +434,11 @@ class KafkaEventBus(IEventBus):
             f"Successfully processed and committed message from {message.topic}[{message.partition}] offset {message.offset}"
         )
 
-    async def _handle_message(self, message: ConsumerRecord):
-        """Handle incoming Kafka message"""
+    async def _handle_message(self, message: ConsumerRecord, commit: bool = True):
+        """
+        Handle incoming Kafka message.
+        With commit=False the caller is responsible for committing the offset.
+        """
         try:
             topic = message.topic
             event_data = message.value
@@ -210,7 +463,8 @@ class KafkaEventBus(IEventBus):
             try:
                 event_class = EventRegistry.get_event_class(event_type)
             except KeyError:
-                await self._commit(message)
+                if commit:
+                    await self._commit(message)
                 return
 
             logger.debug(f"Event class is: {event_class.__name__}")
@@ -228,7 +482,8 @@ class KafkaEventBus(IEventBus):
 
                 logger.debug(f"Successfully handled event {event_payload.event_type}")
 
-            await self._commit(message)
+            if commit:
+                await self._commit(message)
 
         except AppError as e:
             logger.error(
@@ -242,4 +497,9 @@ class KafkaEventBus(IEventBus):
 kafka_event_bus = KafkaEventBus(
     bootstrap_servers=kafka_config.bootstrap_servers,
     group_id=kafka_config.group_id,
+    consumer_mode=kafka_config.consumer_mode,
+    max_in_flight_per_partition=kafka_config.max_in_flight_per_partition,
+    linger_ms=kafka_config.linger_ms,
+    max_batch_size=kafka_config.max_batch_size,
+    compression_type=kafka_config.compression_type,
 )
@@ -0,0 +1,26 @@
+from typing import Type, Callable, Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.events.base import DomainEvent
+from app.domain.ports import IEventBus
+from app.infrastructure.sqlalchemy.models import SqlAlchemyOutboxEvent
+
+
+class OutboxEventBus(IEventBus):
+    """
+    Publish-only event bus that records events in the outbox table using the
+    caller's session. Events become visible to the relay worker only if that
+    transaction commits, and are delivered to Kafka from there.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def publish(self, event: DomainEvent):
+        self._session.add(SqlAlchemyOutboxEvent.from_domain(event))
+
+    async def publish_many(self, events: Sequence[DomainEvent]):
+        self._session.add_all([SqlAlchemyOutboxEvent.from_domain(e) for e in events])
+
+    async def subscribe(self, event_type: Type[DomainEvent], handler: Callable):
+        raise RuntimeError("Outbox event bus does not support subscriptions")
@@ -8,7 +8,7 @@ from datetime import datetime
 from uuid import UUID
 from typing import TypeVar, Generic, Optional, Dict, Any
 
-from app.config import settings, paystack_config
+from app.config import settings, paystack_config, paystack_http_config
 from app.domain.ports import IPaymentAdapter
 from app.shared.errors import AppError, ErrorCodes, InternalAppError
 from app.utils.external_api_client import ExternalAPIClient
@@ -170,6 +170,23 @@ class ChargeData(BaseModel):
 
     model_config = ConfigDict(extra="ignore")
 
+    def to_external_transaction(self) -> ExternalTransaction:
+        """
+        The same transaction get_valid_transaction would return, taken from
+        a signature-verified webhook instead of a verify call
+        """
+        if self.status != "success":
+            raise AppError("Invalid or unsuccessful transaction", 400)
+
+        return ExternalTransaction(
+            amount=Decimal(self.amount) / 100,
+            fees=self.fees or Decimal(0),
+            currency=self.currency,
+            metadata=self.metadata,
+            occurred_on=self.paid_at or self.paidAt or self.created_at,
+            reference=UUID(self.reference),
+        )
+
 
 class PaystackEvent(BaseModel, Generic[T]):
     event: str
@@ -204,6 +221,9 @@ class PaystackAdapter(IPaymentAdapter):
         response = await self._client.post(
             endpoint="/transferrecipient",
             data=payload,
+            timeout=self._client.timeout(
+                read=paystack_http_config.transfer_read_timeout_seconds
+            ),
         )
 
         try:
@@ -259,6 +279,9 @@ class PaystackAdapter(IPaymentAdapter):
         response = await self._client.post(
             endpoint="/transfer",
             data=payload,
+            timeout=self._client.timeout(
+                read=paystack_http_config.transfer_read_timeout_seconds
+            ),
         )
 
         try:
@@ -352,6 +375,10 @@ class PaystackAdapter(IPaymentAdapter):
     ) -> ExternalTransaction:
         response = await self._client._get(
             endpoint=f"/transaction/verify/{reference}",
+            timeout=self._client.timeout(
+                read=paystack_http_config.checkout_read_timeout_seconds
+            ),
+            hedge=True,
         )
 
         try:
@@ -412,6 +439,9 @@ class PaystackAdapter(IPaymentAdapter):
             response = await self._client.post(
                 endpoint="/transaction/initialize",
                 data=payload,
+                timeout=self._client.timeout(
+                    read=paystack_http_config.checkout_read_timeout_seconds
+                ),
             )
         except InternalAppError as e:
             print(f"InternalAppError: {e.payload}")
@@ -479,6 +509,8 @@ def get_PaystackAdapter():
             headers={
                 "Authorization": f"Bearer {paystack_config.secret_key}",
             },
+            config=paystack_http_config,
+            name="paystack",
         )
         _adapter = PaystackAdapter(client)
     return _adapter
@@ -0,0 +1,215 @@
+import hmac
+import hashlib
+from uuid import UUID
+from datetime import datetime, timezone
+from typing import Annotated, Literal, Optional, Union
+from pydantic import Field, TypeAdapter, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings, paystack_config
+from app.utils.signing import sign_payload
+from app.application.dto.checkout import CheckoutMetaData
+from app.application.use_cases import VerifyTicketPurchaseTransactionUseCase
+from app.domain.events import CompleteWithdrawEvent, CompleteFundingEvent
+from app.domain.ports import IEventBus
+from app.shared.errors import AppError
+from app.infrastructure.cache import PaymentStatusNotifier
+from app.infrastructure.sqlalchemy.models import SqlAlchemyPaystackWebhook
+from .paystack_adapter import (
+    PaystackEvent,
+    PaystackTransferSuccessEvent,
+    ChargeData,
+)
+
+
+class PaystackChargeSuccess(PaystackEvent[ChargeData]):
+    event: Literal["charge.success"]
+
+
+class PaystackTransferSuccess(PaystackEvent[PaystackTransferSuccessEvent]):
+    event: Literal["transfer.success"]
+
+
+PaystackWebhookEvent = Annotated[
+    Union[PaystackChargeSuccess, PaystackTransferSuccess],
+    Field(discriminator="event"),
+]
+
+# Built once: picks the schema by `event` while parsing the raw bytes
+_WEBHOOK_ADAPTER: TypeAdapter[PaystackWebhookEvent] = TypeAdapter(
+    PaystackWebhookEvent
+)
+
+
+def decode_paystack_webhook(raw_body: bytes) -> PaystackWebhookEvent:
+    """Parse and validate a webhook body in one pass"""
+    try:
+        return _WEBHOOK_ADAPTER.validate_json(raw_body)
+    except ValidationError as e:
+        error = e.errors(include_url=False)[0]
+
+        if error["type"] == "json_invalid":
+            print("❌ Failed to parse webhook JSON")
+            raise AppError("Invalid JSON", 400)
+
+        if error["type"] == "union_tag_not_found":
+            print("❌ Missing `event` field")
+            raise AppError("Missing `event` field in Paystack webhook", 400)
+
+        if error["type"] == "union_tag_invalid":
+            event_type = error.get("ctx", {}).get("tag")
+            print(f"⚠ Unsupported Paystack event: {event_type}")
+            raise AppError(f"Unsupported Paystack event: {event_type}", 400)
+
+        print("❌ Schema validation failed")
+        print(f"Received payload: {raw_body.decode('utf-8', errors='replace')}")
+        raise AppError("Invalid event schema", 400)
+
+
+def paystack_webhook_key(event: PaystackWebhookEvent) -> str:
+    """Identify a delivery by its event and reference"""
+    return f"paystack:{event.event}:{event.data.reference}"
+
+
+def verify_paystack_signature(raw_body: bytes, signature: Optional[str]) -> None:
+    """Raise unless the body was signed with our Paystack secret key"""
+    if signature is None:
+        print("❌ Missing Paystack signature header")
+        raise AppError("Missing Paystack signature", 400)
+
+    # Compute HMAC
+    computed_hash = hmac.new(
+        paystack_config.secret_key.encode("utf-8"),
+        raw_body,
+        hashlib.sha512,
+    ).hexdigest()
+
+    # Validate signature
+    if signature != computed_hash:
+        print("❌ Invalid Paystack signature – possible spoof attempt")
+        raise AppError("Invalid Paystack signature", 400)
+
+    print("✅ Paystack signature verified")
+
+
+async def enqueue_paystack_webhook(session: AsyncSession, raw_body: bytes) -> None:
+    """
+    Queue a verified body for the inbox worker. Commits straight away, so the
+    webhook is durable before Paystack is told it was received.
+    """
+    session.add(SqlAlchemyPaystackWebhook(body=raw_body))
+    await session.commit()
+
+
+class PaystackWebhookProcessor:
+    """
+    Applies a signature-verified Paystack webhook body. Used inline by the
+    webhook endpoint, or by the inbox worker when webhooks are acked first
+    and processed later. Everything it writes goes through the given session.
+    """
+
+    def __init__(
+        self,
+        event_bus: IEventBus,
+        verify_txn_uc: VerifyTicketPurchaseTransactionUseCase,
+        payment_status: PaymentStatusNotifier,
+        session: AsyncSession,
+    ) -> None:
+        self._event_bus = event_bus
+        self._verify_txn_uc = verify_txn_uc
+        self._payment_status = payment_status
+        self._session = session
+
+    async def process(self, parsed: PaystackWebhookEvent) -> None:
+        """Apply a webhook decoded by decode_paystack_webhook"""
+        print(f"🔍 Paystack event type: {parsed.event}")
+
+        if isinstance(parsed, PaystackTransferSuccess):
+            await self._transfer_success(parsed.data)
+
+        elif isinstance(parsed, PaystackChargeSuccess):
+            await self._charge_success(parsed.data)
+
+        print(f"🎉 Paystack event processed successfully: {parsed.event}")
+
+    async def _transfer_success(
+        self,
+        transfer_data: PaystackTransferSuccessEvent,
+    ) -> None:
+        print(
+            f"💸 Transfer success for reference={transfer_data.reference} "
+            f"status={transfer_data.status}"
+        )
+
+        if transfer_data.status == "success":
+            ev = CompleteWithdrawEvent.create(
+                amount=transfer_data.amount / 100,
+                ref=transfer_data.reference,
+                dest=transfer_data.recipient.details.build_dest(),
+                date=transfer_data.transferred_at or transfer_data.updatedAt,
+            )
+            print(f"📤 Publishing CompleteWithdrawEvent: {ev}")
+            await self._event_bus.publish(ev)
+
+    async def _charge_success(self, charge_data: ChargeData) -> None:
+        metadata = charge_data.metadata
+        print(
+            f"Charge Success for reference={charge_data.reference} "
+            f"status={charge_data.status} "
+            f"action={metadata.get('action') if metadata else None} "
+            f"amount={charge_data.amount} paid_at={charge_data.paid_at}"
+        )
+
+        if metadata and metadata.get("action") == "deposit":
+            _ = metadata.pop("referrer")
+            expected_signature = metadata.pop("signature")
+
+            if expected_signature:
+                sig = sign_payload(metadata, settings.charge_req_key)
+
+                if sig != expected_signature:
+                    raise AppError(f"Metadata signature mismatch", 400)
+
+                event = CompleteFundingEvent.create(
+                    amount_paid=charge_data.amount / 100,
+                    ref=charge_data.reference,
+                    date=(
+                        charge_data.paid_at.isoformat()
+                        if charge_data.paid_at
+                        else datetime.now(timezone.utc).isoformat()
+                    ),
+                )
+
+                print(f"📤 Publishing CompleteWithdrawEvent: {event}")
+                await self._event_bus.publish(event)
+
+                self._payment_status.publish_on_commit(
+                    self._session,
+                    charge_data.reference,
+                    "paid",
+                )
+
+        if metadata and metadata.get("action") == "ticket_purchase":
+            reference = charge_data.reference
+            print(f"🔍 Verifying transaction for reference: {reference}")
+
+            # Validated once here and handed to the use case as is
+            checkout_metadata = CheckoutMetaData.model_validate(metadata)
+
+            # The body is HMAC-verified, so it is as good as a verify call
+            ext_transaction = (
+                charge_data.to_external_transaction()
+                if settings.paystack_webhook_trust_charge_data
+                else None
+            )
+
+            await self._verify_txn_uc.execute(
+                reference=reference,
+                user_id=UUID(checkout_metadata.ticket_charge.user),
+                validate_only=False,
+                metadata=checkout_metadata,
+                ext_transaction=ext_transaction,
+            )
+            print(f"✅ Transaction verified for reference: {reference}")
+
+            self._payment_status.publish_on_commit(self._session, reference, "paid")
@@ -0,0 +1,24 @@
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN of a statement, keeping its bound parameters"""
+
+    inherit_cache = False
+
+    def __init__(self, statement, analyze: bool = False, json: bool = False):
+        self.statement = statement
+        self.analyze = analyze
+        self.json = json
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler, **kw):
+    options = ["ANALYZE", "BUFFERS"] if element.analyze else ["COSTS"]
+    if element.json:
+        options.append("FORMAT JSON")
+
+    return f"EXPLAIN ({', '.join(options)}) " + compiler.process(
+        element.statement, **kw
+    )
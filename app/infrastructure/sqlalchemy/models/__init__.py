@@ -2,10 +2,17 @@ from .charge_setting import SqlAlchemyChargeSetting
 from .charge_setting_version import SqlAlchemyChargeSettingVersion
 from .transaction import SqlAlchemyTransaction
 from .wallet import SqlAlchemyWallet
+from .outbox_event import SqlAlchemyOutboxEvent
+from .paystack_webhook import SqlAlchemyPaystackWebhook
+from .wallet_ledger import SqlAlchemyWalletLedgerEntry, SqlAlchemyWalletBalanceSnapshot
 
 __all__ = [
     "SqlAlchemyChargeSetting",
     "SqlAlchemyChargeSettingVersion",
     "SqlAlchemyTransaction",
     "SqlAlchemyWallet",
+    "SqlAlchemyOutboxEvent",
+    "SqlAlchemyPaystackWebhook",
+    "SqlAlchemyWalletLedgerEntry",
+    "SqlAlchemyWalletBalanceSnapshot",
 ]
@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import BigInteger, DateTime, Text, func
+
+from app.domain.events.base import DomainEvent
+
+from ..session import Base
+
+
+class SqlAlchemyOutboxEvent(Base):
+    """
+    Domain event waiting to be relayed to the event bus.
+    Rows are written in the same transaction as the state change that raised
+    them and deleted once delivered. The id preserves publish order.
+    """
+
+    __tablename__ = "outbox_events"
+
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        primary_key=True,
+        autoincrement=True,
+    )
+
+    topic: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+    )
+
+    key: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+    )
+
+    payload: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    @classmethod
+    def from_domain(cls, event: DomainEvent) -> "SqlAlchemyOutboxEvent":
+        return cls(
+            topic=event.event_type,
+            key=event.aggregate_id,
+            payload=event.to_json(),
+        )
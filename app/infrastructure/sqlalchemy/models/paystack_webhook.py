@@ -0,0 +1,65 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Integer,
+    LargeBinary,
+    Text,
+    Index,
+    func,
+)
+
+from ..session import Base
+
+
+class SqlAlchemyPaystackWebhook(Base):
+    """
+    Signature-verified Paystack webhook body waiting to be processed.
+    Rows are committed before the webhook is acknowledged and deleted in the
+    same transaction that applies them.
+    """
+
+    __tablename__ = "paystack_webhooks"
+    __table_args__ = (
+        Index(
+            "ix_paystack_webhooks_available_at",
+            "available_at",
+            "id",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        primary_key=True,
+        autoincrement=True,
+    )
+
+    body: Mapped[bytes] = mapped_column(
+        LargeBinary,
+        nullable=False,
+    )
+
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="0",
+    )
+
+    last_error: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+    )
+
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
@@ -1,3 +1,4 @@
+import json
 from sqlalchemy.orm import Mapped, mapped_column
 from decimal import Decimal
 from datetime import datetime
@@ -9,7 +10,11 @@ from sqlalchemy import (
     Numeric,
     JSON,
     ForeignKey,
+    Index,
+    text,
+    literal_column,
 )
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.dialects.postgresql import JSONB
 
 from uuid import UUID as PyUUID
@@ -19,15 +24,41 @@ from app.domain.entities.value_objects import (
     TransactionSettlementStatus,
     TransactionSource,
     TransactionType,
-    ChargeData,
-    SettlementData,
 )
 
 from ..session import Base
 
 
+def _from_json(value: Any) -> Any:
+    # Some older rows hold their JSON documents as strings
+    return json.loads(value) if isinstance(value, str) else value
+
+
 class SqlAlchemyTransaction(Base):
     __tablename__ = "transactions"
+    __table_args__ = (
+        Index(
+            "ix_transactions_scheduled_settlement",
+            "delayed_settlement_until",
+            postgresql_where=text("settlement_status = 'scheduled'"),
+        ),
+        Index(
+            "ix_transactions_user_id_occurred_on",
+            "user_id",
+            text("occurred_on DESC"),
+        ),
+        Index(
+            "ix_transactions_metadata_event",
+            "user_id",
+            text("((metadata -> 'event') ->> 'id')"),
+            text("((metadata -> 'event') ->> 'occurrence')"),
+        ),
+        Index(
+            "ix_transactions_occurred_on_id",
+            text("occurred_on DESC"),
+            text("id DESC"),
+        ),
+    )
 
     id: Mapped[PyUUID] = mapped_column(
         UUID(as_uuid=True),
@@ -106,6 +137,7 @@ class SqlAlchemyTransaction(Base):
         UUID(as_uuid=True),
         ForeignKey("transactions.id", ondelete="RESTRICT"),
         nullable=True,
+        index=True,
     )
 
     delayed_settlement_until: Mapped[Optional[datetime]] = mapped_column(
@@ -113,9 +145,25 @@ class SqlAlchemyTransaction(Base):
         nullable=True,
     )
 
+    @classmethod
+    def event_metadata(cls, field: str) -> ColumnElement[str]:
+        """
+        metadata -> 'event' ->> field, with the keys inlined as constants so the
+        expression matches ix_transactions_metadata_event
+        """
+        return (
+            cls.metadata_.op("->")(literal_column("'event'"))
+            .op("->>", return_type=String)(literal_column(f"'{field}'"))
+        )
+
     @classmethod
     def from_domain(cls, data: Transaction) -> "SqlAlchemyTransaction":
-        return cls(
+        return cls(**cls.values_from_domain(data))
+
+    @classmethod
+    def values_from_domain(cls, data: Transaction) -> dict[str, Any]:
+        """Column values keyed by attribute name, for bulk INSERT and UPDATE"""
+        return dict(
             id=data.id,
             amount=data.amount,
             user_id=data.user_id,
@@ -140,41 +188,35 @@ class SqlAlchemyTransaction(Base):
         )
 
     def to_domain(self) -> "Transaction":
-        return Transaction(
-            id=self.id,
-            amount=self.amount,
-            user_id=self.user_id,
-            resource=self.resource,
-            resource_id=self.resource_id,
-            reference=self.reference,
-            source=self.source,
-            occurred_on=self.occurred_on,
-            charge_data=(
-                [ChargeData.model_validate(c) for c in self.charge_data]
-                if isinstance(self.charge_data, list)
-                else (
-                    ChargeData.model_validate_json(self.charge_data)
-                    if isinstance(self.charge_data, str)
-                    else (
-                        ChargeData.model_validate(self.charge_data)
-                        if isinstance(self.charge_data, dict)
-                        else None
-                    )
-                )
-            ),
-            settlement_status=self.settlement_status,
-            transaction_type=self.transaction_type,
-            transaction_direction=self.transaction_direction,
-            settlement_data=[
-                (
-                    SettlementData.model_validate(s)
-                    if isinstance(s, dict)
-                    else SettlementData.model_validate_json(s)
-                )
-                for s in self.settlement_data
-            ],
-            created_at=self.created_at,
-            metadata=self.metadata_,
-            parent_id=self.parent_id,
-            delayed_settlement_until=self.delayed_settlement_until,
+        """
+        Hydrate in a single validator pass: pydantic-core builds the nested
+        ChargeData and SettlementData itself, instead of one Python-level
+        model_validate per item followed by a second check of the result.
+        """
+        charge_data = _from_json(self.charge_data)
+
+        return Transaction.model_validate(
+            {
+                "id": self.id,
+                "amount": self.amount,
+                "user_id": self.user_id,
+                "resource": self.resource,
+                "resource_id": self.resource_id,
+                "reference": self.reference,
+                "source": self.source,
+                "occurred_on": self.occurred_on,
+                "charge_data": (
+                    [_from_json(c) for c in charge_data]
+                    if isinstance(charge_data, list)
+                    else charge_data or None
+                ),
+                "settlement_status": self.settlement_status,
+                "transaction_type": self.transaction_type,
+                "transaction_direction": self.transaction_direction,
+                "settlement_data": [_from_json(s) for s in self.settlement_data],
+                "created_at": self.created_at,
+                "metadata": self.metadata_,
+                "parent_id": self.parent_id,
+                "delayed_settlement_until": self.delayed_settlement_until,
+            }
         )
@@ -7,6 +7,8 @@ from sqlalchemy import (
     Text,
     Numeric,
     JSON,
+    Index,
+    CheckConstraint,
 )
 
 from app.domain.entities.value_objects import BankDetails
@@ -17,6 +19,11 @@ from ..session import Base
 
 class SqlAlchemyWallet(Base):
     __tablename__ = "wallets"
+    __table_args__ = (
+        Index("uq_wallets_user_id", "user_id", unique=True),
+        CheckConstraint("balance >= 0", name="balance_non_negative"),
+        CheckConstraint("pending_balance >= 0", name="pending_balance_non_negative"),
+    )
 
     id: Mapped[PyUUID] = mapped_column(
         UUID(as_uuid=True),
@@ -0,0 +1,83 @@
+from uuid import UUID as PyUUID
+from decimal import Decimal
+from datetime import datetime
+from typing import Optional
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import UUID, BigInteger, DateTime, Index, Numeric, func
+
+from app.domain.entities import LedgerEntry
+
+from ..session import Base
+
+
+class SqlAlchemyWalletLedgerEntry(Base):
+    """
+    Append-only movements of wallet available balances.
+    Rows are never updated or deleted; snapshots fold them into a balance.
+    """
+
+    __tablename__ = "wallet_ledger_entries"
+    __table_args__ = (Index("ix_wallet_ledger_entries_user_id_id", "user_id", "id"),)
+
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        primary_key=True,
+        autoincrement=True,
+    )
+
+    user_id: Mapped[PyUUID] = mapped_column(
+        UUID(as_uuid=True),
+        nullable=False,
+    )
+
+    amount: Mapped[Decimal] = mapped_column(
+        Numeric(precision=18, scale=2),
+        nullable=False,
+    )
+
+    transaction_id: Mapped[Optional[PyUUID]] = mapped_column(
+        UUID(as_uuid=True),
+        nullable=True,
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    def to_domain(self) -> LedgerEntry:
+        return LedgerEntry(
+            id=self.id,
+            user_id=self.user_id,
+            amount=self.amount,
+            transaction_id=self.transaction_id,
+            created_at=self.created_at,
+        )
+
+
+class SqlAlchemyWalletBalanceSnapshot(Base):
+    """Balance of a wallet up to and including ledger entry last_entry_id"""
+
+    __tablename__ = "wallet_balance_snapshots"
+
+    user_id: Mapped[PyUUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+    )
+
+    balance: Mapped[Decimal] = mapped_column(
+        Numeric(precision=18, scale=2),
+        nullable=False,
+    )
+
+    last_entry_id: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
@@ -1,17 +1,30 @@
+import json
 import logging
 from datetime import datetime
 from typing import List
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_, cast, String
-
-from app.domain.dto.transaction import TransactionFilter
+from sqlalchemy import (
+    select,
+    insert,
+    update,
+    func,
+    and_,
+    or_,
+    cast,
+    String,
+    tuple_,
+    Select,
+)
+
+from app.domain.dto.transaction import TransactionFilter, TransactionCursor
 from app.domain.entities.transaction import Transaction
 from app.domain.repositories import ITransactionRepository
 from app.shared.errors import AppError
 
 
 from ..models import SqlAlchemyTransaction
+from ..explain import Explain
 
 
 logger = logging.getLogger("[SqlAlchemyTransactionRepository]")
@@ -37,10 +50,28 @@ class SqlAlchemyTransactionRepository(ITransactionRepository):
         return self._session
 
     async def save(self, txn: Transaction) -> None:
-        entity = SqlAlchemyTransaction.from_domain(txn)
-        # print(entity.amount, entity.charge_data, entity.settlement_data)
-        await self.safe_session.merge(entity)
-        await self.safe_session.flush()
+        values = SqlAlchemyTransaction.values_from_domain(txn)
+        values.pop("id")
+
+        # A targeted UPDATE; loaded copies in the session are synchronized
+        result = await self.safe_session.execute(
+            update(SqlAlchemyTransaction)
+            .where(SqlAlchemyTransaction.id == txn.id)
+            .values(**values)
+        )
+
+        if result.rowcount == 0:
+            await self.insert_many([txn])
+
+    async def insert_many(self, txns: list[Transaction]) -> None:
+        if not txns:
+            return
+
+        # ORM bulk insert: one multi-row INSERT, no identity map bookkeeping
+        await self.safe_session.execute(
+            insert(SqlAlchemyTransaction),
+            [SqlAlchemyTransaction.values_from_domain(txn) for txn in txns],
+        )
 
     async def get_by_id(
         self,
@@ -91,15 +122,13 @@ class SqlAlchemyTransactionRepository(ITransactionRepository):
 
         return entity.to_domain() if entity else None
 
-    async def query_by_user(
+    def _by_user_statement(
         self,
-        offset: int,
-        limit: int,
         user_id: UUID,
         ticket_ids: list[UUID],
         event: UUID | None,
         occurrence: UUID | None,
-    ) -> tuple[list[Transaction], int]:
+    ) -> Select:
         base_stmt = select(SqlAlchemyTransaction)
 
         if len(ticket_ids) > 0:
@@ -112,13 +141,13 @@ class SqlAlchemyTransactionRepository(ITransactionRepository):
                 # Build event condition
                 event_condition = and_(
                     SqlAlchemyTransaction.user_id == user_id,  # add user_id here too
-                    SqlAlchemyTransaction.metadata_["event"]["id"].astext == str(event),
+                    SqlAlchemyTransaction.event_metadata("id") == str(event),
                 )
 
                 if occurrence:
                     event_condition = and_(
                         event_condition,
-                        SqlAlchemyTransaction.metadata_["event"]["occurrence"].astext
+                        SqlAlchemyTransaction.event_metadata("occurrence")
                         == str(occurrence),
                     )
 
@@ -136,6 +165,69 @@ class SqlAlchemyTransactionRepository(ITransactionRepository):
         else:
             base_stmt = base_stmt.where(SqlAlchemyTransaction.user_id == user_id)
 
+        return base_stmt
+
+    def _filter_statement(self, filter: TransactionFilter | None) -> Select:
+        base_stmt = select(SqlAlchemyTransaction)
+
+        if filter:
+            if filter.status:
+                base_stmt = base_stmt.where(
+                    SqlAlchemyTransaction.settlement_status == filter.status
+                )
+
+            if filter.type:
+                base_stmt = base_stmt.where(
+                    SqlAlchemyTransaction.transaction_type == filter.type
+                )
+
+        return base_stmt
+
+    async def _page_after(
+        self,
+        base_stmt: Select,
+        limit: int,
+        after: TransactionCursor | None,
+    ) -> List[Transaction]:
+        if after is not None:
+            base_stmt = base_stmt.where(
+                tuple_(SqlAlchemyTransaction.occurred_on, SqlAlchemyTransaction.id)
+                < tuple_(after.occurred_on, after.id)
+            )
+
+        data_stmt = base_stmt.order_by(
+            SqlAlchemyTransaction.occurred_on.desc(),
+            SqlAlchemyTransaction.id.desc(),
+        ).limit(limit)
+
+        result = await self.safe_session.execute(data_stmt)
+        entities = result.scalars().all()
+
+        return [entity.to_domain() for entity in entities]
+
+    async def _count(self, base_stmt: Select, estimate: bool) -> int:
+        if estimate:
+            # The planner's row estimate: no scan, but only as good as ANALYZE stats
+            result = await self.safe_session.execute(Explain(base_stmt, json=True))
+            plan = result.scalar_one()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+
+        count_stmt = select(func.count()).select_from(base_stmt.subquery())
+        return (await self.safe_session.execute(count_stmt)).scalar_one()
+
+    async def query_by_user(
+        self,
+        offset: int,
+        limit: int,
+        user_id: UUID,
+        ticket_ids: list[UUID],
+        event: UUID | None,
+        occurrence: UUID | None,
+    ) -> tuple[list[Transaction], int]:
+        base_stmt = self._by_user_statement(user_id, ticket_ids, event, occurrence)
+
         # Or with parameters (won't bind literals)
         compiled = base_stmt.compile()
         print(f"SQL: {compiled}")
@@ -144,8 +236,7 @@ class SqlAlchemyTransactionRepository(ITransactionRepository):
         # -----------------------
         # 1. Get total count
         # -----------------------
-        count_stmt = select(func.count()).select_from(base_stmt.subquery())
-        total = (await self.safe_session.execute(count_stmt)).scalar_one()
+        total = await self._count(base_stmt, estimate=False)
 
         # -----------------------
         # 2. Get paginated data
@@ -161,30 +252,41 @@ class SqlAlchemyTransactionRepository(ITransactionRepository):
 
         return [entity.to_domain() for entity in entities], total
 
+    async def query_by_user_after(
+        self,
+        limit: int,
+        user_id: UUID,
+        ticket_ids: list[UUID],
+        event: UUID | None,
+        occurrence: UUID | None,
+        after: TransactionCursor | None = None,
+    ) -> List[Transaction]:
+        base_stmt = self._by_user_statement(user_id, ticket_ids, event, occurrence)
+        return await self._page_after(base_stmt, limit, after)
+
+    async def count_by_user(
+        self,
+        user_id: UUID,
+        ticket_ids: list[UUID],
+        event: UUID | None,
+        occurrence: UUID | None,
+        estimate: bool = False,
+    ) -> int:
+        base_stmt = self._by_user_statement(user_id, ticket_ids, event, occurrence)
+        return await self._count(base_stmt, estimate)
+
     async def query(
         self,
         offset: int,
         limit: int,
         filter: TransactionFilter | None = None,
     ) -> tuple[List[Transaction], int]:
-        base_stmt = select(SqlAlchemyTransaction)
-
-        if filter:
-            if filter.status:
-                base_stmt = base_stmt.where(
-                    SqlAlchemyTransaction.settlement_status == filter.status
-                )
-
-            if filter.type:
-                base_stmt = base_stmt.where(
-                    SqlAlchemyTransaction.transaction_type == filter.type
-                )
+        base_stmt = self._filter_statement(filter)
 
         # -----------------------
         # 1. Get total count
         # -----------------------
-        count_stmt = select(func.count()).select_from(base_stmt.subquery())
-        total = (await self.safe_session.execute(count_stmt)).scalar_one()
+        total = await self._count(base_stmt, estimate=False)
 
         # -----------------------
         # 2. Get paginated data
@@ -200,6 +302,21 @@ class SqlAlchemyTransactionRepository(ITransactionRepository):
 
         return [entity.to_domain() for entity in entities], total
 
+    async def query_after(
+        self,
+        limit: int,
+        filter: TransactionFilter | None = None,
+        after: TransactionCursor | None = None,
+    ) -> List[Transaction]:
+        return await self._page_after(self._filter_statement(filter), limit, after)
+
+    async def count(
+        self,
+        filter: TransactionFilter | None = None,
+        estimate: bool = False,
+    ) -> int:
+        return await self._count(self._filter_statement(filter), estimate)
+
     async def find_due_scheduled(
         self,
         date: datetime,
@@ -215,3 +332,71 @@ class SqlAlchemyTransactionRepository(ITransactionRepository):
         entities = result.scalars().all()
 
         return [entity.to_domain() for entity in entities]
+
+    async def claim_due_scheduled(
+        self,
+        date: datetime,
+        limit: int,
+    ) -> List[Transaction]:
+        stmt = (
+            select(SqlAlchemyTransaction)
+            .where(SqlAlchemyTransaction.settlement_status == "scheduled")
+            .where(SqlAlchemyTransaction.delayed_settlement_until <= date)
+            .order_by(SqlAlchemyTransaction.delayed_settlement_until)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+
+        result = await self.safe_session.execute(stmt)
+        entities = result.scalars().all()
+
+        return [entity.to_domain() for entity in entities]
+
+    async def lock_pending_by_references(
+        self,
+        references: list[UUID],
+    ) -> List[Transaction]:
+        if not references:
+            return []
+
+        stmt = (
+            select(SqlAlchemyTransaction)
+            .where(SqlAlchemyTransaction.reference.in_(references))
+            .where(SqlAlchemyTransaction.settlement_status == "pending")
+            .order_by(SqlAlchemyTransaction.id)
+            .with_for_update()
+        )
+
+        result = await self.safe_session.execute(stmt)
+        entities = result.scalars().all()
+
+        return [entity.to_domain() for entity in entities]
+
+    async def find_scheduled_settlement_times(self, limit: int) -> List[datetime]:
+        stmt = (
+            select(SqlAlchemyTransaction.delayed_settlement_until)
+            .where(SqlAlchemyTransaction.settlement_status == "scheduled")
+            .where(SqlAlchemyTransaction.delayed_settlement_until.is_not(None))
+            .order_by(SqlAlchemyTransaction.delayed_settlement_until)
+            .distinct()
+            .limit(limit)
+        )
+
+        result = await self.safe_session.execute(stmt)
+
+        return list(result.scalars().all())
+
+    async def update_settlement_status_many(
+        self,
+        ids: list[UUID],
+        status: str,
+    ) -> None:
+        if not ids:
+            return
+
+        await self.safe_session.execute(
+            update(SqlAlchemyTransaction)
+            .where(SqlAlchemyTransaction.id.in_(ids))
+            .values(settlement_status=status)
+            .execution_options(synchronize_session=False)
+        )
@@ -1,14 +1,42 @@
-from uuid import UUID
+from uuid import UUID, uuid4
+from decimal import Decimal
+from typing import Iterable, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, func, text, bindparam, ColumnElement
+from sqlalchemy.dialects.postgresql import insert, ARRAY
+from sqlalchemy.types import Text
 
-from app.domain.entities.wallet import Wallet
+from app.domain.entities.wallet import Wallet, LedgerEntry
 from app.domain.repositories import IWalletRepository
 from app.shared.errors import AppError
-from ..models import SqlAlchemyWallet
+from ..models import (
+    SqlAlchemyWallet,
+    SqlAlchemyWalletLedgerEntry,
+    SqlAlchemyWalletBalanceSnapshot,
+)
+
+# Per-wallet advisory locks, taken in a stable order. Credits share the lock,
+# so they never wait on each other; debits and snapshots take it exclusively
+# and so see every credit that has started.
+_LOCK_WALLETS = text(
+    "SELECT pg_advisory_xact_lock(hashtextextended(u, 0)) "
+    "FROM unnest(:user_ids) WITH ORDINALITY AS t(u, n) ORDER BY n"
+).bindparams(bindparam("user_ids", type_=ARRAY(Text)))
+
+_LOCK_WALLETS_SHARED = text(
+    "SELECT pg_advisory_xact_lock_shared(hashtextextended(u, 0)) "
+    "FROM unnest(:user_ids) WITH ORDINALITY AS t(u, n) ORDER BY n"
+).bindparams(bindparam("user_ids", type_=ARRAY(Text)))
 
 
 class SqlAlchemyWalletRepository(IWalletRepository):
+    """
+    Wallets whose available balance lives in an append-only ledger.
+
+    The balance is the latest snapshot plus the entries after it, so credits
+    and debits are inserts and never rewrite a hot wallet row.
+    """
+
     def __init__(
         self,
         session: AsyncSession | None = None,
@@ -27,34 +55,239 @@ class SqlAlchemyWalletRepository(IWalletRepository):
         return self._session
 
     async def save(self, w: Wallet) -> None:
-        await self.session.merge(SqlAlchemyWallet.from_domain(w))
-        await self.session.flush()
+        entity = SqlAlchemyWallet.from_domain(w)
+
+        # The balance belongs to the ledger, so only the wallet's own fields
+        # are written
+        result = await self.session.execute(
+            update(SqlAlchemyWallet)
+            .where(SqlAlchemyWallet.id == w.id)
+            .values(
+                pending_balance=entity.pending_balance,
+                txn_pin=entity.txn_pin,
+                bank_details=entity.bank_details,
+            )
+        )
+
+        if result.rowcount == 0:
+            self.session.add(entity)
+            await self.session.flush()
 
     async def get_by_user_or_create(
         self,
         u: UUID,
         lock_for_update: bool = False,
     ) -> Wallet:
+        stmt = select(SqlAlchemyWallet, self._balance(u)).where(
+            SqlAlchemyWallet.user_id == u,
+        )
+        if lock_for_update:
+            stmt = stmt.with_for_update(of=SqlAlchemyWallet)
+
+        row = (await self.session.execute(stmt)).first()
+
+        if row:
+            entity, balance = row
+            wallet = entity.to_domain()
+            wallet.balance = balance
+            return wallet
+
+        await self._ensure_wallets([u])
+
+        return await self.get_by_user_or_create(u, lock_for_update)
+
+    # -------------------------
+    # Ledger
+    # -------------------------
+    def _balance(self, u: UUID) -> ColumnElement[Decimal]:
+        """Snapshot balance plus every entry appended after it"""
+        snapshot = SqlAlchemyWalletBalanceSnapshot
+        entry = SqlAlchemyWalletLedgerEntry
+
+        last_entry_id = (
+            select(snapshot.last_entry_id)
+            .where(snapshot.user_id == u)
+            .scalar_subquery()
+        )
+        snapshot_balance = (
+            select(snapshot.balance).where(snapshot.user_id == u).scalar_subquery()
+        )
+        delta = (
+            select(func.sum(entry.amount))
+            .where(entry.user_id == u)
+            .where(entry.id > func.coalesce(last_entry_id, 0))
+            .scalar_subquery()
+        )
+
+        return func.coalesce(snapshot_balance, 0) + func.coalesce(delta, 0)
+
+    async def _ensure_wallets(self, user_ids: Iterable[UUID]) -> None:
+        # A concurrent request may be creating the same wallet
+        await self.session.execute(
+            insert(SqlAlchemyWallet)
+            .values(
+                [
+                    {
+                        "id": uuid4(),
+                        "user_id": u,
+                        "balance": Decimal(0),
+                        "pending_balance": Decimal(0),
+                    }
+                    for u in sorted(user_ids)
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=[SqlAlchemyWallet.user_id])
+        )
+
+    async def _lock_wallets(self, user_ids: Iterable[UUID], shared: bool) -> None:
         result = await self.session.execute(
-            (
-                select(SqlAlchemyWallet).where(
-                    SqlAlchemyWallet.user_id == u,
-                )
-                if not lock_for_update
-                else select(SqlAlchemyWallet)
-                .where(
-                    SqlAlchemyWallet.user_id == u,
-                )
-                .with_for_update()
-            ),
+            _LOCK_WALLETS_SHARED if shared else _LOCK_WALLETS,
+            {"user_ids": sorted(str(u) for u in user_ids)},
         )
+        result.all()
 
-        entity = result.scalar()
+    async def _append(self, entries: list[LedgerEntry]) -> None:
+        await self.session.execute(
+            insert(SqlAlchemyWalletLedgerEntry).values(
+                [
+                    {
+                        "user_id": e.user_id,
+                        "amount": e.amount,
+                        "transaction_id": e.transaction_id,
+                    }
+                    for e in entries
+                ]
+            )
+        )
 
-        if entity:
-            return entity.to_domain()
+    async def credit(
+        self,
+        u: UUID,
+        amount: Decimal,
+        max_balance: Optional[Decimal] = None,
+        transaction_id: Optional[UUID] = None,
+    ) -> None:
+        if amount <= 0:
+            raise ValueError("Credit amount must be positive")
 
-        domain = Wallet(user_id=u)
-        await self.save(domain)
+        await self._ensure_wallets([u])
 
-        return domain
+        if max_balance:
+            # Capped credits check then append, so they must not interleave
+            await self._lock_wallets([u], shared=False)
+            wallet = await self.get_by_user_or_create(u)
+            wallet.confirm_can_deposit(amount, max_balance)
+        else:
+            await self._lock_wallets([u], shared=True)
+
+        await self._append(
+            [LedgerEntry(user_id=u, amount=amount, transaction_id=transaction_id)]
+        )
+
+    async def debit(
+        self,
+        u: UUID,
+        amount: Decimal,
+        transaction_id: Optional[UUID] = None,
+    ) -> None:
+        if amount <= 0:
+            raise ValueError("Debit amount must be positive")
+
+        await self._lock_wallets([u], shared=False)
+
+        balance = (await self.session.execute(select(self._balance(u)))).scalar_one()
+        if balance < amount:
+            raise AppError("Insufficient balance", 400)
+
+        await self._append(
+            [LedgerEntry(user_id=u, amount=-amount, transaction_id=transaction_id)]
+        )
+
+    async def credit_many(self, entries: list[LedgerEntry]) -> None:
+        if not entries:
+            return
+
+        user_ids = {e.user_id for e in entries}
+
+        await self._ensure_wallets(user_ids)
+        await self._lock_wallets(user_ids, shared=True)
+        await self._append(entries)
+
+    async def list_ledger_entries(
+        self,
+        u: UUID,
+        limit: int,
+        before_id: Optional[int] = None,
+    ) -> list[LedgerEntry]:
+        stmt = select(SqlAlchemyWalletLedgerEntry).where(
+            SqlAlchemyWalletLedgerEntry.user_id == u
+        )
+        if before_id is not None:
+            stmt = stmt.where(SqlAlchemyWalletLedgerEntry.id < before_id)
+
+        result = await self.session.execute(
+            stmt.order_by(SqlAlchemyWalletLedgerEntry.id.desc()).limit(limit)
+        )
+
+        return [entity.to_domain() for entity in result.scalars().all()]
+
+    # -------------------------
+    # Snapshots
+    # -------------------------
+    async def find_wallets_to_snapshot(
+        self,
+        min_entries: int,
+        limit: int,
+    ) -> list[UUID]:
+        snapshot = SqlAlchemyWalletBalanceSnapshot
+        entry = SqlAlchemyWalletLedgerEntry
+
+        result = await self.session.execute(
+            select(entry.user_id)
+            .outerjoin(snapshot, snapshot.user_id == entry.user_id)
+            .where(entry.id > func.coalesce(snapshot.last_entry_id, 0))
+            .group_by(entry.user_id)
+            .having(func.count() >= min_entries)
+            .limit(limit)
+        )
+
+        return list(result.scalars().all())
+
+    async def snapshot_balance(self, u: UUID) -> None:
+        snapshot = SqlAlchemyWalletBalanceSnapshot
+        entry = SqlAlchemyWalletLedgerEntry
+
+        # Waits out in-flight credits, so no lower entry id can appear later
+        await self._lock_wallets([u], shared=False)
+
+        last_entry_id = (
+            select(snapshot.last_entry_id)
+            .where(snapshot.user_id == u)
+            .scalar_subquery()
+        )
+        delta, max_id = (
+            await self.session.execute(
+                select(func.sum(entry.amount), func.max(entry.id))
+                .where(entry.user_id == u)
+                .where(entry.id > func.coalesce(last_entry_id, 0))
+            )
+        ).one()
+
+        if max_id is None:
+            return
+
+        stmt = insert(snapshot).values(
+            user_id=u,
+            balance=delta,
+            last_entry_id=max_id,
+        )
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[snapshot.user_id],
+                set_={
+                    "balance": snapshot.balance + stmt.excluded.balance,
+                    "last_entry_id": stmt.excluded.last_entry_id,
+                    "updated_at": func.now(),
+                },
+            )
+        )
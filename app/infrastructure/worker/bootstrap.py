@@ -20,7 +20,12 @@ from logging.handlers import RotatingFileHandler
 import sys
 import contextlib
 from .container import WorkerContainer, build_di_container, DIContainer
-from .tasks import ProcessDueTransactionTaskWorker
+from .tasks import (
+    ProcessDueTransactionTaskWorker,
+    RelayOutboxEventsTaskWorker,
+    SnapshotWalletBalancesTaskWorker,
+    ProcessPaystackWebhooksTaskWorker,
+)
 
 # Use the root logger so all modules inherit this configuration
 logger = logging.getLogger()
@@ -102,6 +107,9 @@ async def main():
 
     # Register workers
     container.register(ProcessDueTransactionTaskWorker)
+    container.register(RelayOutboxEventsTaskWorker)
+    container.register(SnapshotWalletBalancesTaskWorker)
+    container.register(ProcessPaystackWebhooksTaskWorker)
 
     # Run worker system
     await run_worker_system(container)
@@ -0,0 +1,87 @@
+import asyncio
+import heapq
+import time
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+
+class SettlementSchedule:
+    """
+    Min-heap of upcoming delayed settlement deadlines.
+
+    The heap is only a wake-up hint: Postgres stays the source of truth for
+    what is actually due, so a missing or stale deadline costs latency at
+    worst, never correctness.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[datetime] = []
+        self._known: set[datetime] = set()
+        self._changed = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    @property
+    def next_deadline(self) -> Optional[datetime]:
+        return self._heap[0] if self._heap else None
+
+    def add(self, deadline: datetime) -> None:
+        if deadline.tzinfo is None:
+            deadline = deadline.replace(tzinfo=timezone.utc)
+
+        if deadline in self._known:
+            return
+
+        self._known.add(deadline)
+        heapq.heappush(self._heap, deadline)
+
+        # Wake the waiter only if this is now the earliest deadline
+        if self._heap[0] == deadline:
+            self._changed.set()
+
+    def reset(self, deadlines: Iterable[datetime]) -> None:
+        self._heap = []
+        self._known = set()
+        for deadline in deadlines:
+            self.add(deadline)
+        self._changed.set()
+
+    def has_due(self, now: Optional[datetime] = None) -> bool:
+        now = now or datetime.now(timezone.utc)
+        return bool(self._heap) and self._heap[0] <= now
+
+    def pop_due(self, now: Optional[datetime] = None) -> int:
+        """Drop every deadline that has passed, returning how many were dropped"""
+        now = now or datetime.now(timezone.utc)
+        popped = 0
+
+        while self._heap and self._heap[0] <= now:
+            self._known.discard(heapq.heappop(self._heap))
+            popped += 1
+
+        return popped
+
+    async def wait(self, timeout: float) -> None:
+        """
+        Sleep until the next deadline passes, or until timeout seconds elapse.
+        An earlier deadline added meanwhile shortens the sleep.
+        """
+        until = time.monotonic() + timeout
+
+        while True:
+            remaining = until - time.monotonic()
+            if self.has_due() or remaining <= 0:
+                return
+
+            if self._heap:
+                to_deadline = (
+                    self._heap[0] - datetime.now(timezone.utc)
+                ).total_seconds()
+                remaining = min(remaining, to_deadline)
+
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                pass
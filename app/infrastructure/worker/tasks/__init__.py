@@ -1,3 +1,11 @@
 from .process_due_transactions import ProcessDueTransactionTaskWorker
+from .relay_outbox_events import RelayOutboxEventsTaskWorker
+from .snapshot_wallet_balances import SnapshotWalletBalancesTaskWorker
+from .process_paystack_webhooks import ProcessPaystackWebhooksTaskWorker
 
-__all__ = ["ProcessDueTransactionTaskWorker"]
+__all__ = [
+    "ProcessDueTransactionTaskWorker",
+    "RelayOutboxEventsTaskWorker",
+    "SnapshotWalletBalancesTaskWorker",
+    "ProcessPaystackWebhooksTaskWorker",
+]
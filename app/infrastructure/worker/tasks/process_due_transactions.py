@@ -1,42 +1,145 @@
 import asyncio
+import json
 import logging
+import time
 from datetime import datetime, timezone
+from aiokafka import AIOKafkaConsumer  # type: ignore
+from pydantic import ValidationError
+
+from app.config import settings, kafka_config
 from app.infrastructure.sqlalchemy.session import get_async_session
 from app.application.use_cases import ProcessDueSettlementsUseCase
+from app.domain.events import TransactionCreatedEvent
+from app.domain.repositories import ITransactionRepository
 from app.shared.errors import AppError
 from ..container import DIContainer
 from ..base import IWorker
+from ..settlement_schedule import SettlementSchedule
 
 logger = logging.getLogger("[ProcessDueTransactionTaskWorker]")
 
 
 class ProcessDueTransactionTaskWorker(IWorker):
     """
-    Long-running worker process that periodically checks for
-    transactions whose delayed_settlement_until timestamp has passed.
+    Long-running worker process that settles transactions whose
+    delayed_settlement_until timestamp has passed.
+
+    Upcoming deadlines are kept in a SettlementSchedule seeded from the
+    database and fed by TransactionCreatedEvent, so the worker sleeps until
+    the next deadline. A slow reconciliation poll catches anything missed.
     """
 
     def __init__(self, di: DIContainer):
         self.di = di
         self._running = True
+        self._schedule = SettlementSchedule()
+        self._feed_task: asyncio.Task | None = None
 
     async def start(self) -> None:
+        self._feed_task = asyncio.create_task(self._follow_created_transactions())
+
+        reconcile_interval = settings.settlement_reconcile_interval_seconds
+        next_reconcile = 0.0
+
+        while self._running:
+            reconcile = time.monotonic() >= next_reconcile
+            if reconcile:
+                await self._reseed_schedule()
+                next_reconcile = time.monotonic() + reconcile_interval
+
+            if reconcile or self._schedule.has_due():
+                processed = await self._process_due_settlements()
+
+                # A full batch means a backlog, so go straight for the next one
+                if (
+                    settings.settlement_bulk_mode
+                    and processed >= settings.settlement_batch_size
+                ):
+                    continue
+
+                self._schedule.pop_due()
+
+            await self._schedule.wait(max(0.0, next_reconcile - time.monotonic()))
+
+    async def _process_due_settlements(self) -> int:
+        try:
+            process_due_settlements = self.di.resolve(ProcessDueSettlementsUseCase)
+
+            now = datetime.now(timezone.utc)
+            logger.debug(f"[Worker] Checking for due settlements at {now}")
+
+            async with get_async_session() as session:
+                return await process_due_settlements.execute(session)
+        except AppError as e:
+            logger.exception(f"[Worker] Error processing settlements: {e.message}")
+        except Exception as e:
+            logger.exception(f"[Worker] Error processing settlements: {e}")
+
+        return 0
+
+    async def _reseed_schedule(self) -> None:
+        try:
+            txn_repo = self.di.resolve(ITransactionRepository)
+
+            async with get_async_session() as session:
+                txn_repo.set_session(session)
+                deadlines = await txn_repo.find_scheduled_settlement_times(
+                    settings.settlement_schedule_seed_limit
+                )
+
+            self._schedule.reset(deadlines)
+            logger.debug(f"[Worker] Seeded {len(self._schedule)} settlement deadlines")
+        except Exception as e:
+            logger.exception(f"[Worker] Error seeding settlement schedule: {e}")
+
+    async def _follow_created_transactions(self) -> None:
+        """Feed deadlines of newly scheduled transactions into the schedule"""
+        topic = (
+            f"{TransactionCreatedEvent._group}.{TransactionCreatedEvent._event_name}"
+        )
+
         while self._running:
+            # No group: every replica sees every event and nothing is committed
+            consumer = AIOKafkaConsumer(
+                topic,
+                bootstrap_servers=kafka_config.bootstrap_servers,
+                group_id=None,
+                auto_offset_reset="latest",
+                value_deserializer=lambda v: (
+                    json.loads(v.decode("utf-8")) if v else None
+                ),
+            )
+
             try:
-                process_due_settlements = self.di.resolve(ProcessDueSettlementsUseCase)
+                await consumer.start()
 
-                now = datetime.now(timezone.utc)
-                logger.debug(f"[Worker] Checking for due settlements at {now}")
+                async for message in consumer:
+                    try:
+                        event = TransactionCreatedEvent.model_validate(message.value)
+                    except ValidationError:
+                        continue
 
-                async with get_async_session() as session:
-                    await process_due_settlements.execute(session)
-            except AppError as e:
-                logger.exception(f"[Worker] Error processing settlements: {e.message}")
+                    payload = event.payload
+                    if (
+                        payload.settlement_status == "scheduled"
+                        and payload.delayed_settlement_until is not None
+                    ):
+                        self._schedule.add(payload.delayed_settlement_until)
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                logger.exception(f"[Worker] Error processing settlements: {e}")
-
-            await asyncio.sleep(60)
+                logger.exception(f"[Worker] Settlement feed failed: {e}")
+                await asyncio.sleep(5)
+            finally:
+                await consumer.stop()
 
     async def shutdown(self) -> None:
         print("CleanupWorker shutting down...")
         self._running = False
+
+        if self._feed_task is not None:
+            self._feed_task.cancel()
+            try:
+                await self._feed_task
+            except asyncio.CancelledError:
+                pass
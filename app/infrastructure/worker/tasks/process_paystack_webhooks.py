@@ -0,0 +1,168 @@
+import asyncio
+import logging
+from datetime import timedelta
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.application.use_cases import VerifyTicketPurchaseTransactionUseCase
+from app.domain.ports import IPaymentAdapter
+from app.shared.errors import AppError
+from app.infrastructure.sqlalchemy.session import get_async_session
+from app.infrastructure.sqlalchemy.models import SqlAlchemyPaystackWebhook
+from app.infrastructure.sqlalchemy.repositories import SqlAlchemyTransactionRepository
+from app.infrastructure.grpc import grpc_client
+from app.infrastructure.cache import (
+    CachedPaymentAdapter,
+    get_RedisCacheService,
+    get_PaymentStatusNotifier,
+)
+from app.infrastructure.ports import (
+    GrpcTicketService,
+    OutboxEventBus,
+    PaystackWebhookProcessor,
+    decode_paystack_webhook,
+)
+from app.infrastructure.ports.paystack_adapter import get_PaystackAdapter
+from ..container import DIContainer
+from ..base import IWorker
+
+logger = logging.getLogger("[ProcessPaystackWebhooksTaskWorker]")
+
+# Longest wait before a failed webhook is tried again
+MAX_RETRY_DELAY_SECONDS = 600
+
+
+class ProcessPaystackWebhooksTaskWorker(IWorker):
+    """
+    Long-running worker that applies the Paystack webhooks the endpoint
+    queued in the paystack_webhooks inbox.
+
+    Batches are leased with SKIP LOCKED, so replicas share the inbox, and a
+    lease that runs out hands the webhook to the next poll. Each webhook is
+    applied in its own transaction, which also deletes its row, with at most
+    paystack_webhook_concurrency in flight. Failures are retried with
+    backoff; payloads Paystack could never make valid are kept for
+    inspection but not retried.
+    """
+
+    def __init__(self, di: DIContainer):
+        self.di = di
+        self._running = True
+        self._semaphore = asyncio.Semaphore(settings.paystack_webhook_concurrency)
+        self._payment_adapter: IPaymentAdapter | None = None
+
+    async def start(self) -> None:
+        batch_size = settings.paystack_webhook_batch_size
+        poll_interval = settings.paystack_webhook_poll_interval_ms / 1000
+
+        self._payment_adapter = CachedPaymentAdapter(
+            get_PaystackAdapter(),
+            get_RedisCacheService(),
+        )
+
+        while self._running:
+            leased = 0
+
+            try:
+                batch = await self._lease_batch(batch_size)
+                leased = len(batch)
+                await asyncio.gather(*(self._process(*row) for row in batch))
+            except Exception as e:
+                logger.exception(f"[Worker] Error processing Paystack webhooks: {e}")
+
+            # Keep draining while the inbox is backed up
+            if leased < batch_size:
+                await asyncio.sleep(poll_interval)
+
+    async def _lease_batch(self, batch_size: int) -> list[tuple[int, bytes, int]]:
+        webhook = SqlAlchemyPaystackWebhook
+
+        due = (
+            select(webhook.id)
+            .where(webhook.available_at <= func.now())
+            .where(webhook.attempts < settings.paystack_webhook_max_attempts)
+            .order_by(webhook.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+
+        async with get_async_session() as session:
+            result = await session.execute(
+                update(webhook)
+                .where(webhook.id.in_(due.scalar_subquery()))
+                .values(
+                    attempts=webhook.attempts + 1,
+                    available_at=func.now()
+                    + timedelta(seconds=settings.paystack_webhook_lease_seconds),
+                )
+                .returning(webhook.id, webhook.body, webhook.attempts)
+            )
+            rows = sorted(result.all())
+
+        if rows:
+            logger.debug(f"[Worker] Leased {len(rows)} Paystack webhook(s)")
+
+        return [(row.id, row.body, row.attempts) for row in rows]
+
+    def _processor(self, session: AsyncSession) -> PaystackWebhookProcessor:
+        assert self._payment_adapter is not None
+
+        event_bus = OutboxEventBus(session)
+
+        return PaystackWebhookProcessor(
+            event_bus=event_bus,
+            verify_txn_uc=VerifyTicketPurchaseTransactionUseCase(
+                self._payment_adapter,
+                SqlAlchemyTransactionRepository(session),
+                GrpcTicketService(grpc_client.get_ticket_grpc_stub()),
+                event_bus,
+            ),
+            payment_status=get_PaymentStatusNotifier(),
+            session=session,
+        )
+
+    async def _process(self, webhook_id: int, body: bytes, attempts: int) -> None:
+        webhook = SqlAlchemyPaystackWebhook
+
+        async with self._semaphore:
+            try:
+                async with get_async_session() as session:
+                    await self._processor(session).process(
+                        decode_paystack_webhook(body)
+                    )
+                    await session.execute(
+                        delete(webhook).where(webhook.id == webhook_id)
+                    )
+                return
+            except AppError as e:
+                logger.exception(
+                    f"[Worker] Paystack webhook {webhook_id} failed "
+                    f"(attempt {attempts}): {e.message}"
+                )
+                error = e.message
+                # The same body will fail the same way next time
+                permanent = e.status_code < 500
+            except Exception as e:
+                logger.exception(
+                    f"[Worker] Paystack webhook {webhook_id} failed "
+                    f"(attempt {attempts}): {e}"
+                )
+                error = str(e) or e.__class__.__name__
+                permanent = False
+
+        values: dict = {"last_error": error}
+        if permanent:
+            values["attempts"] = settings.paystack_webhook_max_attempts
+        else:
+            delay = min(2**attempts, MAX_RETRY_DELAY_SECONDS)
+            values["available_at"] = func.now() + timedelta(seconds=delay)
+
+        async with get_async_session() as session:
+            await session.execute(
+                update(webhook).where(webhook.id == webhook_id).values(**values)
+            )
+
+    async def shutdown(self) -> None:
+        print("ProcessPaystackWebhooksTaskWorker shutting down...")
+        self._running = False
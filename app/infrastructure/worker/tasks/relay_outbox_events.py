@@ -0,0 +1,84 @@
+import asyncio
+import logging
+from sqlalchemy import select, delete, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.infrastructure.sqlalchemy.session import get_async_session
+from app.infrastructure.sqlalchemy.models import SqlAlchemyOutboxEvent
+from app.infrastructure.ports.kafka_event_bus import kafka_event_bus
+from ..container import DIContainer
+from ..base import IWorker
+
+logger = logging.getLogger("[RelayOutboxEventsTaskWorker]")
+
+# Only one relay may drain the outbox at a time so per-aggregate order holds
+OUTBOX_RELAY_LOCK_ID = 7_310_601
+
+
+class RelayOutboxEventsTaskWorker(IWorker):
+    """
+    Long-running worker that drains the outbox table to Kafka in batches,
+    oldest first, deleting rows once the broker acknowledges them.
+    """
+
+    def __init__(self, di: DIContainer):
+        self.di = di
+        self._running = True
+
+    async def start(self) -> None:
+        batch_size = settings.outbox_relay_batch_size
+        poll_interval = settings.outbox_relay_poll_interval_ms / 1000
+
+        while self._running:
+            relayed = 0
+
+            try:
+                async with get_async_session() as session:
+                    relayed = await self._relay_batch(session, batch_size)
+            except Exception as e:
+                logger.exception(f"[Worker] Error relaying outbox events: {e}")
+
+            # Keep draining while the outbox is backed up
+            if relayed < batch_size:
+                await asyncio.sleep(poll_interval)
+
+    async def _relay_batch(self, session: AsyncSession, batch_size: int) -> int:
+        locked = await session.scalar(
+            select(func.pg_try_advisory_xact_lock(OUTBOX_RELAY_LOCK_ID))
+        )
+        if not locked:
+            return 0
+
+        result = await session.execute(
+            select(
+                SqlAlchemyOutboxEvent.id,
+                SqlAlchemyOutboxEvent.topic,
+                SqlAlchemyOutboxEvent.key,
+                SqlAlchemyOutboxEvent.payload,
+            )
+            .order_by(SqlAlchemyOutboxEvent.id)
+            .limit(batch_size)
+        )
+        rows = result.all()
+
+        if not rows:
+            return 0
+
+        await kafka_event_bus.send_many(
+            [(row.topic, row.key, row.payload) for row in rows]
+        )
+
+        await session.execute(
+            delete(SqlAlchemyOutboxEvent).where(
+                SqlAlchemyOutboxEvent.id.in_([row.id for row in rows])
+            )
+        )
+
+        logger.debug(f"[Worker] Relayed {len(rows)} outbox event(s)")
+
+        return len(rows)
+
+    async def shutdown(self) -> None:
+        print("RelayOutboxEventsTaskWorker shutting down...")
+        self._running = False
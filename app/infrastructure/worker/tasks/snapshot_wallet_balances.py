@@ -0,0 +1,57 @@
+import asyncio
+import logging
+
+from app.config import settings
+from app.infrastructure.sqlalchemy.session import get_async_session
+from app.infrastructure.sqlalchemy.repositories import SqlAlchemyWalletRepository
+from ..container import DIContainer
+from ..base import IWorker
+
+logger = logging.getLogger("[SnapshotWalletBalancesTaskWorker]")
+
+
+class SnapshotWalletBalancesTaskWorker(IWorker):
+    """
+    Long-running worker that folds ledger entries into per-wallet balance
+    snapshots, so a balance read only sums the entries since the last one.
+    """
+
+    def __init__(self, di: DIContainer):
+        self.di = di
+        self._running = True
+
+    async def start(self) -> None:
+        interval = settings.wallet_snapshot_interval_seconds
+
+        while self._running:
+            try:
+                snapshotted = await self._snapshot_batch()
+                if snapshotted:
+                    logger.debug(f"[Worker] Snapshotted {snapshotted} wallet(s)")
+            except Exception as e:
+                logger.exception(f"[Worker] Error snapshotting wallet balances: {e}")
+
+            await asyncio.sleep(interval)
+
+    async def _snapshot_batch(self) -> int:
+        async with get_async_session() as session:
+            wallet_repo = SqlAlchemyWalletRepository(session)
+            user_ids = await wallet_repo.find_wallets_to_snapshot(
+                settings.wallet_snapshot_min_entries,
+                settings.wallet_snapshot_batch_size,
+            )
+
+        # One short transaction per wallet, so the exclusive lock only ever
+        # holds back credits to a single wallet
+        for user_id in user_ids:
+            if not self._running:
+                break
+
+            async with get_async_session() as session:
+                await SqlAlchemyWalletRepository(session).snapshot_balance(user_id)
+
+        return len(user_ids)
+
+    async def shutdown(self) -> None:
+        print("SnapshotWalletBalancesTaskWorker shutting down...")
+        self._running = False
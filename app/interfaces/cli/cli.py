@@ -7,6 +7,11 @@ from .commands import (
     list_transactions,
     update_transaction_status,
     verify_ticket_purchase,
+    bench_transaction_queries,
+    bench_transaction_hydration,
+    bench_pin_loop_lag,
+    bench_webhook_decode,
+    bench_http_hedge,
 )
 
 logging.basicConfig(
@@ -25,6 +30,11 @@ cli.add_command(seed_charges)
 cli.add_command(list_transactions, "view:transactions")
 cli.add_command(update_transaction_status, "update:transaction:status")
 cli.add_command(verify_ticket_purchase, "verify:ticket:purchase")
+cli.add_command(bench_transaction_queries, "bench:transaction:queries")
+cli.add_command(bench_transaction_hydration, "bench:transaction:hydration")
+cli.add_command(bench_pin_loop_lag, "bench:pin:loop-lag")
+cli.add_command(bench_webhook_decode, "bench:webhook:decode")
+cli.add_command(bench_http_hedge, "bench:http:hedge")
 
 if __name__ == "__main__":
     cli()
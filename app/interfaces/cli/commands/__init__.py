@@ -2,10 +2,20 @@ from .seed_charges import seed_charges
 from .view_transactions import list_transactions
 from .set_transaction_status import update_transaction_status
 from .verify_ticket_purchase import verify_ticket_purchase
+from .bench_transaction_queries import bench_transaction_queries
+from .bench_transaction_hydration import bench_transaction_hydration
+from .bench_pin_loop_lag import bench_pin_loop_lag
+from .bench_webhook_decode import bench_webhook_decode
+from .bench_http_hedge import bench_http_hedge
 
 __all__ = [
     "seed_charges",
     "list_transactions",
     "update_transaction_status",
     "verify_ticket_purchase",
+    "bench_transaction_queries",
+    "bench_transaction_hydration",
+    "bench_pin_loop_lag",
+    "bench_webhook_decode",
+    "bench_http_hedge",
 ]
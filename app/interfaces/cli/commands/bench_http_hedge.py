@@ -0,0 +1,191 @@
+import json
+import click
+import logging
+import random
+import asyncio
+import statistics
+from time import perf_counter
+
+from app.config import HttpClientSettings
+from app.shared.metrics import gauge_metric
+from app.utils.external_api_client import ExternalAPIClient
+
+
+class _StubServer:
+    """
+    Keep-alive HTTP/1.1 JSON server on localhost with injected latency: most
+    answers take `latency`, a `slow_rate` share take `slow_latency` and a
+    `fail_rate` share answer 503.
+    """
+
+    def __init__(
+        self,
+        latency: float,
+        slow_latency: float,
+        slow_rate: float,
+        fail_rate: float,
+    ) -> None:
+        self.latency = latency
+        self.slow_latency = slow_latency
+        self.slow_rate = slow_rate
+        self.fail_rate = fail_rate
+        self.hits = 0
+        self._server: asyncio.Server | None = None
+
+    async def _handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        try:
+            while await reader.readline():
+                length = 0
+                while (header := await reader.readline()) not in (b"\r\n", b""):
+                    name, _, value = header.partition(b":")
+                    if name.strip().lower() == b"content-length":
+                        length = int(value)
+                if length:
+                    await reader.readexactly(length)
+
+                self.hits += 1
+                slow = random.random() < self.slow_rate
+                await asyncio.sleep(self.slow_latency if slow else self.latency)
+
+                if random.random() < self.fail_rate:
+                    status, body = "503 Service Unavailable", {"message": "down"}
+                else:
+                    status, body = "200 OK", {"status": True, "data": {}}
+
+                payload = json.dumps(body).encode()
+                writer.write(
+                    f"HTTP/1.1 {status}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(payload)}\r\n\r\n".encode()
+                    + payload
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+
+
+async def _run(
+    client: ExternalAPIClient,
+    requests: int,
+    concurrency: int,
+    hedge: bool,
+) -> tuple[int, list[float]]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    failures = 0
+
+    async def call() -> None:
+        nonlocal failures
+        async with semaphore:
+            started = perf_counter()
+            try:
+                await client._get("/extras", hedge=hedge)
+            except Exception:
+                failures += 1
+            latencies.append(perf_counter() - started)
+
+    await asyncio.gather(*(call() for _ in range(requests)))
+    return failures, sorted(latencies)
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:8.2f} ms"
+
+
+@click.command()
+@click.option("--requests", prompt=False, default=400, type=int)
+@click.option("--concurrency", prompt=False, default=10, type=int)
+@click.option("--latency-ms", prompt=False, default=10, type=int)
+@click.option("--slow-latency-ms", prompt=False, default=400, type=int)
+@click.option("--slow-rate", prompt=False, default=0.05, type=float)
+@click.option("--fail-rate", prompt=False, default=0.05, type=float)
+@click.option("--hedge-delay-ms", prompt=False, default=50, type=int)
+def bench_http_hedge(
+    requests: int,
+    concurrency: int,
+    latency_ms: int,
+    slow_latency_ms: int,
+    slow_rate: float,
+    fail_rate: float,
+    hedge_delay_ms: int,
+):
+    """Run reads against a local stub with injected latency and failures"""
+
+    # One log line per request and retry would drown the results
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("app.utils.external_api_client").setLevel(logging.CRITICAL)
+
+    async def _bench():
+        stub = _StubServer(
+            latency=latency_ms / 1000,
+            slow_latency=slow_latency_ms / 1000,
+            slow_rate=slow_rate,
+            fail_rate=fail_rate,
+        )
+        url = await stub.start()
+
+        runs = (
+            ("single attempt", 1, None),
+            ("retries", 3, None),
+            ("retries + hedging", 3, hedge_delay_ms),
+        )
+
+        try:
+            for label, attempts, hedge_delay in runs:
+                name = f"bench.{label.replace(' ', '')}"
+                client = ExternalAPIClient(
+                    url,
+                    config=HttpClientSettings(
+                        retry_max_attempts=attempts,
+                        retry_base_delay_ms=latency_ms,
+                        hedge_delay_ms=hedge_delay,
+                    ),
+                    name=name,
+                )
+                stub.hits = 0
+
+                try:
+                    failures, latencies = await _run(
+                        client,
+                        requests,
+                        concurrency,
+                        hedge=hedge_delay is not None,
+                    )
+                finally:
+                    await client.close()
+
+                click.echo(f"\n=== {label} ===")
+                click.echo(
+                    f"{requests - failures}/{requests} succeeded, "
+                    f"{stub.hits} requests reached the stub"
+                )
+                click.echo(f"p50: {_ms(statistics.median(latencies))}")
+                click.echo(f"p99: {_ms(latencies[(len(latencies) - 1) * 99 // 100])}")
+                click.echo(f"max: {_ms(latencies[-1])}")
+
+                counters = ("retries", "retry_budget_exhausted", "hedges", "hedge_wins")
+                click.echo(
+                    ", ".join(
+                        f"{counter}={gauge_metric(f'http.{name}.{counter}').value}"
+                        for counter in counters
+                    )
+                )
+        finally:
+            await stub.stop()
+
+    asyncio.run(_bench())
@@ -0,0 +1,149 @@
+import click
+import asyncio
+import bcrypt  # type: ignore
+import statistics
+from time import perf_counter
+from decimal import Decimal
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from app.config import settings
+from app.domain.entities import ChargeSettingVersion, PriceRangeTier
+from app.infrastructure.ports.bcrypt_pin_hasher import BcryptPinHasher
+from app.shared.metrics import latency_metric
+
+PIN = "4821"
+
+
+def _quote_version() -> ChargeSettingVersion:
+    return ChargeSettingVersion(
+        version_number=1,
+        tiers=[
+            PriceRangeTier(
+                min_price=Decimal(low),
+                max_price=Decimal(high) if high else None,
+                percentage_rate=Decimal(rate),
+                additional_charge=Decimal("100"),
+            )
+            for low, high, rate in (
+                ("0", "4999.99", "5"),
+                ("5000", "19999.99", "4"),
+                ("20000", None, "3"),
+            )
+        ],
+        effective_from=datetime.now(timezone.utc),
+        created_by="bench",
+        charge_setting_id=uuid4(),
+    )
+
+
+async def _quotes(
+    version: ChargeSettingVersion,
+    interval: float,
+    stop: asyncio.Event,
+) -> list[float]:
+    """
+    One charge quote every interval, as a steady stream of quote requests
+    would arrive. A quote's latency is how long after it was due it got
+    the loop, plus the quote itself.
+    """
+    latencies = []
+
+    while not stop.is_set():
+        due = perf_counter() + interval
+        await asyncio.sleep(interval)
+        version.calculate_charge(Decimal("15000"))
+        latencies.append(perf_counter() - due)
+
+    return latencies
+
+
+async def _run(
+    inline: bool,
+    hasher: BcryptPinHasher,
+    hashed: str,
+    verifications: int,
+    concurrency: int,
+    interval: float,
+) -> tuple[float, list[float]]:
+    stop = asyncio.Event()
+    quotes = asyncio.create_task(_quotes(_quote_version(), interval, stop))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def verify() -> None:
+        async with semaphore:
+            if inline:
+                # The previous behaviour: bcrypt on the event loop
+                bcrypt.checkpw(PIN.encode("utf-8"), hashed.encode("utf-8"))
+                await asyncio.sleep(0)
+            else:
+                await hasher.verify(PIN, hashed)
+
+    started = perf_counter()
+    await asyncio.gather(*(verify() for _ in range(verifications)))
+    elapsed = perf_counter() - started
+
+    stop.set()
+    return elapsed, await quotes
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:8.2f} ms"
+
+
+@click.command()
+@click.option("--verifications", prompt=False, default=40, type=int)
+@click.option("--concurrency", prompt=False, default=8, type=int)
+@click.option(
+    "--quote-interval-ms",
+    prompt=False,
+    default=5,
+    type=int,
+    help="How often a charge quote arrives while the PINs are verified",
+)
+def bench_pin_loop_lag(verifications: int, concurrency: int, quote_interval_ms: int):
+    """Show how PIN verification delays concurrent charge quotes"""
+
+    async def _bench():
+        hasher = BcryptPinHasher(
+            rounds=settings.pin_hash_rounds,
+            max_workers=settings.pin_hash_max_workers,
+        )
+
+        try:
+            hashed = await hasher.hash(PIN)
+
+            for label, inline in (("on the event loop", True), ("thread pool", False)):
+                elapsed, latencies = await _run(
+                    inline,
+                    hasher,
+                    hashed,
+                    verifications,
+                    concurrency,
+                    quote_interval_ms / 1000,
+                )
+                latencies.sort()
+
+                click.echo(f"\n=== bcrypt {label} ===")
+                click.echo(
+                    f"{verifications} PIN verifications in {_ms(elapsed)}, "
+                    f"{len(latencies)} quotes served"
+                )
+                if latencies:
+                    p50 = statistics.median(latencies)
+                    p99 = latencies[(len(latencies) - 1) * 99 // 100]
+                    click.echo(f"quote latency p50: {_ms(p50)}")
+                    click.echo(f"quote latency p99: {_ms(p99)}")
+                    click.echo(f"quote latency max: {_ms(latencies[-1])}")
+        finally:
+            hasher.shutdown()
+
+        queue_wait = latency_metric("pin_hasher.queue_wait").snapshot()
+        click.echo(
+            f"\npin_hasher.queue_wait: avg {_ms(queue_wait['avg_seconds'])}, "
+            f"max {_ms(queue_wait['max_seconds'])} "
+            f"(rounds={settings.pin_hash_rounds}, "
+            f"workers={settings.pin_hash_max_workers})"
+        )
+
+    asyncio.run(_bench())
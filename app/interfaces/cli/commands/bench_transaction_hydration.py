@@ -0,0 +1,208 @@
+import json
+import click
+import asyncio
+import timeit
+from decimal import Decimal
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+from typing import Callable
+from sqlalchemy import select
+
+from app.domain.entities import Transaction
+from app.domain.entities.value_objects import (
+    ChargeData,
+    SettlementData,
+    SettlementDataResource,
+)
+from app.infrastructure.sqlalchemy.models import SqlAlchemyTransaction
+from app.infrastructure.sqlalchemy.session import get_sessionmaker
+
+
+def _sample_row() -> SqlAlchemyTransaction:
+    """A ticket purchase as it comes back from the database"""
+    txn = Transaction.create(
+        amount=Decimal("15250.00"),
+        user_id=uuid4(),
+        resource="ticket",
+        resource_id=uuid4(),
+        reference=uuid4(),
+        occurred_on=datetime.now(timezone.utc),
+        transaction_type="purchase",
+        source="payment_provider",
+        charge_data=[
+            ChargeData(
+                charge_setting_id=str(uuid4()),
+                version_id=str(uuid4()),
+                version_number=3,
+                charge_amount=Decimal("250.00"),
+                sponsored=False,
+                charge_group=group,
+            )
+            for group in ("ticket", "extras")
+        ],
+        settlement_data=[
+            SettlementData(
+                amount=Decimal("3750.00"),
+                recipient_user=uuid4(),
+                transaction_type=txn_type,
+                role=role,
+                resource=SettlementDataResource(resource="ticket", resource_id=uuid4()),
+            )
+            for txn_type, role in (
+                ("sale", "organizer"),
+                ("commission", "referrer"),
+                ("commission", "referrer"),
+                ("fee", "system_admin"),
+            )
+        ],
+        metadata={
+            "event": {"id": str(uuid4()), "occurrence": str(uuid4())},
+            "ticket": {"id": str(uuid4()), "quantity": 2},
+        },
+    )
+
+    row = SqlAlchemyTransaction.from_domain(txn)
+    # JSON columns come back as plain dicts and strings
+    row.charge_data = json.loads(json.dumps(row.charge_data))
+    row.settlement_data = json.loads(json.dumps(row.settlement_data))
+
+    return row
+
+
+def _per_item_validation(row: SqlAlchemyTransaction) -> Transaction:
+    """The previous to_domain: model_validate per nested item, then the entity"""
+    return Transaction(
+        id=row.id,
+        amount=row.amount,
+        user_id=row.user_id,
+        resource=row.resource,
+        resource_id=row.resource_id,
+        reference=row.reference,
+        source=row.source,
+        occurred_on=row.occurred_on,
+        charge_data=(
+            [ChargeData.model_validate(c) for c in row.charge_data]
+            if isinstance(row.charge_data, list)
+            else ChargeData.model_validate(row.charge_data) if row.charge_data else None
+        ),
+        settlement_status=row.settlement_status,
+        transaction_type=row.transaction_type,
+        transaction_direction=row.transaction_direction,
+        settlement_data=[SettlementData.model_validate(s) for s in row.settlement_data],
+        created_at=row.created_at,
+        metadata=row.metadata_,
+        parent_id=row.parent_id,
+        delayed_settlement_until=row.delayed_settlement_until,
+    )
+
+
+def _model_construct(row: SqlAlchemyTransaction) -> Transaction:
+    """No validation at all, converting only what JSON cannot carry"""
+
+    def charge(c: dict) -> ChargeData:
+        return ChargeData.model_construct(
+            **{**c, "charge_amount": Decimal(c["charge_amount"])}
+        )
+
+    def settlement(s: dict) -> SettlementData:
+        resource = s.get("resource")
+        if resource is not None:
+            resource_id = resource.get("resource_id")
+            resource = SettlementDataResource.model_construct(
+                resource=resource["resource"],
+                resource_id=UUID(resource_id) if resource_id else None,
+            )
+
+        return SettlementData.model_construct(
+            **{
+                **s,
+                "amount": Decimal(s["amount"]),
+                "recipient_user": UUID(s["recipient_user"]),
+                "resource": resource,
+            }
+        )
+
+    return Transaction.model_construct(
+        id=row.id,
+        amount=row.amount,
+        user_id=row.user_id,
+        resource=row.resource,
+        resource_id=row.resource_id,
+        reference=row.reference,
+        source=row.source,
+        occurred_on=row.occurred_on,
+        charge_data=(
+            [charge(c) for c in row.charge_data]
+            if isinstance(row.charge_data, list)
+            else charge(row.charge_data) if row.charge_data else None
+        ),
+        settlement_status=row.settlement_status,
+        transaction_type=row.transaction_type,
+        transaction_direction=row.transaction_direction,
+        settlement_data=[settlement(s) for s in row.settlement_data],
+        created_at=row.created_at,
+        metadata=row.metadata_,
+        parent_id=row.parent_id,
+        delayed_settlement_until=row.delayed_settlement_until,
+    )
+
+
+STRATEGIES: dict[str, Callable[[SqlAlchemyTransaction], Transaction]] = {
+    "per-item validation (before)": _per_item_validation,
+    "model_construct": _model_construct,
+    "single pass (to_domain)": SqlAlchemyTransaction.to_domain,
+}
+
+
+async def _load_rows(limit: int) -> list[SqlAlchemyTransaction]:
+    async with get_sessionmaker()() as session:
+        result = await session.execute(
+            select(SqlAlchemyTransaction)
+            .order_by(SqlAlchemyTransaction.occurred_on.desc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+
+@click.command()
+@click.option("--rows", prompt=False, default=100, type=int)
+@click.option("--repeat", prompt=False, default=200, type=int)
+@click.option(
+    "--from-db",
+    prompt=False,
+    is_flag=True,
+    help="Hydrate the latest transactions from the database instead of samples",
+)
+def bench_transaction_hydration(rows: int, repeat: int, from_db: bool):
+    """Compare ways of hydrating transaction rows into entities"""
+    entities = (
+        asyncio.run(_load_rows(rows))
+        if from_db
+        else [_sample_row() for _ in range(rows)]
+    )
+
+    if not entities:
+        click.echo("No transactions to hydrate")
+        return
+
+    width = max(len(name) for name in STRATEGIES)
+    baseline = None
+
+    for name, hydrate in STRATEGIES.items():
+        # Every strategy must rebuild the same entities
+        assert all(hydrate(e) == _per_item_validation(e) for e in entities)
+
+        best = min(
+            timeit.repeat(
+                lambda: [hydrate(e) for e in entities],
+                number=1,
+                repeat=repeat,
+            )
+        )
+        baseline = baseline or best
+
+        click.echo(
+            f"{name:>{width}}: {best * 1000:8.3f} ms per {len(entities)} rows, "
+            f"{best / len(entities) * 1_000_000:7.2f} us per row, "
+            f"{baseline / best:.2f}x"
+        )
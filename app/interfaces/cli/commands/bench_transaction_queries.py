@@ -0,0 +1,155 @@
+import click
+import asyncio
+from datetime import datetime, timezone
+from uuid import UUID
+from sqlalchemy import select, func, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.sqlalchemy.models import SqlAlchemyTransaction
+from app.infrastructure.sqlalchemy.session import get_sessionmaker
+from app.infrastructure.sqlalchemy.explain import Explain
+
+# Indexes added by d7a3f19c5e44, dropped inside a rolled back transaction to
+# show the "before" plans
+TRANSACTION_QUERY_INDEXES = [
+    "ix_transactions_scheduled_settlement",
+    "ix_transactions_user_id_occurred_on",
+    "ix_transactions_metadata_event",
+    "ix_transactions_parent_id",
+]
+
+
+async def _sample_ids(session: AsyncSession) -> dict:
+    """Pick the busiest user, one of their events and a parent transaction"""
+    T = SqlAlchemyTransaction
+
+    user_id = (
+        await session.execute(
+            select(T.user_id)
+            .group_by(T.user_id)
+            .order_by(func.count().desc())
+            .limit(1)
+        )
+    ).scalar_one_or_none()
+
+    event = (
+        await session.execute(
+            select(T.event_metadata("id"), T.event_metadata("occurrence"))
+            .where(T.user_id == user_id)
+            .where(T.event_metadata("id").is_not(None))
+            .limit(1)
+        )
+    ).first()
+
+    parent_id = (
+        await session.execute(
+            select(T.parent_id).where(T.parent_id.is_not(None)).limit(1)
+        )
+    ).scalar_one_or_none()
+
+    return {
+        "user_id": user_id,
+        "event_id": event[0] if event else None,
+        "occurrence_id": event[1] if event else None,
+        "parent_id": parent_id,
+    }
+
+
+def _hot_queries(ids: dict, batch_size: int, page_size: int) -> dict:
+    T = SqlAlchemyTransaction
+    user_id = ids["user_id"] or UUID(int=0)
+
+    return {
+        "claim due scheduled settlements": (
+            select(T)
+            .where(T.settlement_status == "scheduled")
+            .where(T.delayed_settlement_until <= datetime.now(timezone.utc))
+            .order_by(T.delayed_settlement_until)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        ),
+        "user transaction history": (
+            select(T)
+            .where(T.user_id == user_id)
+            .order_by(T.occurred_on.desc())
+            .limit(page_size)
+        ),
+        "user transactions for an event occurrence": (
+            select(T)
+            .where(T.user_id == user_id)
+            .where(T.event_metadata("id") == str(ids["event_id"]))
+            .where(T.event_metadata("occurrence") == str(ids["occurrence_id"]))
+            .order_by(T.occurred_on.desc())
+            .limit(page_size)
+        ),
+        "child transactions": (
+            select(T).where(T.parent_id == (ids["parent_id"] or UUID(int=0)))
+        ),
+    }
+
+
+async def _explain(session: AsyncSession, stmt, analyze: bool) -> str:
+    result = await session.execute(Explain(stmt, analyze=analyze))
+    return "\n".join(row[0] for row in result)
+
+
+@click.command()
+@click.option(
+    "--analyze",
+    prompt=False,
+    is_flag=True,
+    help="Run EXPLAIN ANALYZE (executes the queries) instead of plain EXPLAIN",
+)
+@click.option(
+    "--compare",
+    prompt=False,
+    is_flag=True,
+    help=(
+        "Also show plans without the new indexes. Drops them in a rolled back "
+        "transaction, which locks the transactions table: never use on production"
+    ),
+)
+@click.option("--batch-size", prompt=False, default=1000, type=int)
+@click.option("--page-size", prompt=False, default=20, type=int)
+def bench_transaction_queries(
+    analyze: bool,
+    compare: bool,
+    batch_size: int,
+    page_size: int,
+):
+    """Show query plans for the hot transaction queries"""
+
+    async def _run():
+        session = get_sessionmaker()()
+
+        try:
+            ids = await _sample_ids(session)
+            queries = _hot_queries(ids, batch_size, page_size)
+
+            plans: dict[str, dict[str, str]] = {name: {} for name in queries}
+
+            if compare:
+                for name in TRANSACTION_QUERY_INDEXES:
+                    await session.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+                for name, stmt in queries.items():
+                    plans[name]["before"] = await _explain(session, stmt, analyze)
+
+                await session.rollback()
+
+            for name, stmt in queries.items():
+                plans[name]["after"] = await _explain(session, stmt, analyze)
+
+            # EXPLAIN ANALYZE of the claim query takes row locks
+            await session.rollback()
+        finally:
+            await session.close()
+
+        for name, versions in plans.items():
+            click.echo(f"\n=== {name} ===")
+            for label, plan in versions.items():
+                if compare:
+                    click.echo(f"\n--- {label} ---")
+                click.echo(plan)
+
+    asyncio.run(_run())
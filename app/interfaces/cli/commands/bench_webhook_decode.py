@@ -0,0 +1,185 @@
+import json
+import click
+import timeit
+from uuid import uuid4
+from typing import Callable
+
+from app.application.dto.checkout import CheckoutMetaData
+from app.infrastructure.ports.paystack_adapter import (
+    PaystackEvent,
+    PaystackTransferSuccessEvent,
+    ChargeData,
+)
+from app.infrastructure.ports.paystack_webhook import (
+    decode_paystack_webhook,
+    paystack_webhook_key,
+)
+
+
+def _charge_success_body() -> bytes:
+    """A ticket purchase charge.success as Paystack delivers it"""
+    user = str(uuid4())
+    event_id, occurrence_id = str(uuid4()), str(uuid4())
+
+    def charge(base: str, calculated: str) -> dict:
+        return {
+            "base_amount": base,
+            "charge_setting_id": str(uuid4()),
+            "version_id": str(uuid4()),
+            "version_number": 3,
+            "calculated_charge": calculated,
+            "sponsored": False,
+            "user": user,
+            "event_id": event_id,
+            "occurrence_id": occurrence_id,
+        }
+
+    return json.dumps(
+        {
+            "event": "charge.success",
+            "data": {
+                "id": 4099260516,
+                "domain": "live",
+                "status": "success",
+                "reference": str(uuid4()),
+                "amount": 3160000,
+                "message": None,
+                "gateway_response": "Successful",
+                "paid_at": "2026-10-17T14:03:11.000Z",
+                "created_at": "2026-10-17T14:02:40.000Z",
+                "channel": "card",
+                "currency": "NGN",
+                "ip_address": "102.89.34.17",
+                "metadata": {
+                    "action": "ticket_purchase",
+                    "referrer": "https://tickets.example.com/e/launch-party",
+                    "ticket_charge": {
+                        **charge("15000", "550"),
+                        "ticket_type_id": str(uuid4()),
+                        "quantity": 2,
+                        "pay_more_amount": None,
+                    },
+                    "extras_charge": charge("500", "50"),
+                    "signature": "9f2c" * 16,
+                    "is_gate_purchase": False,
+                },
+                "log": {
+                    "start_time": 1760709760,
+                    "time_spent": 31,
+                    "attempts": 1,
+                    "errors": 0,
+                    "success": True,
+                    "mobile": False,
+                    "input": [],
+                    "history": [
+                        {"type": "action", "message": "Attempted to pay", "time": 1},
+                        {"type": "success", "message": "Successfully paid", "time": 31},
+                    ],
+                },
+                "fees": 57400,
+                "fees_split": None,
+                "fees_breakdown": None,
+                "authorization": {
+                    "authorization_code": "AUTH_8dfhjjdt",
+                    "bin": "408408",
+                    "last4": "4081",
+                    "exp_month": "12",
+                    "exp_year": "2030",
+                    "channel": "card",
+                    "card_type": "visa",
+                    "bank": "TEST BANK",
+                    "country_code": "NG",
+                    "brand": "visa",
+                    "reusable": True,
+                    "signature": "SIG_idyuhgd87dUYSHO92D",
+                },
+                "customer": {
+                    "id": 84312,
+                    "first_name": "Ada",
+                    "last_name": "Obi",
+                    "email": "ada@example.com",
+                    "customer_code": "CUS_hdhye17yj8qd2tx",
+                    "phone": None,
+                    "metadata": None,
+                    "risk_action": "default",
+                    "international_format_phone": None,
+                },
+                "plan": {},
+                "subaccount": {},
+                "split": {},
+                "order_id": None,
+                "paidAt": "2026-10-17T14:03:11.000Z",
+                "requested_amount": 3160000,
+                "pos_transaction_data": None,
+                "source": {"type": "web", "source": "checkout"},
+            },
+        }
+    ).encode("utf-8")
+
+
+def _before(raw_body: bytes) -> CheckoutMetaData:
+    """The previous webhook path, parse by parse"""
+    schemas = {
+        "transfer.success": PaystackEvent[PaystackTransferSuccessEvent],
+        "charge.success": PaystackEvent[ChargeData],
+    }
+
+    # Idempotency key, then req.json()
+    key_body = json.loads(raw_body)
+    _ = f"paystack:{key_body['event']}:{key_body['data']['reference']}"
+    body = json.loads(raw_body)
+
+    parsed = schemas[body["event"]].model_validate(body)
+    metadata = parsed.data.metadata
+
+    # Metadata logged, then validated by the webhook and again by the use case
+    _ = json.dumps(metadata)
+    metadata.pop("referrer", None)
+    CheckoutMetaData.model_validate(metadata)
+
+    return CheckoutMetaData.model_validate(metadata)
+
+
+def _after(raw_body: bytes) -> CheckoutMetaData:
+    """One validation of the raw bytes, metadata validated once"""
+    parsed = decode_paystack_webhook(raw_body)
+    _ = paystack_webhook_key(parsed)
+
+    return CheckoutMetaData.model_validate(parsed.data.metadata)
+
+
+STRATEGIES: dict[str, Callable[[bytes], CheckoutMetaData]] = {
+    "json.loads + per-request schema (before)": _before,
+    "validate_json on bytes (decode_paystack_webhook)": _after,
+}
+
+
+@click.command()
+@click.option("--number", prompt=False, default=2000, type=int)
+@click.option("--repeat", prompt=False, default=7, type=int)
+def bench_webhook_decode(number: int, repeat: int):
+    """Compare ways of decoding a charge.success webhook body"""
+    raw_body = _charge_success_body()
+
+    # Both paths must arrive at the same metadata
+    assert _before(raw_body) == _after(raw_body)
+
+    click.echo(f"charge.success body: {len(raw_body)} bytes")
+
+    width = max(len(name) for name in STRATEGIES)
+    baseline = None
+
+    for name, decode in STRATEGIES.items():
+        best = min(
+            timeit.repeat(
+                lambda: decode(raw_body),
+                number=number,
+                repeat=repeat,
+            )
+        )
+        baseline = baseline or best
+
+        click.echo(
+            f"{name:>{width}}: {best / number * 1_000_000:7.2f} us per webhook, "
+            f"{baseline / best:.2f}x"
+        )
@@ -10,6 +10,7 @@ from pydantic import BaseModel
 from app.domain.entities import ChargeSetting, ChargeSettingVersion, PriceRangeTier
 from app.domain.entities.charge_setting_version import TierOverlapStrategy
 from app.infrastructure.sqlalchemy.session import get_async_session
+from app.infrastructure.cache import get_ChargeSettingCache, get_RedisCacheService
 
 from ..factory import (
     get_charge_setting_repo,
@@ -107,4 +108,8 @@ def seed_charges(force: bool):
                 traceback.print_exc()
                 sys.exit(1)
 
+        # Running services keep charge settings in memory
+        await get_ChargeSettingCache().invalidate()
+        await get_RedisCacheService().dispose()
+
     asyncio.run(run())
@@ -6,7 +6,7 @@ from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
-from app.config import grpc_config, settings
+from app.config import grpc_config, settings, event_svc_http_config
 from app.config.http import HttpSettings
 from app.config.sqlalchemy import DatabaseSettings
 from app.shared.errors import AppError
@@ -20,10 +20,25 @@ from app.infrastructure.ports.paystack_adapter import (
     get_PaystackAdapter,
     dispose_PaystackAdapter,
 )
-from app.infrastructure.cache import get_RedisCacheService
+from app.infrastructure.ports.bcrypt_pin_hasher import (
+    get_BcryptPinHasher,
+    dispose_BcryptPinHasher,
+)
+from app.infrastructure.cache import (
+    get_RedisCacheService,
+    get_ChargeSettingCache,
+    CachedPaymentAdapter,
+    get_PaymentStatusNotifier,
+    WebhookIdempotencyFilter,
+    CachedEventService,
+)
 from app.infrastructure.ports.http_event_service import HttpEventService
-from app.application.event_handlers import TransactionEventHandler
+from app.application.event_handlers import (
+    TransactionEventHandler,
+    PaymentStatusEventHandler,
+)
 from app.utils.external_api_client import ExternalAPIClient
+from app.shared.metrics import metrics_snapshot
 from .endpoints.v1 import charges, checkout, wallet, webhook, public, transaction
 
 logger = logging.getLogger(__name__)
@@ -32,6 +47,7 @@ logger = logging.getLogger(__name__)
 async def setup_handlers(event_bus: IEventBus):
     handlers = [
         TransactionEventHandler(),
+        PaymentStatusEventHandler(),
     ]
 
     for handler in handlers:
@@ -65,13 +81,37 @@ async def app_lifespan(app: FastAPI):
 
     event_svc_client = ExternalAPIClient(
         base_url=settings.event_svc_url,
+        config=event_svc_http_config,
+        name="event_service",
+    )
+    cache_service = get_RedisCacheService()
+    app.state.cache_service = cache_service
+
+    event_service = CachedEventService(
+        HttpEventService(
+            event_svc_client,
+            max_concurrency=settings.event_svc_extras_concurrency,
+            bulk_lookup=settings.event_svc_bulk_extras,
+        ),
+        cache_service,
+        ttl=settings.extra_price_cache_ttl_seconds,
     )
-    event_service = HttpEventService(event_svc_client)
 
     app.state.event_service = event_service
 
-    cache_service = get_RedisCacheService()
-    app.state.cache_service = cache_service
+    charge_setting_cache = get_ChargeSettingCache()
+    charge_setting_cache.start()
+    app.state.charge_setting_cache = charge_setting_cache
+
+    payment_status = get_PaymentStatusNotifier()
+    payment_status.start()
+    app.state.payment_status = payment_status
+
+    app.state.webhook_filter = WebhookIdempotencyFilter(
+        cache_service,
+        ttl=settings.paystack_webhook_dedupe_ttl_seconds,
+        inflight_ttl=settings.paystack_webhook_inflight_ttl_seconds,
+    )
 
     await setup_handlers(kafka_event_bus)
     await kafka_event_bus.connect()
@@ -84,7 +124,11 @@ async def app_lifespan(app: FastAPI):
         app.state.ticket_channel
     )
 
-    app.state.paystack_adapter = get_PaystackAdapter()
+    app.state.paystack_adapter = CachedPaymentAdapter(
+        get_PaystackAdapter(),
+        cache_service,
+    )
+    app.state.pin_hasher = get_BcryptPinHasher()
 
     logger.info("Application startup complete")
 
@@ -93,9 +137,12 @@ async def app_lifespan(app: FastAPI):
     # 4. Cleanup
     await grpc_client.close_ticket_grpc_client()
     await grpc_client.close_user_grpc_client()
+    await charge_setting_cache.stop()
+    await payment_status.stop()
     await cache_service.dispose()
     await event_svc_client.client.aclose()
     await dispose_PaystackAdapter()
+    dispose_BcryptPinHasher()
     await kafka_event_bus.disconnect()
     # await permify_client.client.aclose()
     logger.info("Application shutdown complete")
@@ -157,3 +204,8 @@ async def app_exception_handler(_: Request, err: AppError):
 @app.get("/healthz")
 async def health_check():
     return {"status": "ok"}
+
+
+@app.get("/metrics")
+async def metrics():
+    return metrics_snapshot()
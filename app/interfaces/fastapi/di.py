@@ -15,8 +15,19 @@ from app.infrastructure.sqlalchemy.repositories import (
     SqlAlchemyTransactionRepository,
     SqlAlchemyWalletRepository,
 )
-from app.domain.ports import IPaymentAdapter, IEventBus, IEventService, ICacheService
-from app.infrastructure.ports import GrpcTicketService, GrpcUserService
+from app.domain.ports import (
+    IPaymentAdapter,
+    IEventBus,
+    IEventService,
+    ICacheService,
+    IPinHasher,
+)
+from app.infrastructure.ports import (
+    GrpcTicketService,
+    GrpcUserService,
+    OutboxEventBus,
+    PaystackWebhookProcessor,
+)
 from app.domain.services import ChargeCalculationService
 from app.application.use_cases import (
     RequestChargeUseCase,
@@ -24,6 +35,7 @@ from app.application.use_cases import (
     VerifyTicketPurchaseTransactionUseCase,
     ListTransactionUseCase,
     GetBalanceUseCase,
+    GetWalletStatementUseCase,
     SetTransactionPinUseCase,
     ResolvePersonalAccountUseCase,
     ListBanksUseCase,
@@ -33,6 +45,13 @@ from app.application.use_cases import (
     UpdateTransactionStatusUseCase,
 )
 from app.infrastructure.grpc import grpc_client
+from app.infrastructure.cache import (
+    ChargeSettingCache,
+    CachedChargeSettingRepository,
+    CachedChargeSettingVersionRepository,
+    PaymentStatusNotifier,
+    WebhookIdempotencyFilter,
+)
 
 
 async def get_db() -> AsyncIterator[AsyncSession]:
@@ -44,12 +63,11 @@ DbSession = Annotated[AsyncSession, Depends(get_db)]
 
 
 def get_IEventBus(
-    request: Request,
+    session: DbSession,
 ) -> IEventBus:
-    bus = getattr(request.app.state, "event_bus", None)
-    if not bus:
-        raise RuntimeError("Event bus not initialized")
-    return bus
+    # Events are written to the outbox in the request's transaction and
+    # relayed to Kafka by the outbox worker
+    return OutboxEventBus(session)
 
 
 EventBusDep = Annotated[IEventBus, Depends(get_IEventBus)]
@@ -65,6 +83,16 @@ def get_ICacheService(request: Request) -> ICacheService:
 CacheServiceDep = Annotated[ICacheService, Depends(get_ICacheService)]
 
 
+def get_ChargeSettingCache(request: Request) -> ChargeSettingCache:
+    charge_cache = getattr(request.app.state, "charge_setting_cache", None)
+    if not charge_cache:
+        raise RuntimeError("Charge setting cache not initialized")
+    return charge_cache
+
+
+ChargeSettingCacheDep = Annotated[ChargeSettingCache, Depends(get_ChargeSettingCache)]
+
+
 def get_IEventService(request: Request) -> IEventService:
     event_service = getattr(request.app.state, "event_service", None)
     if not event_service:
@@ -90,6 +118,44 @@ def get_payment_adapter(
 PaymentAdapterDep = Annotated[IPaymentAdapter, Depends(get_payment_adapter)]
 
 
+def get_pin_hasher(
+    request: Request,
+) -> IPinHasher:
+    pin_hasher = getattr(request.app.state, "pin_hasher", None)
+    if not pin_hasher:
+        raise RuntimeError("PIN hasher not initialized")
+    return pin_hasher
+
+
+PinHasherDep = Annotated[IPinHasher, Depends(get_pin_hasher)]
+
+
+def get_PaymentStatusNotifier(request: Request) -> PaymentStatusNotifier:
+    notifier = getattr(request.app.state, "payment_status", None)
+    if not notifier:
+        raise RuntimeError("Payment status notifier not initialized")
+    return notifier
+
+
+PaymentStatusNotifierDep = Annotated[
+    PaymentStatusNotifier,
+    Depends(get_PaymentStatusNotifier),
+]
+
+
+def get_WebhookIdempotencyFilter(request: Request) -> WebhookIdempotencyFilter:
+    webhook_filter = getattr(request.app.state, "webhook_filter", None)
+    if not webhook_filter:
+        raise RuntimeError("Webhook idempotency filter not initialized")
+    return webhook_filter
+
+
+WebhookIdempotencyFilterDep = Annotated[
+    WebhookIdempotencyFilter,
+    Depends(get_WebhookIdempotencyFilter),
+]
+
+
 def get_WalletRepoDep(session: DbSession) -> IWalletRepository:
     return SqlAlchemyWalletRepository(session)
 
@@ -108,8 +174,12 @@ TxnRepoDep = Annotated[ITransactionRepository, Depends(get_ITransactionRepositor
 
 def get_charge_setting_repository(
     session: DbSession,
+    charge_cache: ChargeSettingCacheDep,
 ) -> IChargeSettingRepository:
-    return SqlAlchemyChargeSettingRepository(session)
+    return CachedChargeSettingRepository(
+        SqlAlchemyChargeSettingRepository(session),
+        charge_cache,
+    )
 
 
 ChargeSettingRepoDep = Annotated[
@@ -120,8 +190,13 @@ ChargeSettingRepoDep = Annotated[
 
 def get_charge_setting_version_repository(
     session: DbSession,
+    charge_cache: ChargeSettingCacheDep,
 ) -> IChargeSettingVersionRepository:
-    return SqlAlchemyChargeSettingVersionRepository(session)
+    return CachedChargeSettingVersionRepository(
+        SqlAlchemyChargeSettingVersionRepository(session),
+        charge_cache,
+        session,
+    )
 
 
 ChargeSettingVersionRepoDep = Annotated[
@@ -203,6 +278,17 @@ ListUserTransactionUseCaseDep = Annotated[
 ]
 
 
+def get_ListTransactionUseCase(txn_repo: TxnRepoDep):
+    return ListTransactionUseCase(
+        txn_repo=txn_repo,
+    )
+
+
+ListTransactionUseCaseDep = Annotated[
+    ListTransactionUseCase, Depends(get_ListTransactionUseCase)
+]
+
+
 def get_GetBalanceUseCase(wallet_repo: WalletRepoDep):
     return GetBalanceUseCase(wallet_repo)
 
@@ -210,8 +296,20 @@ def get_GetBalanceUseCase(wallet_repo: WalletRepoDep):
 GetBalanceUseCaseDep = Annotated[GetBalanceUseCase, Depends(get_GetBalanceUseCase)]
 
 
-def get_SetTransactionPinUseCase(wallet_repo: WalletRepoDep):
-    return SetTransactionPinUseCase(wallet_repo)
+def get_GetWalletStatementUseCase(wallet_repo: WalletRepoDep):
+    return GetWalletStatementUseCase(wallet_repo)
+
+
+GetWalletStatementUseCaseDep = Annotated[
+    GetWalletStatementUseCase, Depends(get_GetWalletStatementUseCase)
+]
+
+
+def get_SetTransactionPinUseCase(
+    wallet_repo: WalletRepoDep,
+    pin_hasher: PinHasherDep,
+):
+    return SetTransactionPinUseCase(wallet_repo, pin_hasher)
 
 
 SetTransactionPinUseCaseDep = Annotated[
@@ -240,8 +338,11 @@ ListBanksUseCaseDep = Annotated[
 ]
 
 
-def get_SaveBankUseCase(wallet_repo: WalletRepoDep):
-    return SaveBankUseCase(wallet_repo)
+def get_SaveBankUseCase(
+    wallet_repo: WalletRepoDep,
+    pin_hasher: PinHasherDep,
+):
+    return SaveBankUseCase(wallet_repo, pin_hasher)
 
 
 SaveBankUseCaseDep = Annotated[SaveBankUseCase, Depends(get_SaveBankUseCase)]
@@ -301,3 +402,23 @@ UpdateTransactionStatusUseCaseDep = Annotated[
     UpdateTransactionStatusUseCase,
     Depends(get_UpdateTransactionStatusUseCase),
 ]
+
+
+def get_PaystackWebhookProcessor(
+    session: DbSession,
+    event_bus: EventBusDep,
+    verify_txn_uc: VerifyTicketPurchaseTransactionUseCaseDep,
+    payment_status: PaymentStatusNotifierDep,
+):
+    return PaystackWebhookProcessor(
+        event_bus=event_bus,
+        verify_txn_uc=verify_txn_uc,
+        payment_status=payment_status,
+        session=session,
+    )
+
+
+PaystackWebhookProcessorDep = Annotated[
+    PaystackWebhookProcessor,
+    Depends(get_PaystackWebhookProcessor),
+]
@@ -5,6 +5,9 @@ from app.application.dto.charge_request import (
     ChargeDto,
     GetChargeReqDto,
     GetChargeResDto,
+    GetBulkChargeReqDto,
+    GetBulkChargeResDto,
+    TicketChargeQuoteDto,
 )
 
 from app.interfaces.fastapi.context import UserContextDep, ProtectedDep
@@ -39,6 +42,35 @@ async def get_ticket_type_charge(
     )
 
 
+@router.post(
+    "/ticket-purchase/bulk",
+    response_model=GetBulkChargeResDto,
+)
+async def get_ticket_types_charges(
+    _: ProtectedDep,
+    context: UserContextDep,
+    use_case: RequestChargeUseCaseDep,
+    req: GetBulkChargeReqDto,
+):
+    quotes = await use_case.ticket_charges(
+        user_id=str(context.user_id),
+        occurrence_id=req.occurrence_id,
+        event_id=req.event_id,
+        items=req.items,
+    )
+
+    return GetBulkChargeResDto(
+        quotes=[
+            TicketChargeQuoteDto(
+                ticket_type_id=item.ticket_type_id,
+                charges=[ChargeDto.model_validate(c) for c in charges],
+                signature=sig,
+            )
+            for item, (charges, sig) in zip(req.items, quotes)
+        ]
+    )
+
+
 @router.get("/instant-withdrawal", response_model=Optional[ChargeDto])
 async def get_instant_withdrawal_charge(
     _: ProtectedDep,
@@ -1,4 +1,6 @@
-from fastapi import APIRouter
+import json
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
 from app.application.dto.checkout import (
     PublicCreateCheckoutReqDto,
     CreateCheckoutResDto,
@@ -7,17 +9,22 @@ from app.application.dto.checkout import (
     VerifyTicketPurchaseGateResDto,
     GateCreateCheckoutReqDto,
     GateCreateCheckoutResDto,
+    PaymentStatusResDto,
 )
 from app.application.dto.charge_request import (
     GetChargeResDto,
     ChargeDto,
     PublicGetChargeReqDto,
+    PublicGetBulkChargeReqDto,
+    GetBulkChargeResDto,
+    TicketChargeQuoteDto,
 )
 
 from app.interfaces.fastapi.di import (
     CreateCheckoutUseCaseDep,
     VerifyTicketPurchaseTransactionUseCaseDep,
     RequestChargeUseCaseDep,
+    PaymentStatusNotifierDep,
 )
 from app.config import settings
 
@@ -93,6 +100,59 @@ async def verify_ticket_purchase_gate(
     )
 
 
+@router.get(
+    "/checkout/payment-status/{reference}",
+    response_model=PaymentStatusResDto,
+    description=(
+        "Long-poll a payment's status. Returns as soon as it moves past `after`, "
+        "or with the current status once `wait` seconds pass"
+    ),
+)
+async def payment_status(
+    notifier: PaymentStatusNotifierDep,
+    reference: str,
+    after: str | None = Query(None),
+    wait: int = Query(25, ge=0, le=settings.payment_status_max_wait_seconds),
+):
+    status = await notifier.wait(reference, after=after, timeout=wait)
+
+    return PaymentStatusResDto(
+        reference=reference,
+        status=status,
+    )
+
+
+@router.get(
+    "/checkout/payment-status/{reference}/events",
+    description="Server-sent events with each change of a payment's status",
+)
+async def payment_status_events(
+    notifier: PaymentStatusNotifierDep,
+    reference: str,
+):
+    # Refuse before the stream starts, while an error status can still be sent
+    notifier.check_capacity()
+
+    async def events():
+        async for status in notifier.stream(
+            reference,
+            duration=settings.payment_status_stream_seconds,
+            heartbeat=settings.payment_status_heartbeat_seconds,
+        ):
+            if status is None:
+                yield ": keep-alive\n\n"
+                continue
+
+            data = json.dumps({"reference": reference, "status": status})
+            yield f"event: status\ndata: {data}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post(
     "/charges/ticket-purchase",
     response_model=GetChargeResDto,
@@ -115,3 +175,30 @@ async def get_ticket_type_charge(
         charges=[ChargeDto.model_validate(c) for c in charges],
         signature=sig,
     )
+
+
+@router.post(
+    "/charges/ticket-purchase/bulk",
+    response_model=GetBulkChargeResDto,
+)
+async def get_ticket_types_charges(
+    use_case: RequestChargeUseCaseDep,
+    req: PublicGetBulkChargeReqDto,
+):
+    quotes = await use_case.ticket_charges(
+        user_id=str(req.user_id),
+        occurrence_id=req.occurrence_id,
+        event_id=req.event_id,
+        items=req.items,
+    )
+
+    return GetBulkChargeResDto(
+        quotes=[
+            TicketChargeQuoteDto(
+                ticket_type_id=item.ticket_type_id,
+                charges=[ChargeDto.model_validate(c) for c in charges],
+                signature=sig,
+            )
+            for item, (charges, sig) in zip(req.items, quotes)
+        ]
+    )
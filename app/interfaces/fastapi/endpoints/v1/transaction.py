@@ -4,6 +4,7 @@ from uuid import UUID
 from app.application.dto.base import (
     PaginatedResponseDto,
     PaginatedReqDto,
+    CursorPaginatedResponseDto,
     BaseResponseDTO,
 )
 from app.domain.events import TransactionCreatedEvent
@@ -17,6 +18,7 @@ from app.application.dto import wallet
 from app.interfaces.fastapi.context import AdminUserContextDep
 from app.interfaces.fastapi.di import (
     TxnRepoDep,
+    ListTransactionUseCaseDep,
     UpdateTransactionStatusUseCaseDep,
     EventBusDep,
 )
@@ -26,6 +28,7 @@ from app.domain.entities.value_objects import (
     TransactionType,
 )
 from app.domain.dto import TransactionFilter
+from app.shared.enums import CountMode
 
 
 router = APIRouter(prefix="/v1/transactions", tags=["Transactions"])
@@ -108,6 +111,32 @@ async def get_transactions_admin(
     )
 
 
+@router.get(
+    "/admin/cursor",
+    response_model=CursorPaginatedResponseDto[TransactionListDto],
+)
+async def get_transactions_admin_cursor(
+    context: AdminUserContextDep,
+    use_case: ListTransactionUseCaseDep,
+    size: int = Query(20),
+    cursor: Optional[str] = Query(None),
+    count: CountMode = Query(CountMode.none),
+    status: Optional[TransactionSettlementStatus] = Query(None),
+    type: Optional[TransactionType] = Query(None),
+):
+    return await use_case.execute_after(
+        wallet.ListTransactionCursorReqDto(
+            cursor=cursor,
+            page_size=size,
+            count=count,
+            filter=TransactionFilter(
+                status=status,
+                type=type,
+            ),
+        )
+    )
+
+
 @router.get(
     "/admin/{transaction_id}",
     response_model=TransactionDetailsDto,
@@ -2,10 +2,14 @@ from fastapi import APIRouter, Query
 from uuid import UUID
 from app.domain.dto import PersonalAccountWithSignature
 from app.application.dto.base import BaseResponseDTO
+from app.shared.enums import CountMode
 from app.application.dto.wallet import (
     ListUserTransactionRequestDto,
     ListUserTransactionResponseDto,
+    ListUserTransactionCursorReqDto,
+    ListUserTransactionCursorResponseDto,
     BalanceDto,
+    WalletStatementResponseDto,
     UpdateTransactionPinRequestDto,
     SaveBankReqDto,
 )
@@ -14,6 +18,7 @@ from app.application.mappers.wallet import wallet_to_dto
 from ...di import (
     ListUserTransactionUseCaseDep,
     GetBalanceUseCaseDep,
+    GetWalletStatementUseCaseDep,
     SetTransactionPinUseCaseDep,
     ResolvePersonalAccountUseCaseDep,
     ListBanksUseCaseDep,
@@ -34,6 +39,17 @@ async def get_wallet_balance(
     return wallet_to_dto(wallet)
 
 
+@router.get("/statement", response_model=WalletStatementResponseDto)
+async def get_wallet_statement(
+    context: UserContextDep,
+    use_case: GetWalletStatementUseCaseDep,
+    page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+):
+    result = await use_case.execute(context.user_id, page_size, cursor)
+    return WalletStatementResponseDto(**result.model_dump())
+
+
 @router.get("/transactions", response_model=ListUserTransactionResponseDto)
 async def get_transactions(
     context: UserContextDep,
@@ -65,6 +81,41 @@ async def get_transactions(
     return ListUserTransactionResponseDto(**result.model_dump())
 
 
+@router.get(
+    "/transactions/cursor",
+    response_model=ListUserTransactionCursorResponseDto,
+)
+async def get_transactions_cursor(
+    context: UserContextDep,
+    use_case: ListUserTransactionUseCaseDep,
+    page_size: int = Query(20),
+    cursor: str | None = Query(None),
+    count: CountMode = Query(CountMode.none),
+    ticket_ids: str | None = Query(None),
+    occurrence: UUID | None = Query(None),
+    event: UUID | None = Query(None),
+):
+    uuids: list[UUID] = []
+    if ticket_ids:
+        parts = ticket_ids.split(",")
+        for part in parts:
+            uuids.append(UUID(part))
+
+    req = ListUserTransactionCursorReqDto(
+        cursor=cursor,
+        page_size=page_size,
+        count=count,
+        user_id=context.user_id,
+        ticket_ids=uuids,
+        event=event,
+        occurrence=occurrence,
+    )
+
+    result = await use_case.by_user_after(req)
+
+    return ListUserTransactionCursorResponseDto(**result.model_dump())
+
+
 @router.post(
     "/update-transaction-pin",
     response_model=BaseResponseDTO,
@@ -4,3 +4,9 @@ from enum import Enum
 class SortOrder(str, Enum):
     asc = "asc"
     desc = "desc"
+
+
+class CountMode(str, Enum):
+    none = "none"
+    exact = "exact"
+    estimate = "estimate"
@@ -0,0 +1,95 @@
+import threading
+from typing import Any
+
+
+class LatencyMetric:
+    """
+    Count, total and maximum of observed durations in seconds. Safe to
+    observe from worker threads.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self._count += 1
+            self._total += seconds
+            self._max = max(self._max, seconds)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            count, total, max_ = self._count, self._total, self._max
+
+        return {
+            "count": count,
+            "total_seconds": round(total, 6),
+            "avg_seconds": round(total / count, 6) if count else 0.0,
+            "max_seconds": round(max_, 6),
+        }
+
+
+class GaugeMetric:
+    """
+    A value that goes up and down, such as open connections, along with the
+    highest it has reached. Safe to update from worker threads.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self._value = 0
+        self._max = 0
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self._value += amount
+            self._max = max(self._max, self._value)
+
+    def dec(self, amount: int = 1) -> None:
+        with self._lock:
+            self._value -= amount
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {"value": self._value, "max": self._max}
+
+
+_metrics: dict[str, LatencyMetric | GaugeMetric] = {}
+_metrics_lock = threading.Lock()
+
+
+def latency_metric(name: str) -> LatencyMetric:
+    """Get or register the process-wide latency metric called name"""
+    with _metrics_lock:
+        metric = _metrics.get(name)
+        if metric is None:
+            metric = _metrics[name] = LatencyMetric(name)
+        if not isinstance(metric, LatencyMetric):
+            raise TypeError(f"Metric {name} is not a latency metric")
+        return metric
+
+
+def gauge_metric(name: str) -> GaugeMetric:
+    """Get or register the process-wide gauge called name"""
+    with _metrics_lock:
+        metric = _metrics.get(name)
+        if metric is None:
+            metric = _metrics[name] = GaugeMetric(name)
+        if not isinstance(metric, GaugeMetric):
+            raise TypeError(f"Metric {name} is not a gauge")
+        return metric
+
+
+def metrics_snapshot() -> dict[str, dict[str, Any]]:
+    with _metrics_lock:
+        metrics = list(_metrics.values())
+    return {m.name: m.snapshot() for m in metrics}
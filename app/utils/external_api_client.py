@@ -1,20 +1,291 @@
+import time
+import asyncio
 import logging
+import importlib.util
+from typing import Optional
 import httpx
 
+from app.config import HttpClientSettings
 from app.shared.errors import InternalAppError
+from app.shared.metrics import gauge_metric, latency_metric
+from .retry import RetryBudget, backoff_delay
 
 logger = logging.getLogger(__name__)
 
+# httpcore trace events that mean the request got a connection from the pool
+_CONNECTION_ACQUIRED = (
+    "connection.connect_tcp.started",
+    "http11.send_request_headers.started",
+    "http2.send_request_headers.started",
+)
+
+# Methods that can be sent twice without doing the work twice
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Answers that mean the downstream is struggling, not that the call is wrong
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
 
 class ExternalAPIClient:
-    def __init__(self, base_url: str, headers: dict | None = None):
+    """
+    JSON client for one downstream service over a shared, tuned connection
+    pool. Pool limits, keep-alive and timeouts come from the downstream's
+    settings; a call may override the timeouts through `timeout`.
+
+    Idempotent calls that fail on the network or with a 429/502/503/504
+    are retried with jittered exponential backoff, within a retry budget
+    shared by the client so an outage is not made worse by retries. Reads
+    asked to hedge send a second copy when the first is slower than
+    hedge_delay_ms and take whichever answers first.
+
+    Metrics are registered under http.<name>: requests in flight, time spent
+    waiting for a pooled connection, request time, new connections opened,
+    pool timeouts, retries, calls the budget refused to retry, hedges sent
+    and hedges that answered first.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: dict | None = None,
+        config: HttpClientSettings | None = None,
+        name: str = "default",
+    ):
+        config = config or HttpClientSettings()
+
         self.base_url = base_url
         self.headers = headers or {}
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.default_timeout = httpx.Timeout(
+            connect=config.connect_timeout_seconds,
+            read=config.read_timeout_seconds,
+            write=config.write_timeout_seconds,
+            pool=config.pool_timeout_seconds,
+        )
+
+        http2 = config.http2
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 needs the h2 package, using HTTP/1.1 for %s", name)
+            http2 = False
+
+        self.client = httpx.AsyncClient(
+            timeout=self.default_timeout,
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry_seconds,
+            ),
+            http2=http2,
+        )
+
+        self._max_attempts = max(1, config.retry_max_attempts)
+        self._retry_base_delay = config.retry_base_delay_ms / 1000
+        self._retry_max_delay = config.retry_max_delay_ms / 1000
+        self._retry_budget = RetryBudget(
+            ratio=config.retry_budget_ratio,
+            min_tokens=config.retry_budget_min_tokens,
+        )
+        self._hedge_delay = (
+            config.hedge_delay_ms / 1000 if config.hedge_delay_ms is not None else None
+        )
+
+        self._in_flight = gauge_metric(f"http.{name}.in_flight")
+        self._connections_opened = gauge_metric(f"http.{name}.connections_opened")
+        self._pool_timeouts = gauge_metric(f"http.{name}.pool_timeouts")
+        self._pool_wait = latency_metric(f"http.{name}.pool_wait")
+        self._request_time = latency_metric(f"http.{name}.request_time")
+        self._retries = gauge_metric(f"http.{name}.retries")
+        self._budget_exhausted = gauge_metric(f"http.{name}.retry_budget_exhausted")
+        self._hedges = gauge_metric(f"http.{name}.hedges")
+        self._hedge_wins = gauge_metric(f"http.{name}.hedge_wins")
+
+    def timeout(
+        self,
+        connect: float | None = None,
+        read: float | None = None,
+        write: float | None = None,
+        pool: float | None = None,
+    ) -> httpx.Timeout:
+        """The client's timeouts with the given ones replaced"""
+        default = self.default_timeout
+        return httpx.Timeout(
+            connect=default.connect if connect is None else connect,
+            read=default.read if read is None else read,
+            write=default.write if write is None else write,
+            pool=default.pool if pool is None else pool,
+        )
 
     def _get_url(self, endpoint: str) -> str:
         return f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
 
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        headers: dict | None = None,
+        timeout: httpx.Timeout | None = None,
+        **kwargs,
+    ) -> httpx.Response:
+        started = time.perf_counter()
+        acquired: float | None = None
+
+        async def trace(event_name: str, info: dict) -> None:
+            nonlocal acquired
+            if acquired is None and event_name in _CONNECTION_ACQUIRED:
+                acquired = time.perf_counter()
+                self._pool_wait.observe(acquired - started)
+            if event_name == "connection.connect_tcp.complete":
+                self._connections_opened.inc()
+
+        self._in_flight.inc()
+        try:
+            return await self.client.request(
+                method,
+                self._get_url(endpoint),
+                headers={**self.headers, **(headers or {})},
+                timeout=timeout or self.default_timeout,
+                extensions={"trace": trace},
+                **kwargs,
+            )
+        except httpx.PoolTimeout:
+            self._pool_timeouts.inc()
+            logger.error("Connection pool exhausted calling %s %s", method, endpoint)
+            raise
+        finally:
+            self._in_flight.dec()
+            self._request_time.observe(time.perf_counter() - started)
+
+    def _retry_delay(
+        self,
+        attempt: int,
+        response: Optional[httpx.Response],
+        error: Optional[Exception],
+        idempotent: bool,
+    ) -> Optional[float]:
+        """How long to wait before trying again, or None to give up"""
+        if attempt >= self._max_attempts:
+            return None
+
+        if error is not None:
+            if isinstance(error, httpx.PoolTimeout):
+                # Our own pool is saturated; another request only adds to it
+                return None
+            # Nothing reached the downstream, so even a POST is safe to resend
+            sent = not isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout))
+            if sent and not idempotent:
+                return None
+        elif (
+            response is None
+            or response.status_code not in RETRYABLE_STATUS_CODES
+            or not idempotent
+        ):
+            return None
+
+        delay = backoff_delay(attempt, self._retry_base_delay, self._retry_max_delay)
+
+        retry_after = response.headers.get("Retry-After") if response else None
+        if retry_after is not None and retry_after.isdigit():
+            if int(retry_after) > self._retry_max_delay:
+                return None
+            delay = max(delay, int(retry_after))
+
+        return delay
+
+    async def _hedged(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Send the request, and a second copy if the first has not answered
+        within the hedge delay. The first usable answer wins and the other
+        copy is cancelled.
+        """
+        first = asyncio.ensure_future(self._request(method, endpoint, **kwargs))
+
+        done, _ = await asyncio.wait({first}, timeout=self._hedge_delay)
+        if done or not self._retry_budget.withdraw():
+            return await first
+
+        self._hedges.inc()
+        second = asyncio.ensure_future(self._request(method, endpoint, **kwargs))
+
+        pending = {first, second}
+        try:
+            while True:
+                done, pending = await asyncio.wait(
+                    pending,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    usable = (
+                        task.exception() is None
+                        and task.result().status_code not in RETRYABLE_STATUS_CODES
+                    )
+                    # A failed copy only counts once the other has failed too
+                    if usable or not pending:
+                        if task is second and usable:
+                            self._hedge_wins.inc()
+                        return await task
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        idempotent: Optional[bool] = None,
+        hedge: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """_request under the retry policy, hedged if asked and configured"""
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        hedge = hedge and idempotent and self._hedge_delay is not None
+
+        self._retry_budget.deposit()
+
+        attempt = 0
+        while True:
+            attempt += 1
+            response: Optional[httpx.Response] = None
+            error: Optional[httpx.TransportError] = None
+
+            try:
+                if hedge:
+                    response = await self._hedged(method, endpoint, **kwargs)
+                else:
+                    response = await self._request(method, endpoint, **kwargs)
+            except httpx.TransportError as e:
+                error = e
+
+            delay = self._retry_delay(attempt, response, error, idempotent)
+            if delay is None:
+                break
+
+            if not self._retry_budget.withdraw():
+                self._budget_exhausted.inc()
+                logger.warning(
+                    "Retry budget spent, not retrying %s %s", method, endpoint
+                )
+                break
+
+            self._retries.inc()
+            logger.warning(
+                "Retrying %s %s in %.2fs (attempt %d): %s",
+                method,
+                endpoint,
+                delay,
+                attempt,
+                error or response.status_code,
+            )
+            await asyncio.sleep(delay)
+
+        if error is not None:
+            raise error
+        return response
+
     async def _handle_response(self, response: httpx.Response):
         try:
             response.raise_for_status()
@@ -53,13 +324,16 @@ class ExternalAPIClient:
         endpoint: str,
         params: dict | None = None,
         headers: dict | None = None,
+        timeout: httpx.Timeout | None = None,
+        hedge: bool = False,
     ):
-        url = self._get_url(endpoint)
-        merged_headers = {**self.headers, **(headers or {})}
-        response = await self.client.get(
-            url,
+        response = await self._send(
+            "GET",
+            endpoint,
+            hedge=hedge,
+            headers=headers,
+            timeout=timeout,
             params=params,
-            headers=merged_headers,
         )
         return await self._handle_response(response)
 
@@ -68,13 +342,16 @@ class ExternalAPIClient:
         endpoint: str,
         data: dict | None = None,
         headers: dict | None = None,
+        timeout: httpx.Timeout | None = None,
+        idempotent: bool = False,
     ):
-        url = self._get_url(endpoint)
-        merged_headers = {**self.headers, **(headers or {})}
-        response = await self.client.post(
-            url,
+        response = await self._send(
+            "POST",
+            endpoint,
+            idempotent=idempotent,
+            headers=headers,
+            timeout=timeout,
             json=data,
-            headers=merged_headers,
         )
         return await self._handle_response(response)
 
@@ -83,13 +360,14 @@ class ExternalAPIClient:
         endpoint: str,
         data: dict | None = None,
         headers: dict | None = None,
+        timeout: httpx.Timeout | None = None,
     ):
-        url = self._get_url(endpoint)
-        merged_headers = {**self.headers, **(headers or {})}
-        response = await self.client.put(
-            url,
+        response = await self._send(
+            "PUT",
+            endpoint,
+            headers=headers,
+            timeout=timeout,
             json=data,
-            headers=merged_headers,
         )
         return await self._handle_response(response)
 
@@ -98,13 +376,14 @@ class ExternalAPIClient:
         endpoint: str,
         params: dict | None = None,
         headers: dict | None = None,
+        timeout: httpx.Timeout | None = None,
     ):
-        url = self._get_url(endpoint)
-        merged_headers = {**self.headers, **(headers or {})}
-        response = await self.client.delete(
-            url,
+        response = await self._send(
+            "DELETE",
+            endpoint,
+            headers=headers,
+            timeout=timeout,
             params=params,
-            headers=merged_headers,
         )
         return await self._handle_response(response)
 
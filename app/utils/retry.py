@@ -0,0 +1,41 @@
+import random
+import threading
+
+
+class RetryBudget:
+    """
+    Caps retries, and hedged requests, to a fraction of the calls made.
+
+    Every call deposits `ratio` of a token and every retry spends a whole
+    one, so while a downstream is failing the extra load stays near `ratio`
+    of normal traffic instead of multiplying it. `min_tokens` is the balance
+    it starts with, so a client that has made few calls can still retry the
+    odd failure. Safe to use from worker threads.
+    """
+
+    def __init__(self, ratio: float = 0.1, min_tokens: float = 10) -> None:
+        self._ratio = ratio
+        # Enough headroom for a burst of retries after a quiet spell
+        self._max_tokens = max(min_tokens, ratio * 1000)
+        self._tokens = float(min_tokens)
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self._max_tokens, self._tokens + self._ratio)
+
+    def withdraw(self) -> bool:
+        """Spend a token, or say the budget is used up"""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """
+    Full-jitter exponential backoff: a random wait up to base * 2**attempt,
+    capped, so clients that failed together do not retry together.
+    """
+    return random.uniform(0, min(cap, base * 2**attempt))